@@ -4,36 +4,94 @@ Algorithm: Backtracking
 Author: Auto-generated
 
 Q1   Q2   Q3   Q4   Q5   Q6   Q7   Q8
+
+    python 8q.py 10        a 10 x 10 board; 1000000 needs Local search
 """
 
+import os
+import random
+import sys
+from array import array
 import tkinter as tk
 from tkinter import messagebox
 import time
 
-BOARD_SIZE = 8
-CELL_SIZE = 60
-DELAY = 0.3  # seconds delay for visualization
+import queens
+import queens_local
+import queens_store
+from tk_worker import BackgroundWorker
+
+# python 8q.py 10 for a 10 x 10 board
+BOARD_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+MAX_VIEW = 32             # rows and columns drawn at once; bigger boards show a window
+VIEW = min(BOARD_SIZE, MAX_VIEW)
+CELL_SIZE = max(12, 480 // VIEW)
+REPLAY_SPEED = 5          # trace events per second, changed with the slider
+MAX_REPLAY_SPEED = 5000
+FRAME_MS = 16             # replay ticks are never closer together than this
+MAX_EVENTS = 1_000_000    # longest trace recorded (4 bytes per event)
+MAX_SOLVE = 1000          # tracing MAX_EVENTS takes ~0.7 s here, ~2 s at N = 10,000
+MAX_COUNT = 16            # counting N = 16 takes about a minute, each N above ~7x longer
+MAX_BROWSE = 14           # biggest store Browse builds: 5 MB in ~15 s (N = 15: 34 MB, ~2 min)
 
 class EightQueensApp:
     def __init__(self, root):
         self.root = root
-        root.title("DAA: 8-Queens Problem")
-        self.canvas = tk.Canvas(root, width=BOARD_SIZE*CELL_SIZE, height=BOARD_SIZE*CELL_SIZE)
+        root.title(f"DAA: {BOARD_SIZE}-Queens Problem")
+        self.canvas = tk.Canvas(root, width=VIEW*CELL_SIZE, height=VIEW*CELL_SIZE)
         self.canvas.pack()
 
-        self.board = [[0]*BOARD_SIZE for _ in range(BOARD_SIZE)]
-        self.rects = [[None]*BOARD_SIZE for _ in range(BOARD_SIZE)]
+        self.rects = [[None]*VIEW for _ in range(VIEW)]
         self.draw_board()
+        self.top = self.left = 0  # board cell at the canvas's top-left corner
+
+        # the recorded search and how far the replay has got
+        self.events = array("i")
+        self.pos = 0
+        self.truncated = False          # the trace stopped at MAX_EVENTS, before the search ended
+        self.board = [None]*BOARD_SIZE  # column of the queen on each row, as replayed
+        self.queen_items = {}           # (row, col) -> the oval drawn there
+        self.job = None
+        self.paused = False
+        self.found = 0        # solutions the replay has passed
+        self.store = None     # queens_store.SolutionStore, opened by Browse
+        self.browser = None   # iterator over it: (index, columns)
+        self.worker = BackgroundWorker(threads=1)
+        self.worker.attach(root)
 
-        self.btn_start = tk.Button(root, text="Solve 8-Queens", command=self.start_solver)
+        self.btn_start = tk.Button(root, text=f"Solve {BOARD_SIZE}-Queens", command=self.start_solver)
         self.btn_start.pack(pady=10)
+        if BOARD_SIZE > MAX_SOLVE:
+            self.btn_start.config(state="disabled")
 
-        self.solutions = []
+        controls = tk.Frame(root)
+        controls.pack()
+        self.btn_pause = tk.Button(controls, text="Pause", width=7, command=self.toggle_pause)
+        self.btn_pause.pack(side="left", padx=2)
+        tk.Button(controls, text="Step", command=self.step).pack(side="left", padx=2)
+        tk.Button(controls, text="Next solution", command=self.next_solution).pack(side="left", padx=2)
+        self.btn_browse = tk.Button(controls, text="Browse", command=self.browse_next)
+        self.btn_browse.pack(side="left", padx=2)
+        if BOARD_SIZE > MAX_BROWSE and not os.path.exists(queens_store.default_path(BOARD_SIZE)):
+            self.btn_browse.config(state="disabled")
+        self.btn_count = tk.Button(controls, text="Count all solutions", command=self.count_solutions)
+        self.btn_count.pack(side="left", padx=2)
+        if BOARD_SIZE > MAX_COUNT:
+            self.btn_count.config(state="disabled")
+        tk.Button(controls, text="Local search", command=self.start_local_search).pack(side="left", padx=2)
+        if BOARD_SIZE > VIEW:
+            tk.Button(controls, text="Move window", command=self.move_window).pack(side="left", padx=2)
+        self.speed = tk.Scale(root, from_=1, to=MAX_REPLAY_SPEED, orient="horizontal",
+                              label="Steps/s", length=300, command=lambda _: self.schedule())
+        self.speed.set(REPLAY_SPEED)
+        self.speed.pack()
+        self.status = tk.Label(root, text="")
+        self.status.pack(pady=(0, 10))
 
     def draw_board(self):
         colors = ["#f0d9b5", "#b58863"]
-        for i in range(BOARD_SIZE):
-            for j in range(BOARD_SIZE):
+        for i in range(VIEW):
+            for j in range(VIEW):
                 x1 = j*CELL_SIZE
                 y1 = i*CELL_SIZE
                 x2 = x1 + CELL_SIZE
@@ -42,69 +100,256 @@ class EightQueensApp:
                 self.rects[i][j] = rect
 
     def place_queen(self, row, col):
-        x = col*CELL_SIZE + CELL_SIZE//2
-        y = row*CELL_SIZE + CELL_SIZE//2
+        x = (col-self.left)*CELL_SIZE + CELL_SIZE//2
+        y = (row-self.top)*CELL_SIZE + CELL_SIZE//2
         r = CELL_SIZE//3
-        self.canvas.create_oval(x-r, y-r, x+r, y+r, fill="Black", tags="queen")
-        self.root.update()
-        time.sleep(DELAY)
+        self.queen_items[row, col] = self.canvas.create_oval(x-r, y-r, x+r, y+r, fill="Black", tags="queen")
 
     def remove_queen(self, row, col):
-        # remove last queen drawn
-        items = self.canvas.find_withtag("queen")
-        if items:
-            self.canvas.delete(items[-1])
-        self.root.update()
-        time.sleep(DELAY/2)
-
-    def is_safe(self, row, col):
-        # check column
-        for i in range(row):
-            if self.board[i][col] == 1:
-                return False
-        # check upper-left diagonal
-        i, j = row-1, col-1
-        while i>=0 and j>=0:
-            if self.board[i][j]==1:
-                return False
-            i-=1
-            j-=1
-        # check upper-right diagonal
-        i, j = row-1, col+1
-        while i>=0 and j<BOARD_SIZE:
-            if self.board[i][j]==1:
-                return False
-            i-=1
-            j+=1
-        return True
-
-    def solve_queens(self, row=0):
-        if row == BOARD_SIZE:
-            solution = [r[:] for r in self.board]
-            self.solutions.append(solution)
-            return True  # return True to find first solution
-
-        for col in range(BOARD_SIZE):
-            if self.is_safe(row, col):
-                self.board[row][col] = 1
-                self.place_queen(row, col)
-                if self.solve_queens(row+1):
-                    return True  # comment this line to find all solutions
-                self.board[row][col] = 0
-                self.remove_queen(row, col)
+        item = self.queen_items.pop((row, col), None)
+        if item is not None:
+            self.canvas.delete(item)
+
+    # --- Replay ---
+    # queens.trace() records the whole search up front on the worker; the
+    # replay then applies it at the slider's speed from root.after
+    def apply(self, event):
+        """Apply one trace event to self.board; True if it completes a solution."""
+        if event < 0:
+            row, _ = divmod(~event, BOARD_SIZE)
+            self.board[row] = None
+            return False
+        row, col = divmod(event, BOARD_SIZE)
+        self.board[row] = col
+        if row == BOARD_SIZE - 1:
+            self.found += 1
+            return True
         return False
 
+    def redraw(self):
+        # a tick may apply many events; only the queens that differ from the
+        # canvas get drawn or deleted, and only rows inside the window count
+        for (row, col) in list(self.queen_items):
+            if self.board[row] != col or not self.left <= col < self.left + VIEW:
+                self.remove_queen(row, col)
+        for row in range(self.top, self.top + VIEW):
+            col = self.board[row]
+            if col is not None and self.left <= col < self.left + VIEW and (row, col) not in self.queen_items:
+                self.place_queen(row, col)
+        done = ""
+        if self.pos >= len(self.events):
+            done = " (trace cut off here)" if self.truncated else " (done)"
+        self.status.config(text=f"step {self.pos:,} of {len(self.events):,}, "
+                                f"{self.found:,} solutions shown" + done)
+
+    def window_text(self):
+        if BOARD_SIZE == VIEW:
+            return ""
+        return (f" rows {self.top:,}-{self.top + VIEW - 1:,}, "
+                f"columns {self.left:,}-{self.left + VIEW - 1:,} of {BOARD_SIZE:,}")
+
+    def move_window(self):
+        # center the window on a random row's queen (or the left edge if it has none)
+        row = random.randrange(BOARD_SIZE)
+        col = self.board[row]
+        self.top = min(max(0, row - VIEW//2), BOARD_SIZE - VIEW)
+        self.left = min(max(0, (col or 0) - VIEW//2), BOARD_SIZE - VIEW)
+        for cell in list(self.queen_items):
+            self.remove_queen(*cell)
+        self.redraw()
+        self.status.config(text=f"showing{self.window_text()}")
+
+    def timing(self):
+        """(ms until the next tick, events to apply in it) for the current speed."""
+        speed = self.speed.get()
+        interval = max(FRAME_MS, round(1000 / speed))
+        return interval, max(1, round(speed * interval / 1000))
+
+    def schedule(self):
+        self.cancel()
+        if not self.paused and self.pos < len(self.events):
+            self.job = self.root.after(self.timing()[0], self.tick)
+
+    def cancel(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    def tick(self):
+        self.job = None
+        if self.paused:
+            return
+        for _ in range(self.timing()[1]):
+            if self.pos >= len(self.events):
+                break
+            self.pos += 1
+            self.apply(self.events[self.pos - 1])
+        self.redraw()
+        if self.pos < len(self.events):
+            self.schedule()
+        else:
+            self.finished()
+
+    def finished(self):
+        if self.truncated:
+            messagebox.showinfo("Trace cut off", f"The trace stopped after {MAX_EVENTS:,} steps, before the "
+                                                 f"search ended; {self.found:,} solutions found up to there.")
+        elif self.found:
+            messagebox.showinfo("Solved", f"{BOARD_SIZE}-Queens solution found! Total solutions found: {self.found}")
+        else:
+            messagebox.showinfo("No solution", "No solution exists.")
+
+    def set_paused(self, paused):
+        self.paused = paused
+        self.btn_pause.config(text="Resume" if paused else "Pause")
+        self.schedule()
+
+    def toggle_pause(self):
+        self.set_paused(not self.paused)
+
+    def step(self):
+        self.set_paused(True)
+        if self.pos < len(self.events):
+            self.pos += 1
+            self.apply(self.events[self.pos - 1])
+            self.redraw()
+
+    def next_solution(self):
+        self.set_paused(True)
+        while self.pos < len(self.events):
+            self.pos += 1
+            if self.apply(self.events[self.pos - 1]):
+                break
+        self.redraw()
+
     def start_solver(self):
+        self.cancel()
         self.canvas.delete("queen")
-        self.board = [[0]*BOARD_SIZE for _ in range(BOARD_SIZE)]
-        self.solutions = []
-        solved = self.solve_queens()
-        if solved:
-            messagebox.showinfo("Solved", f"8-Queens solution found! Total solutions stored: {len(self.solutions)}")
-        else:
+        self.queen_items.clear()
+        self.board = [None]*BOARD_SIZE
+        self.top = self.left = 0  # the search starts in the top-left corner
+        self.found = 0
+        self.events = array("i")
+        self.pos = 0
+        self.truncated = False
+        self.status.config(text=f"recording the {BOARD_SIZE}-Queens search...")
+        self.worker.submit(self.record, key="trace", on_done=self.play, on_error=self.record_failed)
+
+    def record(self):
+        # runs on the worker thread; one event past MAX_EVENTS tells a
+        # trace that was cut off from one that ended just there
+        started = time.perf_counter()
+        events = queens.trace(BOARD_SIZE, max_events=MAX_EVENTS + 1)
+        return events, len(events) > MAX_EVENTS, time.perf_counter() - started
+
+    def play(self, result):
+        self.events, self.truncated, seconds = result
+        self.pos = 0
+        self.redraw()
+        self.status.config(text=f"recorded {len(self.events):,} steps in {seconds:.2f}s"
+                                + (f", cut off at {MAX_EVENTS:,}" if self.truncated else ""))
+        self.set_paused(False)
+
+    def record_failed(self, error):
+        self.status.config(text=f"recording failed: {error}")
+
+    def browse_next(self):
+        if self.store is None:
+            path = queens_store.default_path(BOARD_SIZE)
+            if not os.path.exists(path):
+                # Browse comes back here once the worker has written the file
+                self.btn_browse.config(state="disabled")
+                self.status.config(text=f"building the {BOARD_SIZE}-Queens solution store...")
+                self.worker.submit(queens_store.build, BOARD_SIZE, path, key="store",
+                                   on_done=self.store_built, on_error=self.store_failed)
+                return
+            try:
+                self.store = queens_store.SolutionStore(path)
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Browse", f"Can't open the solution store: {e}")
+                return
+        if not len(self.store):
+            messagebox.showinfo("No solution", "No solution exists.")
+            return
+        found = next(self.browser, None) if self.browser is not None else None
+        if found is None:  # first use, or past the last one: start over
+            self.browser = enumerate(self.store)
+            found = next(self.browser)
+        k, cols = found
+        # browsing takes over the board, so the replay ends here
+        self.events = array("i")
+        self.pos = 0
+        self.truncated = False
+        self.set_paused(True)
+        self.board = list(cols)
+        self.redraw()
+        self.status.config(text=f"stored solution {k + 1:,} of {len(self.store):,}")
+
+    def store_built(self, count):
+        self.btn_browse.config(state="normal")
+        self.browse_next()
+
+    def store_failed(self, error):
+        self.btn_browse.config(state="normal")
+        self.status.config(text="")
+        messagebox.showerror("Browse", f"Can't build the solution store: {error}")
+
+    def start_local_search(self):
+        self.status.config(text=f"local search on {BOARD_SIZE:,} x {BOARD_SIZE:,}...")
+        self.worker.submit(self.local_search, key="local", on_done=self.show_local_search,
+                           on_error=self.local_search_failed)
+
+    def local_search(self):
+        # runs on the worker thread, so it only computes
+        started = time.perf_counter()
+        cols = queens_local.solve(BOARD_SIZE)
+        seconds = time.perf_counter() - started
+        return cols, seconds, cols is not None and queens_local.verify(cols)
+
+    def show_local_search(self, result):
+        cols, seconds, verified = result
+        if cols is None:
+            self.status.config(text="")
             messagebox.showinfo("No solution", "No solution exists.")
+            return
+        # the solution takes over the board, so the replay ends here
+        self.events = array("i")
+        self.pos = 0
+        self.truncated = False
+        self.set_paused(True)
+        self.board = cols
+        self.move_window()
+        self.status.config(text=f"local search: {'verified' if verified else 'INVALID'} solution "
+                                f"in {seconds:.2f}s;" + self.window_text())
+
+    def local_search_failed(self, error):
+        self.status.config(text=f"local search failed: {error}")
+
+    def quit(self):
+        self.cancel()
+        self.worker.shutdown()
+        self.root.destroy()
+
+    def count_solutions(self):
+        self.status.config(text=f"counting {BOARD_SIZE}-Queens solutions...")
+        self.worker.submit(self.count, key="count", on_done=self.show_count, on_error=self.count_failed)
+
+    def count(self):
+        # the bitmask engine on the worker thread, without drawing or storing anything
+        started = time.perf_counter()
+        total = queens.count(BOARD_SIZE)
+        return total, time.perf_counter() - started
+
+    def show_count(self, result):
+        total, seconds = result
+        self.status.config(text=f"{total:,} solutions")
+        messagebox.showinfo("Count", f"{BOARD_SIZE}-Queens has {total:,} solutions (counted in {seconds:.2f}s).")
+
+    def count_failed(self, error):
+        self.status.config(text=f"counting failed: {error}")
 
 if __name__ == '__main__':
     root = tk.Tk()
     app = EightQueensApp(root)
+    root.protocol("WM_DELETE_WINDOW", app.quit)
     root.mainloop()
\ No newline at end of file
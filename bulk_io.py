@@ -0,0 +1,275 @@
+"""
+Streaming bulk import / export for the student database.
+
+Files are read one record at a time through generators and written in
+batches with executemany, one transaction per batch, so memory use does not
+grow with the size of the file. CSV files need a header row with the table's
+column names; JSONL files hold one object per line with the same keys.
+
+    python bulk_io.py import students roster.csv
+    python bulk_io.py import enrollments enroll.jsonl --batch-size 20000 --rejects bad.jsonl
+    python bulk_io.py export enrollments enroll.csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from operator import itemgetter
+
+from student_db import DB_PATH, MAX_PARAMS, StudentDB, add_stats, untracked
+
+BATCH_SIZE = 10000
+SAMPLE_REJECTS = 20  # how many rejected rows an ImportReport keeps in memory
+
+# table name -> (db table, columns in order, integer columns)
+TABLES = {
+    "students": ("Students", ("StudentID", "Name", "Age", "Gender", "Email"), {"StudentID", "Age"}),
+    "courses": ("Courses", ("CourseID", "CourseName", "Duration"), {"CourseID", "Duration"}),
+    "enrollments": ("Enrollments", ("EnrollmentID", "StudentID", "CourseID", "Grade"),
+                    {"EnrollmentID", "StudentID", "CourseID"}),
+}
+
+# column -> table it must exist in
+FOREIGN_KEYS = {
+    "enrollments": {"StudentID": "Students", "CourseID": "Courses"},
+}
+
+
+class ImportReport:
+    def __init__(self):
+        self.inserted = 0
+        self.rejected = 0
+        self.samples = []  # first SAMPLE_REJECTS (line, reason, record)
+        self.seconds = 0.0
+
+    def reject(self, line, reason, record):
+        self.rejected += 1
+        if len(self.samples) < SAMPLE_REJECTS:
+            self.samples.append((line, reason, record))
+
+    def __str__(self):
+        rate = self.inserted / self.seconds if self.seconds else 0
+        return (f"inserted {self.inserted}, rejected {self.rejected} "
+                f"in {self.seconds:.2f}s ({rate:,.0f} rows/s)")
+
+
+# -------------------------------
+# READING
+# -------------------------------
+def file_format(path):
+    if path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path.endswith(".csv"):
+        return "csv"
+    raise ValueError(f"can't tell the format of {path!r}; use .csv or .jsonl")
+
+
+def read_records(path, fmt=None):
+    """Yield (line number, dict) for every record in a CSV or JSONL file.
+
+    An empty CSV field is read as None: it is how export_file writes NULL.
+    """
+    fmt = fmt or file_format(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, {col: None if value == "" else value for col, value in record.items()}
+        else:
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield line_no, json.loads(line)
+                    except ValueError as e:
+                        yield line_no, e
+
+
+def batches(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _converter(columns, int_columns):
+    """Build a function record -> (row tuple, None) or (None, reason)."""
+    getter = itemgetter(*columns)
+    int_indexes = [i for i, col in enumerate(columns) if col in int_columns]
+
+    def convert(record):
+        if isinstance(record, Exception):
+            return None, f"bad JSON: {record}"
+        try:
+            row = list(getter(record))
+        except KeyError as e:
+            return None, f"missing column {e}"
+        except TypeError:
+            return None, "record is not an object"
+        if row[0] is None:
+            return None, f"{columns[0]} is required"
+        for i in int_indexes:
+            if row[i] is None:
+                continue  # NULL stays NULL
+            try:
+                row[i] = int(row[i])
+            except (TypeError, ValueError):
+                return None, f"{columns[i]} must be an integer, got {row[i]!r}"
+        return tuple(row), None
+
+    return convert
+
+
+def _existing(conn, table, column, values):
+    found = set()
+    values = list(values)
+    for i in range(0, len(values), MAX_PARAMS):
+        chunk = values[i:i + MAX_PARAMS]
+        sql = f"SELECT {column} FROM {table} WHERE {column} IN ({','.join('?' * len(chunk))})"
+        found.update(v for (v,) in conn.execute(sql, chunk))
+    return found
+
+
+# -------------------------------
+# IMPORT
+# -------------------------------
+def import_records(db, name, records, batch_size=BATCH_SIZE, on_reject=None):
+    """Insert (line, record) pairs into table `name`, returning an ImportReport.
+
+    Each batch is checked against the database before it is written: rows
+    whose primary key already exists (or repeats within the file) and rows
+    whose foreign keys point at missing students/courses are rejected, the
+    rest go in with one executemany inside one transaction. Since the keys
+    are checked inside that same transaction, SQLite's own per-row FK check
+    and the per-row ChangeLog/statistics triggers are skipped. `on_reject` is called
+    with (line, reason, record) for every rejected row.
+    """
+    table, columns, int_columns = TABLES[name]
+    convert = _converter(columns, int_columns)
+    key = columns[0]
+    fks = FOREIGN_KEYS.get(name, {})
+    insert = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    report = ImportReport()
+    started = time.perf_counter()
+
+    def reject(line, reason, record):
+        report.reject(line, reason, record)
+        if on_reject:
+            on_reject(line, reason, record)
+
+    for batch in batches(records, batch_size):
+        converted = []
+        for line, record in batch:
+            row, reason = convert(record)
+            if reason:
+                reject(line, reason, record)
+            else:
+                converted.append((line, row, record))
+
+        with db.pool.write(foreign_keys=False) as conn:
+            taken = _existing(conn, table, key, {row[0] for _, row, _ in converted})
+            present = {}
+            for col, parent in fks.items():
+                i = columns.index(col)
+                present[i] = (col, parent, _existing(conn, parent, col, {row[i] for _, row, _ in converted}))
+            good = []
+            for line, row, record in converted:
+                if row[0] in taken:
+                    reject(line, f"duplicate {key} {row[0]}", record)
+                    continue
+                missing = [f"{col} {row[i]} not in {parent}"
+                           for i, (col, parent, ids) in present.items() if row[i] not in ids]
+                if missing:
+                    reject(line, "; ".join(missing), record)
+                    continue
+                taken.add(row[0])
+                good.append(row)
+            if good:
+                with untracked(conn, table):
+                    conn.executemany(insert, good)
+                    if table == "Enrollments":
+                        add_stats(conn, (row[1:] for row in good))
+        report.inserted += len(good)
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def import_file(db, name, path, batch_size=BATCH_SIZE, on_reject=None, fmt=None):
+    return import_records(db, name, read_records(path, fmt), batch_size, on_reject)
+
+
+# -------------------------------
+# EXPORT
+# -------------------------------
+def export_file(db, name, path, fmt=None):
+    """Stream table `name` to a CSV or JSONL file; returns the row count.
+
+    Enrollments are written with their raw StudentID/CourseID so the file
+    can be imported again.
+    """
+    table, columns, _ = TABLES[name]
+    fmt = fmt or file_format(path)
+    sql = f"SELECT {', '.join(columns)} FROM {table} ORDER BY {columns[0]}"
+    count = 0
+    with db.pool.read() as conn, open(path, "w", newline="", encoding="utf-8") as f:
+        rows = conn.execute(sql)
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in rows:
+                f.write(json.dumps(dict(zip(columns, row))))
+                f.write("\n")
+                count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import/export for students.db")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import")
+    imp.add_argument("table", choices=TABLES)
+    imp.add_argument("path")
+    imp.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    imp.add_argument("--rejects", help="write rejected rows to this JSONL file")
+    exp = sub.add_parser("export")
+    exp.add_argument("table", choices=TABLES)
+    exp.add_argument("path")
+    args = parser.parse_args(argv)
+
+    with StudentDB(args.db) as db:
+        if args.command == "export":
+            started = time.perf_counter()
+            count = export_file(db, args.table, args.path)
+            print(f"exported {count} rows in {time.perf_counter() - started:.2f}s")
+            return 0
+
+        rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+        try:
+            on_reject = None
+            if rejects:
+                def on_reject(line, reason, record):
+                    rejects.write(json.dumps({"line": line, "reason": reason, "record": record}, default=str))
+                    rejects.write("\n")
+            report = import_file(db, args.table, args.path, args.batch_size, on_reject)
+        finally:
+            if rejects:
+                rejects.close()
+        print(report)
+        for line, reason, _ in report.samples:
+            print(f"  line {line}: {reason}")
+        return 1 if report.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
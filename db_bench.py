@@ -0,0 +1,233 @@
+"""
+Benchmark for the student database.
+
+Fills a fresh database with deterministic synthetic data and times the
+operations the GUI performs, then prints a JSON report (throughput,
+p50/p99 latency, peak RSS) that can be saved and compared between runs.
+
+    python db_bench.py --students 100000 --courses 500 --enrollments 1000000 --out run.json
+    python db_bench.py --students 100000 --enrollments 1000000 --compare run.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from bulk_io import import_records
+from student_db import StudentDB
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PAGE_SIZE = 200  # rows per Treeview page, as in plsqlmini_db.py
+GRADES = ("A", "B", "C", "D", "F", None)
+FIRST = ("Asha", "Ben", "Chen", "Dana", "Eli", "Farah", "Gita", "Hugo", "Ines", "Jon",
+         "Kiran", "Lena", "Maya", "Nico", "Omar", "Priya", "Quinn", "Ravi", "Sara", "Tom")
+LAST = ("Rao", "Smith", "Khan", "Lopez", "Ito", "Novak", "Okafor", "Singh", "Weber", "Young")
+SUBJECTS = ("Math", "Physics", "Chemistry", "Biology", "History", "Art", "Music", "Databases",
+            "Algorithms", "Networks")
+
+
+# -------------------------------
+# SYNTHETIC DATA
+# -------------------------------
+def generate_students(n, seed):
+    rng = random.Random(seed)
+    for i in range(1, n + 1):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        yield i, {"StudentID": i, "Name": f"{first} {last}", "Age": rng.randint(17, 40),
+                  "Gender": rng.choice("MF"), "Email": f"{first.lower()}.{last.lower()}{i}@example.edu"}
+
+
+def generate_courses(n, seed):
+    rng = random.Random(seed + 1)
+    for i in range(1, n + 1):
+        yield i, {"CourseID": i, "CourseName": f"{rng.choice(SUBJECTS)} {100 + i}",
+                  "Duration": rng.randint(1, 12)}
+
+
+def generate_enrollments(n, students, courses, seed):
+    rng = random.Random(seed + 2)
+    for i in range(1, n + 1):
+        yield i, {"EnrollmentID": i, "StudentID": rng.randint(1, students),
+                  "CourseID": rng.randint(1, courses), "Grade": rng.choice(GRADES)}
+
+
+def populate(db, students, courses, enrollments, seed):
+    timings = {}
+    for name, records in (("students", generate_students(students, seed)),
+                          ("courses", generate_courses(courses, seed)),
+                          ("enrollments", generate_enrollments(enrollments, students, courses, seed))):
+        report = import_records(db, name, records)
+        timings[name] = {"rows": report.inserted, "seconds": round(report.seconds, 3),
+                         "rows_per_sec": round(report.inserted / report.seconds, 1) if report.seconds else None}
+    return timings
+
+
+# -------------------------------
+# MEASUREMENT
+# -------------------------------
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def measure(fn, args_list):
+    """Call fn(*args) for each args tuple; returns latency/throughput stats."""
+    latencies = []
+    rows = 0
+    for args in args_list:
+        started = time.perf_counter()
+        result = fn(*args)
+        latencies.append(time.perf_counter() - started)
+        if isinstance(result, list):
+            rows += len(result)
+    total = sum(latencies)
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "seconds": round(total, 4),
+        "ops_per_sec": round(len(latencies) / total, 1) if total else None,
+        "rows": rows,
+        "rows_per_sec": round(rows / total, 1) if total and rows else None,
+        # None when the operation was never called (--inserts 0, --repeat 0)
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p99_ms": ms(percentile(latencies, 99)),
+    }
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run(args):
+    rng = random.Random(args.seed + 3)
+    scratch = tempfile.mkdtemp(prefix="db_bench_", dir=args.dir)
+    path = os.path.join(scratch, "bench.db")
+    db = StudentDB(path)
+    try:
+        report = {
+            "sizes": {"students": args.students, "courses": args.courses, "enrollments": args.enrollments},
+            "seed": args.seed,
+            "environment": {"python": platform.python_version(), "sqlite": sqlite3.sqlite_version,
+                            "platform": platform.platform()},
+            "populate": populate(db, args.students, args.courses, args.enrollments, args.seed),
+        }
+
+        next_id = args.students + 1
+        inserts = [(next_id + i, f"Bench Student {i}", 20, "F", f"bench{i}@example.edu")
+                   for i in range(args.inserts)]
+        student_ids = [(rng.randint(1, args.students),) for _ in range(args.repeat * 10)]
+        page_keys = [(rng.randint(0, args.students), PAGE_SIZE) for _ in range(args.repeat * 10)]
+        enroll_keys = [(rng.randint(0, max(args.enrollments, 1)), PAGE_SIZE)
+                       for _ in range(args.repeat * 10)]
+        terms = [(rng.choice(FIRST)[:rng.randint(2, 4)].lower(),) for _ in range(args.repeat * 10)]
+        grades = [(rng.choice(GRADES[:-1]),) for _ in range(args.repeat)]
+
+        ops = {
+            # one transaction per row, as add_student does it
+            "add_student": (db.students.add, inserts),
+            "get_student": (db.students.get, student_ids),
+            "fetch_students_page": (db.students.page_after, page_keys),
+            "fetch_enrollments_page": (db.enrollments.page_after, enroll_keys),
+            "search_students": (db.students.search, terms),
+            "search_enrollments_grade": (db.enrollments.search, grades),
+            "course_report": (db.stats.course_report, [()] * args.repeat),
+        }
+        if not args.skip_full:
+            # full-table reads, as fetch_students / fetch_enrollments used to do them
+            ops["fetch_students_full"] = (db.students.all, [()] * args.repeat)
+            ops["fetch_courses_full"] = (db.courses.all, [()] * args.repeat)
+            ops["fetch_enrollments_join_full"] = (db.enrollments.all, [()] * args.repeat)
+
+        report["operations"] = {name: measure(fn, calls) for name, (fn, calls) in ops.items()}
+        report["peak_rss_mb"] = peak_rss_mb()
+        if args.keep:
+            report["database"] = path
+        return report
+    finally:
+        db.close()
+        if not args.keep:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+
+def compare(report, baseline, threshold):
+    """Print per-operation p50 ratios against a baseline; returns regressions."""
+    regressions = []
+    for name, stats in report["operations"].items():
+        old = baseline.get("operations", {}).get(name)
+        if not old or not old["p50_ms"] or stats["p50_ms"] is None:
+            continue
+        ratio = stats["p50_ms"] / old["p50_ms"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:30} p50 {old['p50_ms']:>10.3f} -> {stats['p50_ms']:>10.3f} ms  x{ratio:.2f}{flag}",
+              file=sys.stderr)
+    return regressions
+
+
+def at_least(minimum):
+    """argparse type for an int no smaller than minimum."""
+    def parse(text):
+        value = int(text)
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {value}")
+        return value
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the student database")
+    parser.add_argument("--students", type=at_least(1), default=10000)
+    parser.add_argument("--courses", type=at_least(1), default=200)
+    parser.add_argument("--enrollments", type=at_least(0), default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--inserts", type=at_least(0), default=200, help="single-row inserts to time")
+    parser.add_argument("--repeat", type=at_least(0), default=5, help="repetitions of the heavy queries")
+    parser.add_argument("--skip-full", action="store_true", help="skip full-table fetches (huge sizes)")
+    parser.add_argument("--dir", help="where to create the scratch database")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch database")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="p50 slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
-import time
-import threading
-from collections import deque
+
+from ht_maze import ALGORITHMS
+from ht_paths import available_engines
+from ht_sim import Race
 
 # ----------------------------
 # Treasure Hunt Game (Player vs BFS)
@@ -11,6 +11,12 @@ from collections import deque
 
 ROWS, COLS = 15, 15
 CELL_SIZE = 30
+DEFAULT_ENGINE = "field"  # or any name in ht_paths.ENGINES
+MAZE_ALGORITHM = "random"  # or any name in ht_maze.ALGORITHMS
+WALL_DENSITY = 0.35        # for the "random" algorithm
+AI_SPEED = 7               # AI steps per second, changed with the slider
+MAX_AI_SPEED = 500
+FRAME_MS = 16              # AI ticks are never closer together than this
 
 root = tk.Tk()
 root.title("💎 Treasure Hunt Race — You vs BFS")
@@ -19,93 +25,171 @@ root.resizable(False, False)
 canvas = tk.Canvas(root, width=COLS * CELL_SIZE, height=ROWS * CELL_SIZE, bg="white")
 canvas.pack()
 
-# Maze generation
-maze = [[random.choice([0, 1]) for _ in range(COLS)] for _ in range(ROWS)]
-maze[0][0] = 0
-
-# Random treasure
-treasure = (random.randint(0, ROWS - 1), random.randint(0, COLS - 1))
-while treasure == (0, 0) or maze[treasure[0]][treasure[1]] == 1:
-    treasure = (random.randint(0, ROWS - 1), random.randint(0, COLS - 1))
+# Maze, treasure, AI position and path (ht_sim.Race); ht_maze guarantees a
+# way from (0, 0) to the treasure. The distance field the AI and hints read
+# their next step from lives in the race too, so new_game() throws it away.
+race = Race.generate(ROWS, COLS, MAZE_ALGORITHM, density=WALL_DENSITY)
 
-# Player and AI positions
 player_pos = [0, 0]
-ai_pos = [0, 0]
-ai_path = []
 ai_running = False
-
-# Draw maze and entities
-def draw():
+ai_paused = False
+ai_job = None    # pending root.after id of the next AI tick
+hint_cell = None
+
+# Drawing
+# Every cell's rectangle is created once; after that draw() only recolors
+# the cells whose state changed since the last frame.
+WALL, FLOOR = "black", "white"
+PLAYER, AI, TREASURE, PATH, HINT = "orange", "#00b4d8", "#e63946", "#90e0ef", "#ffd166"
+
+cell_items = []      # canvas rectangle id of every cell, [r][c]
+shown_colors = {}    # (r, c) -> color currently on the canvas
+ai_path_cells = set()
+dirty = set()        # cells to repaint on the next draw()
+drawn_player = drawn_ai = None
+
+def build_board():
     canvas.delete("all")
+    cell_items.clear()
+    shown_colors.clear()
     for r in range(ROWS):
+        row = []
         for c in range(COLS):
             x1, y1 = c * CELL_SIZE, r * CELL_SIZE
             x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
-            color = "black" if maze[r][c] == 1 else "white"
-            if (r, c) == tuple(player_pos):
-                color = "orange"  # player
-            elif (r, c) == tuple(ai_pos):
-                color = "#00b4d8"  # AI
-            elif (r, c) == treasure:
-                color = "#e63946"  # treasure
-            elif (r, c) in ai_path:
-                color = "#90e0ef"  # AI path
-            canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
-
-# Neighbors
-def get_neighbors(r, c):
-    for dr, dc in [(1,0), (-1,0), (0,1), (0,-1)]:
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < ROWS and 0 <= nc < COLS and maze[nr][nc] == 0:
-            yield nr, nc
-
-# BFS algorithm
-def bfs_path(start, goal):
-    queue = deque([start])
-    parent = {start: None}
-    while queue:
-        r, c = queue.popleft()
-        if (r, c) == goal:
-            path = []
-            while (r, c) is not None:
-                path.append((r, c))
-                r, c = parent[(r, c)]
-            return path[::-1]
-        for nr, nc in get_neighbors(r, c):
-            if (nr, nc) not in parent:
-                parent[(nr, nc)] = (r, c)
-                queue.append((nr, nc))
-    return []
-
-# AI BFS movement
-def ai_move():
-    global ai_running, ai_path, ai_pos
+            row.append(canvas.create_rectangle(x1, y1, x2, y2, fill=FLOOR, outline="gray"))
+        cell_items.append(row)
+
+def repaint_all():
+    # after the maze itself changed
+    global drawn_player, drawn_ai
+    dirty.update((r, c) for r in range(ROWS) for c in range(COLS))
+    drawn_player = drawn_ai = None
+    draw()
+
+def cell_color(r, c):
+    if (r, c) == drawn_player:
+        return PLAYER
+    if (r, c) == drawn_ai:
+        return AI
+    if (r, c) == race.treasure:
+        return TREASURE
+    if (r, c) == hint_cell:
+        return HINT
+    if (r, c) in ai_path_cells:
+        return PATH
+    return WALL if race.maze[r][c] == 1 else FLOOR
+
+def show_ai_path(path):
+    new_cells = set(path)
+    dirty.update(ai_path_cells ^ new_cells)
+    ai_path_cells.clear()
+    ai_path_cells.update(new_cells)
+
+def draw():
+    global drawn_player, drawn_ai
+    player, ai = tuple(player_pos), race.ai_pos
+    dirty.update((drawn_player, drawn_ai, player, ai))
+    dirty.discard(None)
+    drawn_player, drawn_ai = player, ai
+    for r, c in dirty:
+        color = cell_color(r, c)
+        if shown_colors.get((r, c)) != color:
+            canvas.itemconfig(cell_items[r][c], fill=color)
+            shown_colors[(r, c)] = color
+    dirty.clear()
+
+def set_hint(cell):
+    global hint_cell
+    dirty.update((hint_cell, cell))
+    dirty.discard(None)
+    hint_cell = cell
+
+def show_hint():
+    step = race.distance_field().next_step(tuple(player_pos))
+    if step is None and tuple(player_pos) != race.treasure:
+        status.config(text="No way to the treasure from here.")
+    set_hint(step)
+    draw()
+
+def check_reachable():
+    f = race.distance_field()
+    if f.reachable((0, 0)):
+        status.config(text=f"Treasure is {f.distance((0, 0))} steps away "
+                           f"(distance field built in {f.seconds * 1000:.1f} ms).")
+    else:
+        status.config(text="The treasure can't be reached from the start. Press New Game.")
+
+# AI movement
+# The AI runs as a step machine on the Tk event loop: each tick moves it one
+# or more cells along race.ai_path and schedules the next tick with root.after.
+# At high speeds several steps share one tick, so the canvas is redrawn at
+# most once per frame.
+def ai_timing():
+    """(ms until the next tick, steps to take in it) for the current speed."""
+    speed = ai_speed.get()
+    interval = max(FRAME_MS, round(1000 / speed))
+    return interval, max(1, round(speed * interval / 1000))
+
+# Path search lives in ht_paths.py; the engine is picked in the menu below.
+# "field" walks the cached distance field instead of searching.
+def start_ai():
+    global ai_running
     ai_running = True
-    ai_path = bfs_path(tuple(ai_pos), treasure)
-    for pos in ai_path[1:]:
-        if not ai_running:
-            return
-        ai_pos[0], ai_pos[1] = pos
-        draw()
-        root.update()
-        time.sleep(0.15)
-        if tuple(ai_pos) == treasure:
+    stats = race.plan(engine.get())
+    if stats.engine != "field":
+        status.config(text=str(stats))
+    show_ai_path(race.ai_path)
+    schedule_ai()
+
+def schedule_ai():
+    global ai_job
+    cancel_ai()
+    if ai_running and not ai_paused:
+        ai_job = root.after(ai_timing()[0], ai_tick)
+
+def cancel_ai():
+    global ai_job
+    if ai_job is not None:
+        root.after_cancel(ai_job)
+        ai_job = None
+
+def ai_tick():
+    global ai_job
+    ai_job = None
+    if not ai_running or ai_paused:
+        return
+    for _ in range(ai_timing()[1]):
+        if not race.step_ai():
+            break
+        if race.ai_won:
+            draw()
+            stop_game()
             messagebox.showinfo("😢 You Lost!", "BFS found the treasure first!")
-            ai_running = False
             return
+    draw()
+    if race.ai_step < len(race.ai_path):
+        schedule_ai()
+
+def toggle_pause():
+    global ai_paused
+    ai_paused = not ai_paused
+    pause_button.config(text="Resume" if ai_paused else "Pause")
+    schedule_ai()
 
 # Player movement
 def move_player(dr, dc):
     if ai_running is False:
-        threading.Thread(target=ai_move, daemon=True).start()
+        start_ai()
 
     nr, nc = player_pos[0] + dr, player_pos[1] + dc
-    if 0 <= nr < ROWS and 0 <= nc < COLS and maze[nr][nc] == 0:
+    if 0 <= nr < ROWS and 0 <= nc < COLS and race.maze[nr][nc] == 0:
         player_pos[0], player_pos[1] = nr, nc
+    set_hint(None)
     draw()
 
     # Check win
-    if tuple(player_pos) == treasure:
+    if tuple(player_pos) == race.treasure:
         messagebox.showinfo("🏆 You Win!", "You found the treasure before BFS!")
         stop_game()
 
@@ -113,32 +197,46 @@ def move_player(dr, dc):
 def stop_game():
     global ai_running
     ai_running = False
+    cancel_ai()
 
 # Regenerate maze
 def new_game():
-    global maze, treasure, player_pos, ai_pos, ai_path, ai_running
-    maze = [[random.choice([0, 1]) for _ in range(COLS)] for _ in range(ROWS)]
-    maze[0][0] = 0
-    treasure = (random.randint(0, ROWS - 1), random.randint(0, COLS - 1))
-    while treasure == (0, 0) or maze[treasure[0]][treasure[1]] == 1:
-        treasure = (random.randint(0, ROWS - 1), random.randint(0, COLS - 1))
+    global race, player_pos
+    stop_game()
+    race = Race.generate(ROWS, COLS, maze_style.get(), density=WALL_DENSITY)
     player_pos = [0, 0]
-    ai_pos = [0, 0]
-    ai_path = []
-    ai_running = False
-    draw()
+    show_ai_path([])
+    set_hint(None)
+    repaint_all()
+    check_reachable()
 
 # Key bindings
 root.bind("<Up>", lambda e: move_player(-1, 0))
 root.bind("<Down>", lambda e: move_player(1, 0))
 root.bind("<Left>", lambda e: move_player(0, -1))
 root.bind("<Right>", lambda e: move_player(0, 1))
+root.bind("h", lambda e: show_hint())
+root.bind("p", lambda e: toggle_pause())
 
 # Buttons
 frame = tk.Frame(root)
 frame.pack(pady=5)
 tk.Button(frame, text="New Game", command=new_game, width=15, bg="#2a9d8f").grid(row=0, column=0, padx=5)
 tk.Button(frame, text="Quit", command=root.destroy, width=15, bg="#e63946").grid(row=0, column=1, padx=5)
-
-draw()
+engine = tk.StringVar(value=DEFAULT_ENGINE)
+tk.OptionMenu(frame, engine, "field", *available_engines()).grid(row=0, column=2, padx=5)
+maze_style = tk.StringVar(value=MAZE_ALGORITHM)
+tk.OptionMenu(frame, maze_style, *ALGORITHMS).grid(row=0, column=3, padx=5)
+pause_button = tk.Button(frame, text="Pause", command=toggle_pause, width=8)
+pause_button.grid(row=0, column=4, padx=5)
+ai_speed = tk.Scale(frame, from_=1, to=MAX_AI_SPEED, orient="horizontal", label="AI steps/s",
+                    command=lambda _: schedule_ai())
+ai_speed.set(AI_SPEED)
+ai_speed.grid(row=1, column=0, columnspan=5, sticky="we")
+status = tk.Label(root, text="", anchor="w")
+status.pack(fill="x", padx=5)
+
+build_board()
+repaint_all()
+check_reachable()
 root.mainloop()
@@ -0,0 +1,226 @@
+"""
+Solvable maze generators for the treasure hunt grid (ht.py).
+
+Every generator takes a seed, runs in linear time and returns (maze,
+treasure), with (0, 0) open and the treasure reachable from it.
+
+    python ht_maze.py [size] [--algorithm random] [--density 0.4] [--seed 1]
+"""
+
+import random
+from array import array
+
+DEFAULT_DENSITY = 0.35
+
+
+# ----------------------------
+# Union-find
+# ----------------------------
+def find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]  # path halving
+        i = parent[i]
+    return i
+
+def union(parent, a, b):
+    """Join the sets of a and b; False if they were already one set."""
+    a, b = find(parent, a), find(parent, b)
+    if a == b:
+        return False
+    parent[b] = a
+    return True
+
+
+# ----------------------------
+# Helpers
+# ----------------------------
+def neighbors(i, rows, cols):
+    """Flat indexes of the cells beside flat index i."""
+    r, c = divmod(i, cols)
+    if r:
+        yield i - cols
+    if r + 1 < rows:
+        yield i + cols
+    if c:
+        yield i - 1
+    if c + 1 < cols:
+        yield i + 1
+
+def to_rows(cells, rows, cols):
+    return [list(cells[r * cols:(r + 1) * cols]) for r in range(rows)]
+
+def pick_treasure(cells, cols, rng, allowed=None):
+    """A random open cell other than (0, 0); allowed(i) can narrow the choice."""
+    choices = [i for i in range(1, len(cells)) if not cells[i] and (allowed is None or allowed(i))]
+    if not choices:
+        raise ValueError("the maze has no open cell besides the start")
+    return divmod(rng.choice(choices), cols)
+
+def open_edges(cells, rows, cols):
+    """Dead ends from the rooms into a spare last row / column (even sizes)."""
+    if rows % 2 == 0:
+        for c in range(0, cols, 2):
+            cells[(rows - 1) * cols + c] = 0
+    if cols % 2 == 0:
+        for r in range(0, rows, 2):
+            cells[r * cols + cols - 1] = 0
+
+def check_size(rows, cols):
+    if rows < 1 or cols < 1 or rows * cols < 2:
+        raise ValueError(f"a {rows}x{cols} board has no room for a treasure")
+
+
+# ----------------------------
+# Perfect mazes
+# ----------------------------
+# Cells with even row and column are rooms and the cells between them walls;
+# on an even-sized board the spare last row or column gets one-cell dead ends.
+def kruskal_maze(rows, cols, seed=None, density=None):
+    check_size(rows, cols)
+    rng = random.Random(seed)
+    cells = bytearray(b"\x01") * (rows * cols)
+    room_rows, room_cols = (rows + 1) // 2, (cols + 1) // 2
+    # edges as (wall cell, room a, room b), rooms numbered row-major
+    edges = []
+    for rr in range(room_rows):
+        for rc in range(room_cols):
+            room = rr * room_cols + rc
+            cells[2 * rr * cols + 2 * rc] = 0
+            if rc + 1 < room_cols:
+                edges.append((2 * rr * cols + 2 * rc + 1, room, room + 1))
+            if rr + 1 < room_rows:
+                edges.append(((2 * rr + 1) * cols + 2 * rc, room, room + room_cols))
+    rng.shuffle(edges)
+    parent = array("i", range(room_rows * room_cols))
+    for wall, a, b in edges:
+        if union(parent, a, b):
+            cells[wall] = 0
+    open_edges(cells, rows, cols)
+    return to_rows(cells, rows, cols), pick_treasure(cells, cols, rng)
+
+def dfs_maze(rows, cols, seed=None, density=None):
+    check_size(rows, cols)
+    rng = random.Random(seed)
+    cells = bytearray(b"\x01") * (rows * cols)
+    cells[0] = 0
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(nr, nc) for nr, nc in ((r + 2, c), (r - 2, c), (r, c + 2), (r, c - 2))
+                   if 0 <= nr < rows and 0 <= nc < cols and cells[nr * cols + nc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        cells[(r + nr) // 2 * cols + (c + nc) // 2] = 0
+        cells[nr * cols + nc] = 0
+        stack.append((nr, nc))
+    open_edges(cells, rows, cols)
+    return to_rows(cells, rows, cols), pick_treasure(cells, cols, rng)
+
+
+# ----------------------------
+# Random walls with repair
+# ----------------------------
+def random_maze(rows, cols, seed=None, density=DEFAULT_DENSITY):
+    """Walls at the given density, then three linear repair passes:
+
+    1. union-find labels the open regions;
+    2. every wall with open cells of two different regions beside it is
+       knocked out, which joins most regions at the usual densities;
+    3. if (0, 0) still isn't in the largest region, an L-shaped corridor is
+       carved from it to a cell of that region.
+
+    The treasure is then drawn from the region holding (0, 0).
+    """
+    check_size(rows, cols)
+    rng = random.Random(seed)
+    n = rows * cols
+    rand = rng.random
+    cells = bytearray(1 if rand() < density else 0 for _ in range(n))
+    cells[0] = 0
+    parent = array("i", range(n))
+
+    for i in range(n):
+        if not cells[i]:
+            if (i + 1) % cols and not cells[i + 1]:
+                union(parent, i, i + 1)
+            if i + cols < n and not cells[i + cols]:
+                union(parent, i, i + cols)
+
+    for i in range(n):
+        if cells[i]:
+            around = [j for j in neighbors(i, rows, cols) if not cells[j]]
+            if len({find(parent, j) for j in around}) > 1:
+                cells[i] = 0
+                for j in around:
+                    union(parent, i, j)
+
+    sizes = {}
+    for i in range(n):
+        if not cells[i]:
+            root = find(parent, i)
+            sizes[root] = sizes.get(root, 0) + 1
+    largest = max(sizes, key=sizes.get)
+    if find(parent, 0) != largest:
+        target = rng.choice([i for i in range(1, n) if not cells[i] and find(parent, i) == largest])
+    elif sizes[largest] == 1:  # every open cell is on its own
+        target = rng.randrange(1, n)
+    else:
+        target = None
+    if target is not None:
+        tr, tc = divmod(target, cols)
+        corridor = list(range(tc + 1)) + [r * cols + tc for r in range(1, tr + 1)]
+        for i in corridor:
+            cells[i] = 0
+        for i in corridor:
+            for j in neighbors(i, rows, cols):
+                if not cells[j]:
+                    union(parent, i, j)
+
+    start = find(parent, 0)
+    treasure = pick_treasure(cells, cols, rng, lambda i: find(parent, i) == start)
+    return to_rows(cells, rows, cols), treasure
+
+
+# ----------------------------
+# Registry
+# ----------------------------
+ALGORITHMS = {
+    "kruskal": kruskal_maze,
+    "dfs": dfs_maze,
+    "random": random_maze,
+}
+
+def generate(rows, cols, algorithm="random", seed=None, density=DEFAULT_DENSITY):
+    """(maze, treasure) from one of ALGORITHMS; density only affects "random"."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown maze algorithm {algorithm!r}, choose from {', '.join(ALGORITHMS)}")
+    return ALGORITHMS[algorithm](rows, cols, seed=seed, density=density)
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Time the maze generators.")
+    parser.add_argument("size", type=int, nargs="?", default=1000, help="time a size x size board")
+    parser.add_argument("--algorithm", choices=list(ALGORITHMS), help="default: all of them")
+    parser.add_argument("--density", type=float, default=DEFAULT_DENSITY)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    for name in [args.algorithm] if args.algorithm else ALGORITHMS:
+        started = time.perf_counter()
+        maze, treasure = generate(args.size, args.size, name, args.seed, args.density)
+        seconds = time.perf_counter() - started
+        walls = sum(map(sum, maze))
+        print(f"{args.size}x{args.size} {name}: {seconds:.2f}s, "
+              f"{walls / args.size ** 2:.0%} walls, treasure at {treasure}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""
+Path search engines for the treasure hunt grid (ht.py).
+
+Every engine takes (maze, start, goal, stats=None), the maze as a list of
+lists or NumPy uint8 array of 0 (open) and 1 (wall) cells, and returns the
+cells from start to goal, or [] if the goal can't be reached.
+
+    python ht_paths.py [size] [--density D] [--engines astar,jps]
+"""
+
+import heapq
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # the list-based search still works
+    np = None
+
+# Neighbor order matters: it decides which of several shortest paths BFS returns
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+class SearchStats:
+    def __init__(self, engine=""):
+        self.engine = engine
+        self.expanded = 0       # cells (or jump points) taken off the frontier
+        self.peak_frontier = 0  # most cells waiting on the frontier at once
+        self.seconds = 0.0
+        self.path_length = 0
+
+    def saw_frontier(self, size):
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def __str__(self):
+        return (f"{self.engine}: {self.expanded:,} expanded, peak frontier "
+                f"{self.peak_frontier:,}, {self.seconds * 1000:.1f} ms")
+
+
+# ----------------------------
+# Cell-at-a-time BFS
+# ----------------------------
+def get_neighbors(maze, r, c):
+    rows, cols = len(maze), len(maze[0])
+    for dr, dc in DIRECTIONS:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0:
+            yield nr, nc
+
+def bfs_path(maze, start, goal, stats=None):
+    if stats is None:
+        stats = SearchStats()
+    queue = deque([start])
+    parent = {start: None}
+    while queue:
+        stats.saw_frontier(len(queue))
+        stats.expanded += 1
+        r, c = queue.popleft()
+        if (r, c) == goal:
+            path = []
+            node = goal
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            return path[::-1]
+        for nr, nc in get_neighbors(maze, r, c):
+            if (nr, nc) not in parent:
+                parent[(nr, nc)] = (r, c)
+                queue.append((nr, nc))
+    return []
+
+
+# ----------------------------
+# Frontier BFS (NumPy)
+# ----------------------------
+UNSEEN = 2 ** 31 - 1  # predecessor markers in frontier_bfs_path
+WALL = -2
+
+def to_grid(maze):
+    """The maze as a NumPy uint8 array (no copy if it already is one)."""
+    if np is None:
+        raise RuntimeError("frontier BFS needs NumPy (pip install numpy)")
+    return np.asarray(maze, dtype=np.uint8)
+
+def frontier_bfs_path(maze, start, goal, stats=None):
+    """Same result as bfs_path, one whole BFS level per step.
+
+    The grid is padded with a ring of walls so neighbor lookups never need
+    bounds checks, and cells are addressed by flat index. A single int32
+    array holds each cell's predecessor, or UNSEEN / WALL. Each level's
+    frontier is kept in the order the deque in bfs_path would hold it:
+    candidates are generated as (frontier position, direction) pairs in
+    row-major order, and a cell reached from several frontier cells keeps
+    the first one as its predecessor.
+    """
+    if stats is None:
+        stats = SearchStats()
+    grid = to_grid(maze)
+    rows, cols = grid.shape
+    width = cols + 2
+    pred = np.full((rows + 2, width), WALL, dtype=np.int32)
+    pred[1:-1, 1:-1][grid == 0] = UNSEEN
+    pred = pred.ravel()
+    # intp indexes avoid a conversion on every gather/scatter below
+    offsets = np.array([width * dr + dc for dr, dc in DIRECTIONS], dtype=np.intp)
+    positions = np.arange(len(offsets) * (rows + cols + 2), dtype=np.int32)
+
+    start_i = (start[0] + 1) * width + start[1] + 1
+    goal_i = (goal[0] + 1) * width + goal[1] + 1
+    pred[start_i] = -1
+    frontier = np.array([start_i], dtype=np.intp)
+
+    while frontier.size and pred[goal_i] == UNSEEN:
+        stats.saw_frontier(frontier.size)
+        stats.expanded += frontier.size
+        candidates = (frontier[:, None] + offsets).ravel()
+        slots = np.flatnonzero(pred[candidates] == UNSEEN)
+        candidates = candidates[slots]
+        if candidates.size > positions.size:
+            positions = np.arange(candidates.size, dtype=np.int32)
+        # a cell reachable from several frontier cells belongs to the first:
+        # claim each with its smallest candidate position, keep the winners
+        claim = positions[:candidates.size]
+        np.minimum.at(pred, candidates, claim)
+        first = pred[candidates] == claim
+        next_frontier = candidates[first]
+        pred[next_frontier] = frontier[slots[first] // len(offsets)]
+        frontier = next_frontier
+
+    if start == goal:
+        return [start]
+    if pred[goal_i] in (UNSEEN, WALL):
+        return []
+    path = []
+    i = goal_i
+    while i != -1:
+        r, c = divmod(i, width)
+        path.append((r - 1, c - 1))
+        i = int(pred[i])
+    return path[::-1]
+
+
+# ----------------------------
+# Flat-grid helpers
+# ----------------------------
+# A*, bidirectional BFS and JPS work on a flat bytearray of the maze inside a
+# ring of walls (1 = open), so a neighbor is just index + offset.
+def open_cells(maze):
+    """(cells, width) for the maze padded with walls; cell (r, c) is at index_of."""
+    if np is not None and isinstance(maze, np.ndarray):
+        rows, cols = maze.shape
+        return bytearray(np.pad(maze == 0, 1).astype(np.uint8).tobytes()), cols + 2
+    rows, cols = len(maze), len(maze[0])
+    width = cols + 2
+    cells = bytearray(width * (rows + 2))
+    for r, row in enumerate(maze):
+        base = (r + 1) * width + 1
+        cells[base:base + cols] = bytes(0 if v else 1 for v in row)
+    return cells, width
+
+def index_of(cell, width):
+    return (cell[0] + 1) * width + cell[1] + 1
+
+def cell_of(i, width):
+    r, c = divmod(i, width)
+    return r - 1, c - 1
+
+def trace(parent, i, width):
+    """Cells from the search root to i, following parent indexes up to -1."""
+    path = []
+    while i != -1:
+        path.append(cell_of(i, width))
+        i = parent[i]
+    return path[::-1]
+
+
+# ----------------------------
+# A* (Manhattan heuristic)
+# ----------------------------
+def astar_path(maze, start, goal, stats=None):
+    """A* over a binary heap. Ties on f go to the deeper cell, so on open
+    ground it walks straight at the goal instead of fanning out."""
+    if stats is None:
+        stats = SearchStats()
+    if start == goal:
+        return [start]
+    cells, width = open_cells(maze)
+    s, g = index_of(start, width), index_of(goal, width)
+    if not cells[g]:
+        return []
+    goal_r, goal_c = divmod(g, width)
+    offsets = (width, -width, 1, -1)
+    cost = {s: 0}
+    parent = {s: -1}
+    heap = [(0, 0, s)]  # (f, -g, index)
+    while heap:
+        stats.saw_frontier(len(heap))
+        _, neg_g, i = heapq.heappop(heap)
+        if -neg_g > cost[i]:
+            continue  # stale entry, a shorter route was found later
+        stats.expanded += 1
+        if i == g:
+            return trace(parent, g, width)
+        step = 1 - neg_g
+        for o in offsets:
+            j = i + o
+            if cells[j] and step < cost.get(j, step + 1):
+                cost[j] = step
+                parent[j] = i
+                r, c = divmod(j, width)
+                heapq.heappush(heap, (step + abs(r - goal_r) + abs(c - goal_c), -step, j))
+    return []
+
+
+# ----------------------------
+# Bidirectional BFS
+# ----------------------------
+def bidirectional_bfs_path(maze, start, goal, stats=None):
+    """BFS from both ends, always growing the smaller frontier by one level.
+
+    The first level on which the two searches touch contains a shortest
+    path; every meeting cell on that level is compared before stopping.
+    """
+    if stats is None:
+        stats = SearchStats()
+    if start == goal:
+        return [start]
+    cells, width = open_cells(maze)
+    s, g = index_of(start, width), index_of(goal, width)
+    if not cells[g]:
+        return []
+    offsets = (width, -width, 1, -1)
+    parents = ({s: -1}, {g: -1})
+    depths = ({s: 0}, {g: 0})
+    frontiers = ([s], [g])
+    while frontiers[0] and frontiers[1]:
+        stats.saw_frontier(len(frontiers[0]) + len(frontiers[1]))
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, depth = parents[side], depths[side]
+        other_depth = depths[1 - side]
+        best = best_cell = None
+        next_frontier = []
+        for i in frontiers[side]:
+            stats.expanded += 1
+            d = depth[i] + 1
+            for o in offsets:
+                j = i + o
+                if not cells[j] or j in parent:
+                    continue
+                parent[j] = i
+                depth[j] = d
+                next_frontier.append(j)
+                if j in other_depth and (best is None or d + other_depth[j] < best):
+                    best, best_cell = d + other_depth[j], j
+        if best_cell is not None:
+            forward = trace(parents[0], best_cell, width)
+            backward = trace(parents[1], parents[1][best_cell], width) if best_cell != g else []
+            return forward + backward[::-1]
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+    return []
+
+
+# ----------------------------
+# Jump point search (4-connected)
+# ----------------------------
+# On a grid without diagonal moves, straight runs only need to stop where a
+# side cell opens up behind a wall (a "forced" neighbor) or at the goal; a
+# vertical run also stops wherever a horizontal run from it would. A* then
+# only ever expands those jump points.
+def jump(cells, i, d, goal, width):
+    """First jump point from i heading in direction d, or -1."""
+    horizontal = d in (1, -1)
+    side = width if horizontal else 1
+    while cells[i]:
+        if i == goal:
+            return i
+        if (cells[i - side] and not cells[i - side - d]) or (cells[i + side] and not cells[i + side - d]):
+            return i
+        if not horizontal and (jump(cells, i + 1, 1, goal, width) != -1
+                               or jump(cells, i - 1, -1, goal, width) != -1):
+            return i
+        i += d
+    return -1
+
+def jps_path(maze, start, goal, stats=None):
+    if stats is None:
+        stats = SearchStats()
+    if start == goal:
+        return [start]
+    cells, width = open_cells(maze)
+    s, g = index_of(start, width), index_of(goal, width)
+    if not cells[g]:
+        return []
+    goal_r, goal_c = divmod(g, width)
+    cost = {s: 0}
+    parent = {s: -1}
+    heap = [(0, 0, s)]
+    while heap:
+        stats.saw_frontier(len(heap))
+        _, neg_g, i = heapq.heappop(heap)
+        if -neg_g > cost[i]:
+            continue
+        stats.expanded += 1
+        if i == g:
+            break
+        p = parent[i]
+        if p == -1:
+            directions = (width, -width, 1, -1)
+        elif abs(i - p) < width:  # arrived moving horizontally
+            d = 1 if i > p else -1
+            directions = (d, width, -width)
+        else:
+            d = width if i > p else -width
+            directions = (d, 1, -1)
+        r, c = divmod(i, width)
+        for d in directions:
+            j = jump(cells, i + d, d, g, width)
+            if j == -1:
+                continue
+            jr, jc = divmod(j, width)
+            step = -neg_g + abs(jr - r) + abs(jc - c)
+            if step < cost.get(j, step + 1):
+                cost[j] = step
+                parent[j] = i
+                heapq.heappush(heap, (step + abs(jr - goal_r) + abs(jc - goal_c), -step, j))
+    else:
+        return []
+    # fill in the straight runs between jump points
+    points = trace(parent, g, width)
+    path = [points[0]]
+    for (r, c), (nr, nc) in zip(points, points[1:]):
+        dr, dc = (nr > r) - (nr < r), (nc > c) - (nc < c)
+        while (r, c) != (nr, nc):
+            r, c = r + dr, c + dc
+            path.append((r, c))
+    return path
+
+
+# ----------------------------
+# Distance field
+# ----------------------------
+UNREACHED = -1
+
+class DistanceField:
+    """Steps from every open cell to the goal, from one reverse BFS.
+
+    Built once per maze; after that distance() and next_step() are O(1), so
+    the AI and hints never search again until the maze changes. Walls and
+    cells cut off from the goal have no distance.
+    """
+
+    def __init__(self, maze, goal):
+        self.goal = goal
+        self.cells, self.width = open_cells(maze)
+        started = time.perf_counter()
+        if np is not None:
+            self.dist = self._frontier_fill(index_of(goal, self.width))
+        else:
+            self.dist = self._queue_fill(index_of(goal, self.width))
+        self.seconds = time.perf_counter() - started
+
+    def _queue_fill(self, g):
+        from array import array
+
+        cells, width = self.cells, self.width
+        dist = array("i", [UNREACHED]) * len(cells)
+        if not cells[g]:
+            return dist
+        dist[g] = 0
+        queue = deque([g])
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for o in (width, -width, 1, -1):
+                j = i + o
+                if cells[j] and dist[j] == UNREACHED:
+                    dist[j] = d
+                    queue.append(j)
+        return dist
+
+    def _frontier_fill(self, g):
+        is_open = np.frombuffer(bytes(self.cells), dtype=np.uint8).astype(bool)
+        dist = np.full(len(self.cells), UNREACHED, dtype=np.int32)
+        if not is_open[g]:
+            return dist
+        offsets = np.array([self.width, -self.width, 1, -1], dtype=np.intp)
+        claim = np.zeros(len(self.cells), dtype=np.int32)
+        frontier = np.array([g], dtype=np.intp)
+        dist[g] = level = 0
+        while frontier.size:
+            level += 1
+            candidates = (frontier[:, None] + offsets).ravel()
+            candidates = candidates[is_open[candidates] & (dist[candidates] == UNREACHED)]
+            # a cell can be a candidate up to four times; keep one copy
+            order = np.arange(candidates.size, dtype=np.int32)
+            claim[candidates] = order
+            frontier = candidates[claim[candidates] == order]
+            dist[frontier] = level
+        return dist
+
+    def distance(self, cell):
+        """Steps from cell to the goal, or None if it can't get there."""
+        d = int(self.dist[index_of(cell, self.width)])
+        return None if d == UNREACHED else d
+
+    def reachable(self, cell):
+        return self.distance(cell) is not None
+
+    def next_step(self, cell):
+        """The neighbor one step closer to the goal, or None at/cut off from it."""
+        i = index_of(cell, self.width)
+        d = self.dist[i]
+        if d <= 0:
+            return None
+        for dr, dc in DIRECTIONS:
+            j = i + dr * self.width + dc
+            if self.dist[j] == d - 1:
+                return cell[0] + dr, cell[1] + dc
+        return None
+
+    def path(self, cell):
+        """A shortest path from cell to the goal, or [] if there is none."""
+        if not self.reachable(cell):
+            return []
+        path = [cell]
+        while path[-1] != self.goal:
+            path.append(self.next_step(path[-1]))
+        return path
+
+
+# ----------------------------
+# Engine registry
+# ----------------------------
+ENGINES = {
+    "bfs": bfs_path,
+    "frontier": frontier_bfs_path,
+    "astar": astar_path,
+    "bidirectional": bidirectional_bfs_path,
+    "jps": jps_path,
+}
+
+def available_engines():
+    """Engine names usable here (the frontier engine needs NumPy)."""
+    return [name for name in ENGINES if name != "frontier" or np is not None]
+
+def search(maze, start, goal, engine="bfs"):
+    """Run one engine by name; returns (path, SearchStats)."""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}, choose from {', '.join(ENGINES)}")
+    stats = SearchStats(engine)
+    started = time.perf_counter()
+    path = ENGINES[engine](maze, start, goal, stats)
+    stats.seconds = time.perf_counter() - started
+    stats.path_length = len(path)
+    return path, stats
+
+
+def main(argv=None):
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description="Time the path search engines.")
+    parser.add_argument("size", type=int, nargs="?", default=1000, help="time a size x size grid")
+    parser.add_argument("--density", type=float, default=0.2, help="fraction of wall cells")
+    parser.add_argument("--engines", default=",".join(available_engines()))
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    size = args.size
+    maze = [[1 if rng.random() < args.density else 0 for _ in range(size)] for _ in range(size)]
+    maze[0][0] = maze[-1][-1] = 0
+    for name in args.engines.split(","):
+        grid = to_grid(maze) if name == "frontier" else maze
+        path, stats = search(grid, (0, 0), (size - 1, size - 1), name)
+        print(f"{size}x{size} {stats}, path of {stats.path_length:,} cells")
+    field = DistanceField(maze, (size - 1, size - 1))
+    print(f"{size}x{size} distance field: {field.seconds * 1000:.1f} ms, "
+          f"{field.distance((0, 0))} steps from the start")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Headless treasure hunt races. A Race is the game state ht.py draws;
+tournament() runs many races on a process pool and writes one JSONL or CSV
+line per race. Engines in one configuration share seeds, so they race on
+identical mazes.
+
+    python ht_sim.py --races 500 --sizes 15,100,400 --densities 0.2,0.35 --out races.jsonl
+    python ht_sim.py --engines bfs,astar,jps --algorithms kruskal --workers 8 --out races.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from ht_maze import ALGORITHMS, DEFAULT_DENSITY, generate
+from ht_paths import DistanceField, SearchStats, available_engines, search
+
+FIELDS = ("seed", "rows", "cols", "algorithm", "density", "engine", "reachable", "path_length",
+          "expanded", "peak_frontier", "solve_ms", "generate_ms")
+
+
+class Race:
+    def __init__(self, maze, treasure):
+        self.maze = maze
+        self.treasure = treasure
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.ai_pos = (0, 0)
+        self.ai_path = []
+        self.ai_step = 0  # index in ai_path of the AI's next move
+        self.field = None  # distance to the treasure from every cell, built on first use
+
+    @classmethod
+    def generate(cls, rows, cols, algorithm="random", seed=None, density=DEFAULT_DENSITY):
+        return cls(*generate(rows, cols, algorithm, seed, density))
+
+    def distance_field(self):
+        if self.field is None:
+            self.field = DistanceField(self.maze, self.treasure)
+        return self.field
+
+    def plan(self, engine):
+        """Search from the AI's position to the treasure; returns SearchStats.
+
+        "field" reads the path off the distance field instead of searching.
+        """
+        if engine == "field":
+            stats = SearchStats(engine)
+            started = time.perf_counter()
+            self.ai_path = self.distance_field().path(self.ai_pos)
+            stats.seconds = time.perf_counter() - started
+            stats.path_length = len(self.ai_path)
+        else:
+            self.ai_path, stats = search(self.maze, self.ai_pos, self.treasure, engine)
+        self.ai_step = 1
+        return stats
+
+    def step_ai(self):
+        """Move the AI one cell along its path; False once it can't move."""
+        if self.ai_step >= len(self.ai_path):
+            return False
+        self.ai_pos = self.ai_path[self.ai_step]
+        self.ai_step += 1
+        return True
+
+    @property
+    def ai_won(self):
+        return self.ai_pos == self.treasure
+
+
+def run_race(rows, cols, algorithm, density, engine, seed):
+    started = time.perf_counter()
+    race = Race.generate(rows, cols, algorithm, seed, density)
+    generated = time.perf_counter()
+    stats = race.plan(engine)
+    while race.step_ai():
+        pass
+    return {
+        "seed": seed, "rows": rows, "cols": cols, "algorithm": algorithm, "density": density,
+        "engine": engine,
+        "reachable": race.ai_won,
+        "path_length": stats.path_length,
+        "expanded": stats.expanded,
+        "peak_frontier": stats.peak_frontier,
+        "solve_ms": round(stats.seconds * 1000, 3),
+        "generate_ms": round((generated - started) * 1000, 3),
+    }
+
+
+def _run_race(config):
+    return run_race(*config)
+
+
+def configs(sizes, densities, algorithms, engines, races, seed):
+    """(rows, cols, algorithm, density, engine, seed) for every race."""
+    for size, density, algorithm in product(sizes, densities, algorithms):
+        for i in range(races):
+            for engine in engines:
+                yield size, size, algorithm, density, engine, seed + i
+
+
+class ResultWriter:
+    """Writes race dicts as JSONL or CSV, chosen by the file extension."""
+
+    def __init__(self, path):
+        if path.endswith((".jsonl", ".ndjson")):
+            self.fmt = "jsonl"
+        elif path.endswith(".csv"):
+            self.fmt = "csv"
+        else:
+            raise ValueError(f"can't tell the format of {path!r}; use .csv or .jsonl")
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        if self.fmt == "csv":
+            self.csv = csv.DictWriter(self.file, FIELDS)
+            self.csv.writeheader()
+
+    def write(self, result):
+        if self.fmt == "csv":
+            self.csv.writerow(result)
+        else:
+            self.file.write(json.dumps(result))
+            self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+
+def tournament(race_configs, out=None, workers=None, chunksize=16):
+    """Run the races in a process pool, streaming each result to out.
+
+    Returns a summary with the total throughput and per-engine means.
+    """
+    writer = ResultWriter(out) if out else None
+    totals = {}
+    count = 0
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(workers) as pool:
+            for result in pool.map(_run_race, race_configs, chunksize=chunksize):
+                count += 1
+                if writer:
+                    writer.write(result)
+                t = totals.setdefault(result["engine"], {"races": 0, "reachable": 0, "expanded": 0,
+                                                          "solve_ms": 0.0})
+                t["races"] += 1
+                t["reachable"] += result["reachable"]
+                t["expanded"] += result["expanded"]
+                t["solve_ms"] += result["solve_ms"]
+    finally:
+        if writer:
+            writer.close()
+    seconds = time.perf_counter() - started
+    return {
+        "races": count,
+        "seconds": round(seconds, 3),
+        "races_per_sec": round(count / seconds, 1) if seconds else None,
+        "workers": workers or os.cpu_count(),
+        "engines": {
+            name: {"races": t["races"], "reachable": t["reachable"],
+                   "mean_expanded": round(t["expanded"] / t["races"], 1),
+                   "mean_solve_ms": round(t["solve_ms"] / t["races"], 3)}
+            for name, t in totals.items()
+        },
+    }
+
+
+def split(text, kind=str):
+    return [kind(part) for part in text.split(",") if part]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless treasure hunt races in parallel")
+    parser.add_argument("--races", type=int, default=100, help="seeds per configuration")
+    parser.add_argument("--sizes", default="15,50,200", help="comma-separated grid sizes")
+    parser.add_argument("--densities", default=str(DEFAULT_DENSITY), help="comma-separated wall densities")
+    parser.add_argument("--algorithms", default="random", help=f"from {', '.join(ALGORITHMS)}")
+    parser.add_argument("--engines", default=",".join(available_engines()))
+    parser.add_argument("--seed", type=int, default=1, help="first seed")
+    parser.add_argument("--workers", type=int, help="processes (default: one per core)")
+    parser.add_argument("--chunksize", type=int, default=16, help="races sent to a worker at a time")
+    parser.add_argument("--out", help="write one line per race to this .jsonl or .csv file")
+    args = parser.parse_args(argv)
+    for name in split(args.algorithms):
+        if name not in ALGORITHMS:
+            parser.error(f"unknown maze algorithm {name!r}")
+    for name in split(args.engines):
+        if name not in available_engines():
+            parser.error(f"unknown or unavailable engine {name!r}")
+
+    race_configs = configs(split(args.sizes, int), split(args.densities, float),
+                           split(args.algorithms), split(args.engines), args.races, args.seed)
+    summary = tournament(race_configs, args.out, args.workers, args.chunksize)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,14 @@
-import sqlite3
+import bisect
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from tk_worker import BackgroundWorker
+from student_db import StudentDB
+
 # -------------------------------
 # DATABASE SETUP
 # -------------------------------
-conn = sqlite3.connect("students.db")
-cursor = conn.cursor()
-cursor.execute("PRAGMA foreign_keys = ON;")
-
-# Create tables if not exist
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS Students (
-    StudentID INTEGER PRIMARY KEY,
-    Name TEXT,
-    Age INTEGER,
-    Gender TEXT,
-    Email TEXT
-)
-""")
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS Courses (
-    CourseID INTEGER PRIMARY KEY,
-    CourseName TEXT,
-    Duration INTEGER
-)
-""")
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS Enrollments (
-    EnrollmentID INTEGER PRIMARY KEY,
-    StudentID INTEGER,
-    CourseID INTEGER,
-    Grade TEXT,
-    FOREIGN KEY (StudentID) REFERENCES Students(StudentID),
-    FOREIGN KEY (CourseID) REFERENCES Courses(CourseID)
-)
-""")
-conn.commit()
+db = StudentDB("students.db")
 
 # -------------------------------
 # GUI SETUP
@@ -46,6 +18,10 @@ root.title("🌟 Student Management System 🌟")
 root.geometry("1000x600")
 root.configure(bg="#f5f5f5")
 
+# All database work runs here, off the Tk thread
+worker = BackgroundWorker()
+worker.attach(root)
+
 # Style for Treeview
 style = ttk.Style()
 style.theme_use("clam")
@@ -63,85 +39,403 @@ tab_control = ttk.Notebook(root)
 students_tab = ttk.Frame(tab_control)
 courses_tab = ttk.Frame(tab_control)
 enrollments_tab = ttk.Frame(tab_control)
+reports_tab = ttk.Frame(tab_control)
 
 tab_control.add(students_tab, text='👨‍🎓 Students')
 tab_control.add(courses_tab, text='📚 Courses')
 tab_control.add(enrollments_tab, text='📝 Enrollments')
+tab_control.add(reports_tab, text='📊 Reports')
 tab_control.pack(expand=1, fill='both')
 
+# -------------------------------
+# VIRTUAL TABLE
+# -------------------------------
+PAGE_SIZE = 200
+WINDOW_PAGES = 3  # at most PAGE_SIZE * WINDOW_PAGES rows live in a Treeview
+EDGE = 0.1        # load another page when the view is this close to an edge
+POLL_MS = 1000    # how often to check for writes from other processes
+SEARCH_DELAY_MS = 250  # wait for typing to pause before searching
+
+class VirtualTable:
+    """Treeview that shows a table through a bounded window of rows.
+
+    Rows are pulled from a student_db repository one keyset page at a time
+    as the user scrolls; pages falling off the other end of the window are
+    dropped, so memory and refresh cost stay constant however large the
+    table grows. Each row's primary key is used as its Treeview item id.
+
+    refresh() applies only what changed since the table's ChangeLog
+    watermark. Bulk loads ('R' entries) and changes to any table in
+    `depends_on` (whose values the rows display) fall back to a full reload.
+
+    While a search term is set the table shows the repository's indexed
+    search results instead of paging through the whole table.
+
+    All queries run on the DB worker; the _fetch_* methods run on a worker
+    thread and only read the database, the _show_* methods apply their
+    results to the Treeview on the Tk thread.
+    """
+
+    def __init__(self, parent, repo, columns, depends_on=()):
+        self.repo = repo
+        self.depends_on = depends_on
+        self.key = repo.TABLE
+        self.page_key = (repo.TABLE, "page")
+        self.watermark = 0
+        self.query = ""
+        self.max_rows = PAGE_SIZE * WINDOW_PAGES
+        self.total = 0
+        self.at_start = self.at_end = True
+        self.visible = True
+        self._stale = False
+        self._loading = False
+        self._reloading = False
+
+        container = tk.Frame(parent)
+        container.pack(fill="both", expand=True, pady=(10, 0), padx=10)
+        self.tree = ttk.Treeview(container, columns=columns, show="headings")
+        for col in columns:
+            self.tree.heading(col, text=col)
+        self.scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.status = tk.Label(parent, anchor="w", fg="#555555")
+        self.status.pack(fill="x", padx=10, pady=(0, 5))
+
+    # --- visibility ---
+    def hide(self):
+        # a hidden tab's queries are stale; drop them and reload when shown
+        self.visible = False
+        if self._reloading or self._loading or worker.is_pending(self.key):
+            self._stale = True
+        worker.cancel(self.key)
+        worker.cancel(self.page_key)
+        self._loading = self._reloading = False
+
+    def show(self):
+        self.visible = True
+        if self._stale:
+            self._stale = False
+            self.reload()
+
+    # --- full reload / search ---
+    def search(self, term):
+        self.query = term.strip()
+        self.reload()
+
+    def reload(self):
+        if not self.visible:
+            self._stale = True
+            return
+        worker.cancel(self.page_key)
+        self._loading = False
+        self._reloading = True
+        self.status.config(text="Loading…")
+        worker.submit(self._fetch_reload, self.query, key=self.key,
+                      on_done=self._show_reload, on_error=self._failed)
+
+    def _fetch_reload(self, query):
+        watermark = db.last_change()
+        if query:
+            return watermark, query, self.repo.search(query), None
+        return watermark, query, self.repo.page_after(None, PAGE_SIZE), self.repo.count()
+
+    def _show_reload(self, result):
+        self._reloading = False
+        self.watermark, query, rows, total = result
+        self.tree.delete(*self.tree.get_children())
+        self._append(rows)
+        self.at_start = True
+        self.tree.yview_moveto(0)
+        if query:
+            self.total = len(rows)
+            self.at_end = True
+            self.status.config(text=f"{len(rows)} matches for {query!r}")
+        else:
+            self.total = total
+            self.at_end = len(rows) < PAGE_SIZE
+            self._update_status()
+
+    def _failed(self, error):
+        self._loading = self._reloading = False
+        self.status.config(text=f"Error: {error}")
+
+    def _append(self, rows):
+        for row in rows:
+            if not self.tree.exists(str(row[0])):
+                self.tree.insert("", "end", iid=str(row[0]), values=row)
+
+    def _prepend(self, rows):
+        index = 0
+        for row in rows:
+            if not self.tree.exists(str(row[0])):
+                self.tree.insert("", index, iid=str(row[0]), values=row)
+                index += 1
+
+    # --- paging ---
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._loading or self._reloading:
+            return
+        children = self.tree.get_children()
+        if float(last) > 1 - EDGE and not self.at_end and children:
+            self._loading = True
+            worker.submit(self.repo.page_after, int(children[-1]), PAGE_SIZE, key=self.page_key,
+                          on_done=self._show_next, on_error=self._failed)
+        elif float(first) < EDGE and not self.at_start and children:
+            self._loading = True
+            worker.submit(self.repo.page_before, int(children[0]), PAGE_SIZE, key=self.page_key,
+                          on_done=self._show_previous, on_error=self._failed)
+
+    def _show_next(self, rows):
+        self._loading = False
+        children = self.tree.get_children()
+        top = float(self.tree.yview()[0]) * len(children)
+        self.at_end = len(rows) < PAGE_SIZE
+        self._append(rows)
+        children = self.tree.get_children()
+        excess = len(children) - self.max_rows
+        if excess > 0:
+            self.tree.delete(*children[:excess])
+            self.at_start = False
+            # keep the same rows on screen after trimming the top
+            self.tree.yview_moveto(max(top - excess, 0) / self.max_rows)
+        self._update_status()
+
+    def _show_previous(self, rows):
+        self._loading = False
+        children = self.tree.get_children()
+        top = float(self.tree.yview()[0]) * len(children)
+        self.at_start = len(rows) < PAGE_SIZE
+        self._prepend(rows)
+        children = self.tree.get_children()
+        excess = len(children) - self.max_rows
+        if excess > 0:
+            self.tree.delete(*children[-excess:])
+            self.at_end = False
+        self.tree.yview_moveto((top + len(rows)) / len(self.tree.get_children()))
+        self._update_status()
+
+    # --- incremental refresh ---
+    def refresh(self):
+        if not self.visible:
+            self._stale = True
+            return
+        if self._reloading:
+            # the reload in flight may have read the table before this change
+            self.reload()
+            return
+        worker.submit(self._fetch_changes, self.watermark, self.query, key=self.key,
+                      on_done=self._show_changes, on_error=self._failed)
+
+    def _fetch_changes(self, watermark, query):
+        """(watermark, rows, deleted keys, change in row count); [] when
+        nothing changed, None when the table needs a full reload."""
+        changes = db.changes_since(watermark)
+        if not changes:
+            return changes
+        upserts, deletes, delta = set(), set(), 0
+        for _, table, key, op in changes:
+            if query and table in (self.repo.TABLE,) + self.depends_on:
+                # results are capped and ranked by the query; just run it again
+                return None
+            if table in self.depends_on and op != "I" or table == self.repo.TABLE and op == "R":
+                return None
+            if table != self.repo.TABLE:
+                continue
+            if op == "D":
+                upserts.discard(key)
+                deletes.add(key)
+                delta -= 1
+            else:
+                deletes.discard(key)
+                upserts.add(key)
+                if op == "I":
+                    delta += 1
+        if len(upserts) > self.max_rows:
+            return None
+        return changes[-1][0], self.repo.rows_for(upserts), deletes, delta
+
+    def _show_changes(self, result):
+        if result is None:
+            self.reload()
+            return
+        if not result:
+            return
+        self.watermark, rows, deletes, delta = result
+        self.total += delta
+        for key in deletes:
+            if self.tree.exists(str(key)):
+                self.tree.delete(str(key))
+        keys = [int(iid) for iid in self.tree.get_children()]
+        # rows beyond an unloaded edge of the window arrive with paging later
+        low = None if self.at_start or not keys else keys[0]
+        high = None if self.at_end or not keys else keys[-1]
+        for row in rows:
+            iid = str(row[0])
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=row)
+            elif (low is None or row[0] >= low) and (high is None or row[0] <= high):
+                index = bisect.bisect_left(keys, row[0])
+                keys.insert(index, row[0])
+                self.tree.insert("", index, iid=iid, values=row)
+        self._trim()
+        self._update_status()
+
+    def _trim(self):
+        # drop rows from whichever end is farther from the current view
+        children = self.tree.get_children()
+        excess = len(children) - self.max_rows
+        if excess <= 0:
+            return
+        if float(self.tree.yview()[0]) < 0.5:
+            self.tree.delete(*children[-excess:])
+            self.at_end = False
+        else:
+            self.tree.delete(*children[:excess])
+            self.at_start = False
+
+    def _update_status(self):
+        shown = len(self.tree.get_children())
+        self.status.config(text=f"Showing {shown} of {self.total} rows")
+
 # -------------------------------
 # FUNCTIONS
 # -------------------------------
 def fetch_students():
-    for row in students_tree.get_children():
-        students_tree.delete(row)
-    cursor.execute("SELECT * FROM Students")
-    for row in cursor.fetchall():
-        students_tree.insert("", "end", values=row)
+    students_table.reload()
 
 def add_student():
     try:
-        cursor.execute("INSERT INTO Students (StudentID, Name, Age, Gender, Email) VALUES (?, ?, ?, ?, ?)",
-                       (int(student_id.get()), name.get(), int(age.get()), gender.get(), email.get()))
-        conn.commit()
-        fetch_students()
-        messagebox.showinfo("Success", "Student added successfully!")
-        # Clear input fields
-        student_id.delete(0, tk.END)
-        name.delete(0, tk.END)
-        age.delete(0, tk.END)
-        gender.delete(0, tk.END)
-        email.delete(0, tk.END)
+        row = (int(student_id.get()), name.get(), int(age.get()), gender.get(), email.get())
     except Exception as e:
         messagebox.showerror("Error", str(e))
+        return
+    worker.submit(db.students.add, *row, on_done=student_added, on_error=show_error)
+
+def student_added(_):
+    students_table.refresh()
+    messagebox.showinfo("Success", "Student added successfully!")
+    # Clear input fields
+    student_id.delete(0, tk.END)
+    name.delete(0, tk.END)
+    age.delete(0, tk.END)
+    gender.delete(0, tk.END)
+    email.delete(0, tk.END)
 
 def fetch_courses():
-    for row in courses_tree.get_children():
-        courses_tree.delete(row)
-    cursor.execute("SELECT * FROM Courses")
-    for row in cursor.fetchall():
-        courses_tree.insert("", "end", values=row)
+    courses_table.reload()
 
 def add_course():
     try:
-        cursor.execute("INSERT INTO Courses (CourseID, CourseName, Duration) VALUES (?, ?, ?)",
-                       (int(course_id.get()), course_name.get(), int(duration.get())))
-        conn.commit()
-        fetch_courses()
-        messagebox.showinfo("Success", "Course added successfully!")
-        # Clear input fields
-        course_id.delete(0, tk.END)
-        course_name.delete(0, tk.END)
-        duration.delete(0, tk.END)
+        row = (int(course_id.get()), course_name.get(), int(duration.get()))
     except Exception as e:
         messagebox.showerror("Error", str(e))
+        return
+    worker.submit(db.courses.add, *row, on_done=course_added, on_error=show_error)
+
+def course_added(_):
+    courses_table.refresh()
+    messagebox.showinfo("Success", "Course added successfully!")
+    # Clear input fields
+    course_id.delete(0, tk.END)
+    course_name.delete(0, tk.END)
+    duration.delete(0, tk.END)
 
 def fetch_enrollments():
-    for row in enrollments_tree.get_children():
-        enrollments_tree.delete(row)
-    cursor.execute("""
-        SELECT e.EnrollmentID, s.Name, c.CourseName, e.Grade
-        FROM Enrollments e
-        JOIN Students s ON e.StudentID = s.StudentID
-        JOIN Courses c ON e.CourseID = c.CourseID
-    """)
-    for row in cursor.fetchall():
-        enrollments_tree.insert("", "end", values=row)
+    enrollments_table.reload()
 
 def add_enrollment():
     try:
-        cursor.execute("INSERT INTO Enrollments (EnrollmentID, StudentID, CourseID, Grade) VALUES (?, ?, ?, ?)",
-                       (int(enroll_id.get()), int(student_sel.get()), int(course_sel.get()), grade.get()))
-        conn.commit()
-        fetch_enrollments()
-        messagebox.showinfo("Success", "Enrollment added successfully!")
-        # Clear input fields
-        enroll_id.delete(0, tk.END)
-        student_sel.delete(0, tk.END)
-        course_sel.delete(0, tk.END)
-        grade.delete(0, tk.END)
+        row = (int(enroll_id.get()), int(student_sel.get()), int(course_sel.get()), grade.get())
     except Exception as e:
         messagebox.showerror("Error", str(e))
+        return
+    worker.submit(db.enrollments.add, *row, on_done=enrollment_added, on_error=show_error)
+
+def enrollment_added(_):
+    enrollments_table.refresh()
+    messagebox.showinfo("Success", "Enrollment added successfully!")
+    # Clear input fields
+    enroll_id.delete(0, tk.END)
+    student_sel.delete(0, tk.END)
+    course_sel.delete(0, tk.END)
+    grade.delete(0, tk.END)
+
+def show_error(e):
+    messagebox.showerror("Error", str(e))
+
+# Reports read the trigger-maintained statistics tables: O(courses) rows
+def fetch_reports():
+    worker.submit(load_reports, key="reports", on_done=show_reports, on_error=show_error)
+
+def load_reports():
+    return db.stats.course_report(), db.stats.load_summary()
+
+def show_reports(result):
+    rows, (students, avg_load, max_load) = result
+    reports_tree.delete(*reports_tree.get_children())
+    for row in rows:
+        reports_tree.insert("", "end", values=row)
+    load_label.config(text=f"{students} students enrolled · average course load {avg_load:.2f} · "
+                           f"largest course load {max_load}")
+
+def verify_stats():
+    worker.submit(db.stats.verify, key="verify_stats", on_done=show_verify, on_error=show_error)
+
+def show_verify(problems):
+    if problems:
+        messagebox.showwarning("Statistics", "Statistics are out of date:\n" + "\n".join(problems))
+    else:
+        messagebox.showinfo("Statistics", "Statistics match the enrollments.")
+
+def rebuild_stats():
+    worker.submit(db.stats.rebuild, key="rebuild_stats",
+                  on_done=lambda _: fetch_reports(), on_error=show_error)
+
+def add_search_box(frame, table):
+    # debounced: each keystroke cancels the pending search and schedules a new one
+    tk.Label(frame, text="🔍 Search", bg=frame["bg"]).grid(row=1, column=0, padx=5, pady=(8, 0))
+    entry = tk.Entry(frame, width=30)
+    entry.grid(row=1, column=1, columnspan=3, sticky="w", padx=5, pady=(8, 0))
+    pending = []
+
+    def on_key(_event):
+        if pending:
+            root.after_cancel(pending.pop())
+        pending.append(root.after(SEARCH_DELAY_MS, lambda: table.search(entry.get())))
+
+    entry.bind("<KeyRelease>", on_key)
+    return entry
+
+# Pick up rows written by other processes (batch jobs, other windows)
+last_data_version = db.data_version()
+
+def poll_external_changes():
+    worker.submit(db.data_version, key="data_version", on_done=check_data_version)
+    root.after(POLL_MS, poll_external_changes)
+
+def check_data_version(version):
+    global last_data_version
+    if version != last_data_version:
+        last_data_version = version
+        for table in (students_table, courses_table, enrollments_table):
+            table.refresh()
+        if tab_control.select() == str(reports_tab):
+            fetch_reports()
+
+# Only the selected tab runs queries; the others reload when shown again
+def on_tab_changed(_event):
+    selected = tab_control.select()
+    for tab, table in ((students_tab, students_table), (courses_tab, courses_table),
+                       (enrollments_tab, enrollments_table)):
+        if str(tab) == selected:
+            table.show()
+        else:
+            table.hide()
+    if selected == str(reports_tab):
+        fetch_reports()
 
 # Button Hover Effect
 def on_enter(e):
@@ -180,10 +474,8 @@ add_stu_btn.grid(row=0, column=10, padx=10)
 add_stu_btn.bind("<Enter>", on_enter)
 add_stu_btn.bind("<Leave>", on_leave)
 
-students_tree = ttk.Treeview(students_tab, columns=("ID","Name","Age","Gender","Email"), show="headings")
-for col in ("ID","Name","Age","Gender","Email"):
-    students_tree.heading(col, text=col)
-students_tree.pack(fill="both", expand=True, pady=10, padx=10)
+students_table = VirtualTable(students_tab, db.students, ("ID","Name","Age","Gender","Email"))
+add_search_box(students_frame, students_table)
 fetch_students()
 
 # -------------------------------
@@ -209,10 +501,8 @@ add_course_btn.grid(row=0, column=6, padx=10)
 add_course_btn.bind("<Enter>", lambda e: add_course_btn.config(bg="#fb8c00"))
 add_course_btn.bind("<Leave>", lambda e: add_course_btn.config(bg="#FF9800"))
 
-courses_tree = ttk.Treeview(courses_tab, columns=("ID","CourseName","Duration"), show="headings")
-for col in ("ID","CourseName","Duration"):
-    courses_tree.heading(col, text=col)
-courses_tree.pack(fill="both", expand=True, pady=10, padx=10)
+courses_table = VirtualTable(courses_tab, db.courses, ("ID","CourseName","Duration"))
+add_search_box(courses_frame, courses_table)
 fetch_courses()
 
 # -------------------------------
@@ -242,13 +532,34 @@ add_enroll_btn.grid(row=0, column=8, padx=10)
 add_enroll_btn.bind("<Enter>", lambda e: add_enroll_btn.config(bg="#1976D2"))
 add_enroll_btn.bind("<Leave>", lambda e: add_enroll_btn.config(bg="#2196F3"))
 
-enrollments_tree = ttk.Treeview(enrollments_tab, columns=("EnrollmentID","Student","Course","Grade"), show="headings")
-for col in ("EnrollmentID","Student","Course","Grade"):
-    enrollments_tree.heading(col, text=col)
-enrollments_tree.pack(fill="both", expand=True, pady=10, padx=10)
+enrollments_table = VirtualTable(enrollments_tab, db.enrollments, ("EnrollmentID","Student","Course","Grade"),
+                                 depends_on=("Students", "Courses"))
+add_search_box(enroll_frame, enrollments_table)
 fetch_enrollments()
 
+# -------------------------------
+# REPORTS TAB
+# -------------------------------
+reports_frame = tk.Frame(reports_tab, bg="#f3e5f5", pady=10)
+reports_frame.pack(fill="x")
+
+refresh_btn = tk.Button(reports_frame, text="Refresh", bg="#9C27B0", fg="white", command=fetch_reports)
+refresh_btn.grid(row=0, column=0, padx=10)
+tk.Button(reports_frame, text="Verify Stats", command=verify_stats).grid(row=0, column=1, padx=5)
+tk.Button(reports_frame, text="Rebuild Stats", command=rebuild_stats).grid(row=0, column=2, padx=5)
+
+reports_tree = ttk.Treeview(reports_tab, columns=("CourseID","CourseName","Enrollments","Grades"), show="headings")
+for col in ("CourseID","CourseName","Enrollments","Grades"):
+    reports_tree.heading(col, text=col)
+reports_tree.pack(fill="both", expand=True, pady=10, padx=10)
+load_label = tk.Label(reports_tab, anchor="w", fg="#555555")
+load_label.pack(fill="x", padx=10, pady=(0, 5))
+
 # -------------------------------
 # RUN APP
 # -------------------------------
+root.after(POLL_MS, poll_external_changes)
+tab_control.bind("<<NotebookTabChanged>>", on_tab_changed)
 root.mainloop()
+worker.shutdown()
+db.close()
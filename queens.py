@@ -0,0 +1,197 @@
+"""
+Bitmask N-Queens engine. A solution is a tuple of N columns, one per row;
+solutions() yields them lazily in lexicographic order, count(n, prefix)
+counts them (a block of partial boards at a time with NumPy), and trace()
+records the search for replaying it.
+
+    python queens.py 14          count N = 14
+    python queens.py 6 --list    print every solution
+"""
+
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # count() still works, only slower
+    np = None
+
+BLOCK = 1 << 16  # partial boards expanded together in count(); keeps them in cache
+
+
+def check_size(n):
+    if n < 1:
+        raise ValueError(f"need at least a 1x1 board, got N={n}")
+
+
+def is_solution(cols):
+    n = len(cols)
+    return (sorted(cols) == list(range(n))
+            and len({r + c for r, c in enumerate(cols)}) == n
+            and len({r - c for r, c in enumerate(cols)}) == n)
+
+
+# --- Enumerate ---
+def solutions(n):
+    """Yield every solution as a tuple of columns, lowest columns first."""
+    check_size(n)
+    full = (1 << n) - 1
+    placed = [0] * n
+    # per row: attacked columns, attacks from the two diagonals, squares left to try
+    cols, left, right, todo = [0] * n, [0] * n, [0] * n, [0] * n
+    todo[0] = full
+    row = 0
+    while row >= 0:
+        free = todo[row]
+        if not free:
+            row -= 1
+            continue
+        bit = free & -free
+        todo[row] = free ^ bit
+        placed[row] = bit.bit_length() - 1
+        if row == n - 1:
+            yield tuple(placed)
+            continue
+        c, l, r = cols[row] | bit, (left[row] | bit) << 1 & full, (right[row] | bit) >> 1
+        row += 1
+        cols[row], left[row], right[row] = c, l, r
+        todo[row] = ~(c | l | r) & full
+
+
+def first(n):
+    return next(solutions(n), None)
+
+
+def trace(n, max_solutions=None, max_events=None):
+    """The search, move by move, as an array of ints: row * n + col when a
+    queen is placed, ~(row * n + col) when it is taken back.
+
+    A place on the last row completes a solution. The trace stops on the
+    board of the max_solutions-th solution, or after about max_events
+    events; by default it runs the whole search.
+    """
+    check_size(n)
+    full = (1 << n) - 1
+    events = array("i")
+    found = 0
+    placed = [0] * n
+    cols, left, right, todo = [0] * n, [0] * n, [0] * n, [0] * n
+    todo[0] = full
+    row = 0
+    while row >= 0:
+        if max_events is not None and len(events) >= max_events:
+            break
+        free = todo[row]
+        if not free:
+            row -= 1
+            if row >= 0:
+                events.append(~(row * n + placed[row]))
+            continue
+        bit = free & -free
+        todo[row] = free ^ bit
+        col = placed[row] = bit.bit_length() - 1
+        events.append(row * n + col)
+        if row == n - 1:
+            found += 1
+            if found == max_solutions:
+                break
+            events.append(~(row * n + col))
+            continue
+        c, l, r = cols[row] | bit, (left[row] | bit) << 1 & full, (right[row] | bit) >> 1
+        row += 1
+        cols[row], left[row], right[row] = c, l, r
+        todo[row] = ~(c | l | r) & full
+    return events
+
+
+# --- Count ---
+def place(n, prefix):
+    """(cols, left, right) masks for the row after `prefix`, or None if a
+    column is off the board or two of its queens attack each other."""
+    full = (1 << n) - 1
+    cols = left = right = 0
+    for col in prefix:
+        if not 0 <= col < n:
+            return None
+        bit = 1 << col
+        if (cols | left | right) & bit:
+            return None
+        cols, left, right = cols | bit, (left | bit) << 1 & full, (right | bit) >> 1
+    return cols, left, right
+
+def count(n, prefix=()):
+    """Number of solutions on an n x n board whose first rows hold the
+    columns in `prefix`."""
+    check_size(n)
+    masks = place(n, prefix)
+    if masks is None or len(prefix) > n:
+        return 0
+    row = len(prefix)
+    if row == n:
+        return 1
+    if np is None or n > 62:
+        return _count_loop(n, row, *masks)
+    dtype = np.int32 if n < 32 else np.int64
+    return _count_block(n, row, *(np.array([mask], dtype) for mask in masks))
+
+
+def _count_loop(n, row, cols, left, right):
+    full = (1 << n) - 1
+    free = ~(cols | left | right) & full
+    if row == n - 1:
+        return 1 if free else 0
+    total = 0
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += _count_loop(n, row + 1, cols | bit, (left | bit) << 1 & full, (right | bit) >> 1)
+    return total
+
+
+def _count_block(n, row, cols, left, right):
+    """Solutions below every partial board in the arrays, all at `row`."""
+    full = (1 << n) - 1
+    while True:
+        free = ~(cols | left | right) & full
+        if row == n - 1:
+            return int(np.count_nonzero(free))
+        # one child per free square: peel the lowest bit off every board at
+        # once, dropping boards as they run out of squares
+        children = []
+        while free.size:
+            keep = free != 0
+            cols, left, right, free = cols[keep], left[keep], right[keep], free[keep]
+            bit = free & -free
+            children.append((cols | bit, (left | bit) << 1 & full, (right | bit) >> 1))
+            free = free ^ bit
+        if not children:
+            return 0
+        cols, left, right = (np.concatenate(masks) for masks in zip(*children))
+        row += 1
+        if cols.size > BLOCK:
+            return sum(_count_block(n, row, cols[i:i + BLOCK], left[i:i + BLOCK], right[i:i + BLOCK])
+                       for i in range(0, cols.size, BLOCK))
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Count (or list) N-Queens solutions.")
+    parser.add_argument("n", type=int, nargs="?", default=14)
+    parser.add_argument("--list", action="store_true", help="print every solution instead of counting")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for cols in solutions(args.n):
+            print(" ".join(map(str, cols)))
+        return 0
+    started = time.perf_counter()
+    total = count(args.n)
+    print(f"N = {args.n}: {total:,} solutions in {time.perf_counter() - started:.2f}s"
+          f"{'' if np is not None else ' (no NumPy)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Min-conflicts local search for N-Queens: one solution for boards far too big
+to backtrack, N = 1,000,000 in seconds. solve() places the queens greedily,
+then repairs conflicted rows by swapping columns, so the board stays a
+permutation and only diagonals can clash.
+
+    python queens_local.py 1000000          solve, verify and time
+"""
+
+import random
+import sys
+from array import array
+
+import queens
+
+try:
+    import numpy as np
+except ImportError:  # the search works without it; scans and verify are slower
+    np = None
+
+GREEDY_TRIES = 30  # random columns tried per row before placing one anyway
+SAMPLE = 32        # swap partners weighed for each conflicted row
+NOISE = 0.1        # chance of making the best swap even when it adds conflicts
+RESTARTS = 1000    # small boards can get stuck; a fresh start is cheap there
+
+stats = {"greedy_conflicts": 0, "steps": 0, "restarts": 0}  # for the last solve
+
+
+# queens[row] is that row's column; diag and anti count the queens on every
+# diagonal (row + col) and anti-diagonal (row - col + n - 1), so a swap
+# updates the conflict counts in O(1). 12 bytes a row.
+class Board:
+    def __init__(self, n, seed=None):
+        queens.check_size(n)
+        self.n = n
+        self.rng = random.Random(seed)
+        self.queens = array("i", range(n))
+        self.diag = array("i", [0]) * (2 * n - 1)
+        self.anti = array("i", [0]) * (2 * n - 1)
+        self.pairs = 0  # attacking pairs, all on diagonals
+
+    def place_greedy(self):
+        n, q, diag, anti = self.n, self.queens, self.diag, self.anti
+        rand = self.rng.random
+        off = n - 1
+        pairs = 0
+        for row in range(n):
+            span = n - row
+            for _ in range(GREEDY_TRIES):
+                other = row + int(rand() * span)
+                col = q[other]
+                if not diag[row + col] and not anti[row - col + off]:
+                    break
+            q[other] = q[row]
+            q[row] = col
+            d, a = row + col, row - col + off
+            pairs += diag[d] + anti[a]
+            diag[d] += 1
+            anti[a] += 1
+        self.pairs = pairs
+
+    def swap(self, a, b):
+        """Swap the columns of rows a and b; returns the change in attacking pairs."""
+        q, diag, anti, off = self.queens, self.diag, self.anti, self.n - 1
+        ca, cb = q[a], q[b]
+        change = 0
+        d, e = a + ca, a - ca + off
+        diag[d] -= 1
+        anti[e] -= 1
+        change -= diag[d] + anti[e]
+        d, e = b + cb, b - cb + off
+        diag[d] -= 1
+        anti[e] -= 1
+        change -= diag[d] + anti[e]
+        d, e = a + cb, a - cb + off
+        change += diag[d] + anti[e]
+        diag[d] += 1
+        anti[e] += 1
+        d, e = b + ca, b - ca + off
+        change += diag[d] + anti[e]
+        diag[d] += 1
+        anti[e] += 1
+        q[a], q[b] = cb, ca
+        self.pairs += change
+        return change
+
+    def conflicts(self, row):
+        col = self.queens[row]
+        return self.diag[row + col] + self.anti[row - col + self.n - 1] - 2
+
+    def conflicted(self):
+        """Every row whose queen is attacked."""
+        n = self.n
+        if np is not None:
+            q = np.frombuffer(self.queens, np.int32)
+            rows = np.arange(n)
+            hit = ((np.frombuffer(self.diag, np.int32)[rows + q] > 1)
+                   | (np.frombuffer(self.anti, np.int32)[rows - q + n - 1] > 1))
+            return np.nonzero(hit)[0].tolist()
+        return [row for row in range(n) if self.conflicts(row)]
+
+    def repair(self, max_steps):
+        """Min-conflicts repair; True once no queen is attacked."""
+        n, rng = self.n, self.rng
+        rand = rng.random
+        todo = []
+        steps = 0
+        while self.pairs:
+            if not todo:
+                todo = self.conflicted()
+                rng.shuffle(todo)
+            row = todo.pop()
+            if not self.conflicts(row):
+                continue
+            steps += 1
+            if steps > max_steps:
+                break
+            # every other row on small boards, a random sample on big ones
+            others = range(n) if n <= 2 * SAMPLE else [int(rand() * n) for _ in range(SAMPLE)]
+            best, best_change, ties = None, None, 0
+            for other in others:
+                if other == row:
+                    continue
+                change = self.swap(row, other)
+                self.swap(row, other)
+                if best_change is None or change < best_change:
+                    best, best_change, ties = other, change, 1
+                elif change == best_change:
+                    ties += 1
+                    if rand() * ties < 1:  # an even pick among equally good swaps
+                        best = other
+            # sideways moves (no change) and the odd worse one keep the
+            # search from settling on a plateau or in a local minimum
+            if best is not None and (best_change <= 0 or rand() < NOISE):
+                self.swap(row, best)
+                for r in (row, best):
+                    if self.conflicts(r):
+                        todo.append(r)
+            else:
+                todo.insert(0, row)
+        stats["steps"] += steps
+        return not self.pairs
+
+
+def solve(n, seed=None, max_steps=None):
+    """One solution as an array("i") of columns, or None (N = 2 and 3 have
+    none; otherwise only if every restart ran out of steps).
+
+    max_steps is the repair steps allowed before starting over, 4N + 100 by
+    default.
+    """
+    queens.check_size(n)
+    stats.update(greedy_conflicts=0, steps=0, restarts=0)
+    if n in (2, 3):
+        return None
+    rng = random.Random(seed)
+    max_steps = max_steps or 4 * n + 100
+    for attempt in range(RESTARTS):
+        board = Board(n, rng.getrandbits(64))
+        board.place_greedy()
+        stats["greedy_conflicts"] = board.pairs
+        stats["restarts"] = attempt
+        if board.repair(max_steps):
+            return board.queens
+    return None
+
+
+def verify(cols):
+    """Whether cols (one column per row) is a solution, in O(N)."""
+    n = len(cols)
+    if np is not None:
+        q = np.asarray(cols, dtype=np.int64)
+        if n and (q.min() < 0 or q.max() >= n):
+            return False
+        rows = np.arange(n)
+        return all(np.bincount(line, minlength=1).max(initial=0) <= 1
+                   for line in (q, rows + q, rows - q + n - 1))
+    seen = [bytearray(n), bytearray(2 * n), bytearray(2 * n)]
+    for row, col in enumerate(cols):
+        if not 0 <= col < n:
+            return False
+        for marks, i in zip(seen, (col, row + col, row - col + n - 1)):
+            if marks[i]:
+                return False
+            marks[i] = 1
+    return True
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Find one N-Queens solution by min-conflicts local search.")
+    parser.add_argument("n", type=int, nargs="?", default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    cols = solve(args.n, args.seed)
+    seconds = time.perf_counter() - started
+    if cols is None:
+        print(f"N = {args.n}: no solution found in {seconds:.2f}s")
+        return 1
+    started = time.perf_counter()
+    ok = verify(cols)
+    print(f"N = {args.n}: solved in {seconds:.2f}s ({stats['greedy_conflicts']} attacking pairs after "
+          f"the greedy placement, {stats['steps']} repair steps, {stats['restarts']} restarts); "
+          f"{'verified' if ok else 'VERIFY FAILED'} in {time.perf_counter() - started:.2f}s")
+    print(f"rows 0-9 are in columns {list(cols[:10])}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Multi-core N-Queens counting: the first one or two rows split the search into
+work units, each counted with queens.count(n, prefix) on a process pool.
+
+    python queens_parallel.py 15 --workers 1,2,4,8    measure scaling
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import queens
+
+
+def work_units(n, split_rows=2):
+    """(prefix, weight) pairs, where the sum of weight * count(n, prefix)
+    over all pairs equals count(n).
+
+    A solution's mirror image starts in the other half of the first row, so
+    only the left half is searched, with weight 2. For odd N the middle
+    column is its own mirror, so its subtree is halved again on the second row.
+    """
+    queens.check_size(n)
+    if n == 1:
+        return [((0,), 1)]
+    half = n // 2
+    roots = [((col,), 2) for col in range(half)]
+    if n % 2:
+        roots += [((half, col), 2) for col in range(half)]
+    units = []
+    for prefix, weight in roots:
+        if len(prefix) < split_rows:
+            units += [(prefix + (col,), weight) for col in range(n)]
+        else:
+            units.append((prefix, weight))
+    return [(prefix, weight) for prefix, weight in units if queens.place(n, prefix) is not None]
+
+
+def _count_unit(n, prefix):
+    started = time.perf_counter()
+    found = queens.count(n, prefix)
+    return found, time.perf_counter() - started, os.getpid()
+
+
+def parallel_count(n, workers=None, split_rows=2):
+    """(number of solutions, report) counted on `workers` processes.
+
+    The report has the wall-clock seconds and, per worker process, how many
+    units it ran and how long it was busy.
+    """
+    units = work_units(n, split_rows)
+    workers = workers or os.cpu_count()
+    busy = {}  # pid -> [units, seconds]
+    total = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = {pool.submit(_count_unit, n, prefix): weight for prefix, weight in units}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, seconds, pid = future.result()
+                total += futures[future] * found
+                worker = busy.setdefault(pid, [0, 0.0])
+                worker[0] += 1
+                worker[1] += seconds
+    seconds = time.perf_counter() - started
+    return total, {
+        "n": n,
+        "solutions": total,
+        "units": len(units),
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "per_worker": [{"units": u, "busy_seconds": round(s, 3)}
+                       for u, s in sorted(busy.values(), key=lambda w: -w[1])],
+    }
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Count N-Queens solutions on several cores and measure scaling.")
+    parser.add_argument("n", type=int, nargs="?", default=14)
+    parser.add_argument("--workers", default=",".join(str(w) for w in (1, 2, 4, os.cpu_count())))
+    parser.add_argument("--split-rows", type=int, choices=(1, 2), default=2,
+                        help="rows fixed per work unit (2 gives more, smaller units)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    expected = queens.count(args.n)
+    serial = time.perf_counter() - started
+    report = {"n": args.n, "solutions": expected,
+              "serial": {"seconds": round(serial, 3)}, "parallel": []}
+    ok = True
+    for workers in sorted({int(w) for w in args.workers.split(",") if w}):
+        total, run = parallel_count(args.n, workers, args.split_rows)
+        ok = ok and total == expected
+        busy = [w["busy_seconds"] for w in run["per_worker"]]
+        run.update(speedup=round(serial / run["seconds"], 2) if run["seconds"] else None,
+                   balance=round(min(busy) / max(busy), 2) if busy and max(busy) else None)
+        del run["n"]
+        report["parallel"].append(run)
+    print(json.dumps(report, indent=2))
+    if not ok:
+        print("MISMATCH: a parallel count differs from the serial one")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+N-Queens solutions on disk, one byte per queen, in lexicographic order.
+SolutionStore memory-maps a file for random access (store[k]) and prefix
+lookups (find) without ever loading it whole.
+
+    python queens_store.py build 12          write queens_12.bin
+    python queens_store.py verify 12         check it against the search
+    python queens_store.py get 12 1000       print solution 1000
+    python queens_store.py prefix 12 0 2     print the solutions starting 0 2
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+import queens
+
+# the magic, the header, then N bytes per solution: each row's queen's column
+MAGIC = b"NQS\x00v1\r\n"
+HEADER = struct.Struct("<IQ")  # N, number of solutions
+DATA = len(MAGIC) + HEADER.size
+MAX_N = 255  # a column has to fit in a byte
+
+
+def default_path(n):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f"queens_{n}.bin")
+
+
+# --- Write ---
+class SolutionWriter:
+    """Appends solutions to a store file; close() fills in the count and
+    moves the finished file into place."""
+
+    def __init__(self, path, n):
+        if not 1 <= n <= MAX_N:
+            raise ValueError(f"the store holds boards up to {MAX_N}x{MAX_N}, got N={n}")
+        self.path, self.n = path, n
+        self.tmp = path + ".tmp"
+        self.file = open(self.tmp, "wb")
+        self.file.write(MAGIC + HEADER.pack(n, 0))
+        self.count = 0
+        self.buffer = bytearray()
+
+    def write(self, cols):
+        if len(cols) != self.n:
+            raise ValueError(f"a solution for N={self.n} needs {self.n} columns, got {len(cols)}")
+        self.buffer += bytes(cols)
+        self.count += 1
+        if len(self.buffer) >= 1 << 20:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+
+    def close(self):
+        self.file.write(self.buffer)
+        self.file.seek(len(MAGIC))
+        self.file.write(HEADER.pack(self.n, self.count))
+        self.file.close()
+        os.replace(self.tmp, self.path)
+
+
+def build(n, path=None):
+    """Write every solution for n; returns how many there are."""
+    writer = SolutionWriter(path or default_path(n), n)
+    try:
+        for cols in queens.solutions(n):
+            writer.write(cols)
+    except BaseException:
+        writer.file.close()
+        os.remove(writer.tmp)
+        raise
+    writer.close()
+    return writer.count
+
+
+# --- Read ---
+class SolutionStore:
+    """A store file, memory-mapped. Raises ValueError if it isn't one."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        ok = len(self.mapped) >= DATA and self.mapped[:len(MAGIC)] == MAGIC
+        if ok:
+            self.n, self.count = HEADER.unpack_from(self.mapped, len(MAGIC))
+            ok = len(self.mapped) == DATA + self.n * self.count
+        if not ok:
+            self.mapped.close()
+            raise ValueError(f"{path} is not an N-Queens solution store")
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self.count
+        if not 0 <= k < self.count:
+            raise IndexError(f"solution {k} of {self.count}")
+        start = DATA + k * self.n
+        return tuple(self.mapped[start:start + self.n])
+
+    def __iter__(self):
+        return self.iter_from(0)
+
+    def iter_from(self, k, stop=None):
+        """Solutions k, k + 1, ... up to stop (default: the end)."""
+        n, mapped = self.n, self.mapped
+        stop = self.count if stop is None else min(stop, self.count)
+        for start in range(DATA + k * n, DATA + stop * n, n):
+            yield tuple(mapped[start:start + n])
+
+    def _bound(self, key, upper):
+        # first solution whose leading len(key) columns are >= key (> key if upper)
+        lo, hi, size = 0, self.count, len(key)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = DATA + mid * self.n
+            head = self.mapped[start:start + size]
+            if head < key or (upper and head == key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, prefix):
+        """range of the indices of the solutions whose first rows hold the
+        columns in prefix."""
+        if len(prefix) > self.n or any(not 0 <= col < self.n for col in prefix):
+            return range(0)
+        key = bytes(prefix)
+        return range(self._bound(key, False), self._bound(key, True))
+
+    def matching(self, prefix):
+        found = self.find(prefix)
+        return self.iter_from(found.start, found.stop)
+
+    def close(self):
+        self.mapped.close()
+
+
+# --- Verify ---
+def verify(n, path=None):
+    """Check a store against the search; returns a list of problems."""
+    try:
+        store = SolutionStore(path or default_path(n))
+    except (OSError, ValueError) as e:
+        return [str(e)]
+    try:
+        if store.n != n:
+            return [f"store is for N={store.n}"]
+        problems = []
+        k = -1
+        for k, (stored, expected) in enumerate(zip(store, queens.solutions(n))):
+            if stored != expected:
+                problems.append((k, stored, expected))
+        if k + 1 != len(store) or len(store) != queens.count(n):
+            problems.append(f"{len(store)} solutions stored, {queens.count(n)} exist")
+        # prefix lookups against the first rows, for every one- and two-row prefix
+        for first in range(n):
+            for prefix in [(first,)] + [(first, second) for second in range(n)]:
+                if len(store.find(prefix)) != queens.count(n, prefix):
+                    problems.append(("prefix", prefix))
+                elif any(cols[:len(prefix)] != prefix for cols in store.matching(prefix)):
+                    problems.append(("prefix", prefix))
+        return problems
+    finally:
+        store.close()
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build, check and read N-Queens solution stores")
+    parser.add_argument("command", choices=("build", "verify", "get", "prefix"))
+    parser.add_argument("n", type=int)
+    parser.add_argument("args", type=int, nargs="*", help="the index for get, the columns for prefix")
+    parser.add_argument("--path", help="default: queens_<N>.bin next to this file")
+    args = parser.parse_args(argv)
+    path = args.path or default_path(args.n)
+
+    started = time.perf_counter()
+    if args.command == "build":
+        count = build(args.n, path)
+        print(f"wrote {count:,} solutions to {path} ({DATA + args.n * count:,} bytes) "
+              f"in {time.perf_counter() - started:.2f}s")
+        return 0
+    if args.command == "verify":
+        problems = verify(args.n, path)
+        for problem in problems[:20]:
+            print(problem)
+        print(f"{'store OK' if not problems else f'{len(problems)} problems'} "
+              f"in {time.perf_counter() - started:.2f}s")
+        return 1 if problems else 0
+
+    try:
+        store = SolutionStore(path)
+    except (OSError, ValueError) as e:
+        print(f"can't open the store: {e}", file=sys.stderr)
+        return 1
+    try:
+        if args.command == "get":
+            for k in args.args or [0]:
+                try:
+                    cols = store[k]
+                except IndexError:
+                    print(f"no solution {k}: {path} holds {len(store):,}", file=sys.stderr)
+                    return 1
+                print(k, " ".join(map(str, cols)))
+        else:
+            found = store.find(tuple(args.args))
+            for k, cols in zip(found, store.matching(tuple(args.args))):
+                print(k, " ".join(map(str, cols)))
+            print(f"{len(found):,} solutions start with {args.args}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
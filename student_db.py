@@ -0,0 +1,825 @@
+"""
+Data-access layer for the Student Management System: the schema, a small
+connection pool and one repository per table.
+
+    db = StudentDB("students.db")
+    db.students.add(1, "Asha", 20, "F", "asha@example.com")
+    rows = db.students.all()
+"""
+
+import queue
+import sqlite3
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+DB_PATH = "students.db"
+POOL_SIZE = 4
+STATEMENT_CACHE = 256
+
+# -------------------------------
+# SCHEMA
+# -------------------------------
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS Students (
+        StudentID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Age INTEGER,
+        Gender TEXT,
+        Email TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Courses (
+        CourseID INTEGER PRIMARY KEY,
+        CourseName TEXT,
+        Duration INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Enrollments (
+        EnrollmentID INTEGER PRIMARY KEY,
+        StudentID INTEGER,
+        CourseID INTEGER,
+        Grade TEXT,
+        FOREIGN KEY (StudentID) REFERENCES Students(StudentID),
+        FOREIGN KEY (CourseID) REFERENCES Courses(CourseID)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ChangeLog (
+        Seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        TableName TEXT NOT NULL,
+        RowKey INTEGER NOT NULL,
+        Op TEXT NOT NULL
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS ChangeLogPause (Paused INTEGER)",
+]
+
+# Every write to a tracked table appends (table, key, op) to ChangeLog, so a
+# view can catch up from its last seen Seq instead of re-reading the table.
+# Op is 'I', 'U' or 'D'; changing a primary key is logged as 'D' + 'I'.
+# Bulk writers use untracked(), which logs a single 'R' (reload) instead.
+TRACKED = {"Students": "StudentID", "Courses": "CourseID", "Enrollments": "EnrollmentID"}
+CHANGELOG_KEEP = 100000
+
+for _table, _key in TRACKED.items():
+    SCHEMA += [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_table}_log_insert AFTER INSERT ON {_table}
+        WHEN NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+        BEGIN
+            INSERT INTO ChangeLog (TableName, RowKey, Op) VALUES ('{_table}', NEW.{_key}, 'I');
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_table}_log_update AFTER UPDATE ON {_table}
+        WHEN OLD.{_key} = NEW.{_key} AND NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+        BEGIN
+            INSERT INTO ChangeLog (TableName, RowKey, Op) VALUES ('{_table}', NEW.{_key}, 'U');
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_table}_log_rekey AFTER UPDATE ON {_table}
+        WHEN OLD.{_key} <> NEW.{_key} AND NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+        BEGIN
+            INSERT INTO ChangeLog (TableName, RowKey, Op) VALUES ('{_table}', OLD.{_key}, 'D');
+            INSERT INTO ChangeLog (TableName, RowKey, Op) VALUES ('{_table}', NEW.{_key}, 'I');
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_table}_log_delete AFTER DELETE ON {_table}
+        WHEN NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+        BEGIN
+            INSERT INTO ChangeLog (TableName, RowKey, Op) VALUES ('{_table}', OLD.{_key}, 'D');
+        END
+        """,
+    ]
+
+# -------------------------------
+# MIGRATIONS
+# -------------------------------
+# Run in order on top of SCHEMA; PRAGMA user_version records how many have
+# been applied. Append new steps, never edit old ones.
+MIGRATIONS = [
+    # 1: secondary indexes for the Enrollments join, grade filters and
+    #    course name prefix search
+    [
+        "CREATE INDEX IF NOT EXISTS idx_enrollments_student ON Enrollments(StudentID)",
+        "CREATE INDEX IF NOT EXISTS idx_enrollments_course ON Enrollments(CourseID)",
+        "CREATE INDEX IF NOT EXISTS idx_enrollments_grade ON Enrollments(Grade)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_name ON Courses(CourseName COLLATE NOCASE)",
+    ],
+    # 2: FTS5 index over student Name/Email, kept in sync by triggers.
+    #    Skipped when SQLite is built without FTS5; search then falls back
+    #    to LIKE.
+    [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS StudentSearch USING fts5(
+            Name, Email, content='Students', content_rowid='StudentID', prefix='2 3'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS Students_fts_insert AFTER INSERT ON Students
+        BEGIN
+            INSERT INTO StudentSearch (rowid, Name, Email) VALUES (NEW.StudentID, NEW.Name, NEW.Email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS Students_fts_delete AFTER DELETE ON Students
+        BEGIN
+            INSERT INTO StudentSearch (StudentSearch, rowid, Name, Email)
+            VALUES ('delete', OLD.StudentID, OLD.Name, OLD.Email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS Students_fts_update AFTER UPDATE ON Students
+        BEGIN
+            INSERT INTO StudentSearch (StudentSearch, rowid, Name, Email)
+            VALUES ('delete', OLD.StudentID, OLD.Name, OLD.Email);
+            INSERT INTO StudentSearch (rowid, Name, Email) VALUES (NEW.StudentID, NEW.Name, NEW.Email);
+        END
+        """,
+        "INSERT INTO StudentSearch (StudentSearch) VALUES ('rebuild')",
+    ],
+]
+FTS_MIGRATION = 2
+
+# -------------------------------
+# STATISTICS
+# -------------------------------
+# Per-course enrollment counts, per-course grade distribution and
+# per-student course load, kept current by triggers on Enrollments so that
+# reports read O(courses) rows instead of aggregating all enrollments.
+# A NULL grade is counted under ''. Rows whose count drops to 0 are removed,
+# so the tables always equal a GROUP BY over Enrollments. Bulk loads inside
+# untracked() skip the triggers and call add_stats() once per batch instead.
+STATS_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS CourseStats (
+        CourseID INTEGER PRIMARY KEY,
+        Enrollments INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS CourseGradeStats (
+        CourseID INTEGER NOT NULL,
+        Grade TEXT NOT NULL,
+        Count INTEGER NOT NULL,
+        PRIMARY KEY (CourseID, Grade)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS StudentLoad (
+        StudentID INTEGER PRIMARY KEY,
+        Courses INTEGER NOT NULL
+    )
+    """,
+]
+
+
+def _stats_delta(row, delta):
+    # statements adding `delta` for the OLD or NEW enrollment row
+    return f"""
+        INSERT INTO CourseStats (CourseID, Enrollments) VALUES ({row}.CourseID, {delta})
+        ON CONFLICT (CourseID) DO UPDATE SET Enrollments = Enrollments + {delta};
+        INSERT INTO CourseGradeStats (CourseID, Grade, Count)
+        VALUES ({row}.CourseID, coalesce({row}.Grade, ''), {delta})
+        ON CONFLICT (CourseID, Grade) DO UPDATE SET Count = Count + {delta};
+        INSERT INTO StudentLoad (StudentID, Courses) VALUES ({row}.StudentID, {delta})
+        ON CONFLICT (StudentID) DO UPDATE SET Courses = Courses + {delta};
+    """
+
+
+_STATS_CLEANUP = """
+        DELETE FROM CourseStats WHERE CourseID = OLD.CourseID AND Enrollments = 0;
+        DELETE FROM CourseGradeStats
+        WHERE CourseID = OLD.CourseID AND Grade = coalesce(OLD.Grade, '') AND Count = 0;
+        DELETE FROM StudentLoad WHERE StudentID = OLD.StudentID AND Courses = 0;
+"""
+
+STATS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Enrollments_stats_insert AFTER INSERT ON Enrollments
+    WHEN NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+    BEGIN
+        {_stats_delta("NEW", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Enrollments_stats_delete AFTER DELETE ON Enrollments
+    WHEN NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+    BEGIN
+        {_stats_delta("OLD", -1)}
+        {_STATS_CLEANUP}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Enrollments_stats_update AFTER UPDATE OF StudentID, CourseID, Grade ON Enrollments
+    WHEN NOT EXISTS (SELECT 1 FROM ChangeLogPause)
+    BEGIN
+        {_stats_delta("OLD", -1)}
+        {_stats_delta("NEW", 1)}
+        {_STATS_CLEANUP}
+    END
+    """,
+]
+
+# The same aggregates computed from scratch
+STATS_FROM_ENROLLMENTS = {
+    "CourseStats": "SELECT CourseID, count(*) FROM Enrollments GROUP BY CourseID",
+    "CourseGradeStats": "SELECT CourseID, coalesce(Grade, ''), count(*) FROM Enrollments GROUP BY CourseID, coalesce(Grade, '')",
+    "StudentLoad": "SELECT StudentID, count(*) FROM Enrollments GROUP BY StudentID",
+}
+REBUILD_STATS = [
+    statement
+    for table, select in STATS_FROM_ENROLLMENTS.items()
+    for statement in (f"DELETE FROM {table}", f"INSERT INTO {table} {select}")
+]
+
+# 3: materialized statistics
+MIGRATIONS.append(STATS_SCHEMA + STATS_TRIGGERS + REBUILD_STATS)
+
+ADD_COURSE_STATS = """
+    INSERT INTO CourseStats (CourseID, Enrollments) VALUES (?, ?)
+    ON CONFLICT (CourseID) DO UPDATE SET Enrollments = Enrollments + excluded.Enrollments
+"""
+ADD_GRADE_STATS = """
+    INSERT INTO CourseGradeStats (CourseID, Grade, Count) VALUES (?, ?, ?)
+    ON CONFLICT (CourseID, Grade) DO UPDATE SET Count = Count + excluded.Count
+"""
+ADD_LOAD_STATS = """
+    INSERT INTO StudentLoad (StudentID, Courses) VALUES (?, ?)
+    ON CONFLICT (StudentID) DO UPDATE SET Courses = Courses + excluded.Courses
+"""
+
+
+def add_stats(conn, enrollments):
+    """Count new (StudentID, CourseID, Grade) rows into the statistics tables.
+
+    For bulk inserts made inside untracked(), where the per-row stats
+    triggers are skipped: the batch is aggregated here and each affected
+    course, grade and student is updated once.
+    """
+    courses, grades, loads = Counter(), Counter(), Counter()
+    for student, course, grade in enrollments:
+        courses[course] += 1
+        grades[course, grade if grade is not None else ""] += 1
+        loads[student] += 1
+    conn.executemany(ADD_COURSE_STATS, courses.items())
+    conn.executemany(ADD_GRADE_STATS, ((c, g, n) for (c, g), n in grades.items()))
+    conn.executemany(ADD_LOAD_STATS, loads.items())
+
+# Applied to every connection. WAL lets readers run while a writer commits,
+# synchronous=NORMAL is safe under WAL and avoids an fsync per commit, and a
+# negative cache_size is in KiB (~32 MB page cache per connection).
+PRAGMAS = [
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -32000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+]
+
+# SQL is kept in module constants so every call passes the identical string
+# and hits sqlite3's per-connection prepared statement cache.
+INSERT_STUDENT = "INSERT INTO Students (StudentID, Name, Age, Gender, Email) VALUES (?, ?, ?, ?, ?)"
+SELECT_STUDENTS = "SELECT StudentID, Name, Age, Gender, Email FROM Students"
+SELECT_STUDENT = SELECT_STUDENTS + " WHERE StudentID = ?"
+
+INSERT_COURSE = "INSERT INTO Courses (CourseID, CourseName, Duration) VALUES (?, ?, ?)"
+SELECT_COURSES = "SELECT CourseID, CourseName, Duration FROM Courses"
+SELECT_COURSE = SELECT_COURSES + " WHERE CourseID = ?"
+
+INSERT_ENROLLMENT = "INSERT INTO Enrollments (EnrollmentID, StudentID, CourseID, Grade) VALUES (?, ?, ?, ?)"
+SELECT_ENROLLMENTS = """
+    SELECT e.EnrollmentID, s.Name, c.CourseName, e.Grade
+    FROM Enrollments e
+    JOIN Students s ON e.StudentID = s.StudentID
+    JOIN Courses c ON e.CourseID = c.CourseID
+"""
+SEARCH_LIMIT = 500
+SEARCH_STUDENTS_FTS = SELECT_STUDENTS + """
+    WHERE StudentID IN (SELECT rowid FROM StudentSearch WHERE StudentSearch MATCH ?)
+       OR StudentID = ?
+    ORDER BY StudentID LIMIT ?
+"""
+SEARCH_STUDENTS_LIKE = SELECT_STUDENTS + """
+    WHERE Name LIKE ? ESCAPE '\\' OR Email LIKE ? ESCAPE '\\' OR StudentID = ?
+    ORDER BY StudentID LIMIT ?
+"""
+SEARCH_COURSES = SELECT_COURSES + """
+    WHERE CourseName LIKE ? ESCAPE '\\' OR CourseID = ?
+    ORDER BY CourseID LIMIT ?
+"""
+# matches on grade, on the course name prefix, or on the student's name/email
+SEARCH_ENROLLMENTS = SELECT_ENROLLMENTS + """
+    WHERE e.Grade = ?
+       OR e.CourseID IN (SELECT CourseID FROM Courses WHERE CourseName LIKE ? ESCAPE '\\')
+       OR e.StudentID IN ({students})
+    ORDER BY e.EnrollmentID LIMIT ?
+"""
+MATCHING_STUDENTS_FTS = "SELECT rowid FROM StudentSearch WHERE StudentSearch MATCH ?"
+MATCHING_STUDENTS_LIKE = "SELECT StudentID FROM Students WHERE Name LIKE ? ESCAPE '\\' OR Email LIKE ? ESCAPE '\\'"
+
+SELECT_CHANGES = "SELECT Seq, TableName, RowKey, Op FROM ChangeLog WHERE Seq > ? ORDER BY Seq"
+SELECT_TABLE_CHANGES = "SELECT Seq, RowKey, Op FROM ChangeLog WHERE TableName = ? AND Seq > ? ORDER BY Seq"
+# AUTOINCREMENT keeps the highest Seq ever used in sqlite_sequence, so both
+# still hold after pruning has emptied the log
+SELECT_LAST_CHANGE = "SELECT coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'ChangeLog'), 0)"
+SELECT_FIRST_CHANGE = """
+    SELECT coalesce((SELECT min(Seq) FROM ChangeLog),
+                    (SELECT seq + 1 FROM sqlite_sequence WHERE name = 'ChangeLog'), 0)
+"""
+PRUNE_CHANGES = "DELETE FROM ChangeLog WHERE Seq <= ?"
+LOG_RELOAD = "INSERT INTO ChangeLog (TableName, RowKey, Op) VALUES (?, 0, 'R')"
+
+# Keep IN (...) lists under SQLite's default host parameter limit.
+MAX_PARAMS = 500
+
+SELECT_ENROLLMENT = "SELECT EnrollmentID, StudentID, CourseID, Grade FROM Enrollments WHERE EnrollmentID = ?"
+
+# Smallest SQLite integer; the first keyset page is "everything after MIN_KEY".
+MIN_KEY = -(1 << 63)
+
+
+def like_prefix(term):
+    """LIKE pattern matching values that start with `term` (ESCAPE '\\')."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def fts_prefix_query(term):
+    """FTS5 query where every word of `term` must prefix-match Name or Email."""
+    words = term.replace('"', " ").split()
+    return " ".join(f'"{w}"*' for w in words) or '""'
+
+
+def int_or_none(term):
+    try:
+        return int(term)
+    except ValueError:
+        return None
+
+
+def connect(path=DB_PATH):
+    # isolation_level=None puts the connection in autocommit mode; write
+    # transactions are opened explicitly by ConnectionPool.write().
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False,
+                           cached_statements=STATEMENT_CACHE)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@contextmanager
+def untracked(conn, table):
+    """Skip the per-row ChangeLog and statistics triggers inside a write transaction.
+
+    Meant for bulk loads, where the triggers would cost more than the
+    insert itself. One 'R' entry is logged for `table` instead, telling
+    views to reload it; inserts into Enrollments must be passed to
+    add_stats() by the caller.
+    """
+    conn.execute("INSERT INTO ChangeLogPause VALUES (1)")
+    try:
+        yield conn
+    finally:
+        conn.execute("DELETE FROM ChangeLogPause")
+    conn.execute(LOG_RELOAD, (table,))
+
+
+def fts5_available(conn):
+    return bool(conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0])
+
+
+# -------------------------------
+# CONNECTION POOL
+# -------------------------------
+class ConnectionPool:
+    """One writer connection plus up to `size` reader connections.
+
+    SQLite allows a single writer at a time, so writes are serialized on a
+    lock. Under WAL, readers use their own connections and never wait on it.
+    An in-memory database cannot be shared between connections, so in that
+    case reads go through the writer connection instead.
+    """
+
+    def __init__(self, path=DB_PATH, size=POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._memory = path == ":memory:"
+        self._write_lock = threading.RLock()
+        self._writer = connect(path)
+        if not self._memory:
+            self._writer.execute("PRAGMA journal_mode = WAL")
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._open_lock = threading.Lock()
+        self._closed = False
+
+    def _acquire_reader(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if self._opened < self.size:
+                self._opened += 1
+                return connect(self.path)
+        return self._idle.get()
+
+    @contextmanager
+    def writer(self):
+        """The writer connection, held under the write lock but with no
+        transaction opened, for statements that must run on it."""
+        with self._write_lock:
+            yield self._writer
+
+    @contextmanager
+    def read(self):
+        if self._memory:
+            with self.writer() as conn:
+                yield conn
+            return
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    @contextmanager
+    def write(self, foreign_keys=True):
+        """Run the block in a single IMMEDIATE transaction on the writer.
+
+        foreign_keys=False turns off SQLite's per-row FK enforcement for the
+        transaction, for bulk writers that have already checked the keys.
+        """
+        with self._write_lock:
+            conn = self._writer
+            if conn.in_transaction:
+                # nested use joins the outer transaction
+                yield conn
+                return
+            if not foreign_keys:
+                conn.execute("PRAGMA foreign_keys = OFF")
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            finally:
+                if not foreign_keys:
+                    conn.execute("PRAGMA foreign_keys = ON")
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self._writer.close()
+
+
+# -------------------------------
+# REPOSITORIES
+# -------------------------------
+class Repository:
+    """Shared read paths. Subclasses set TABLE, KEY and SELECT.
+
+    Pages are fetched by keyset (WHERE key > last seen key ... LIMIT n) rather
+    than OFFSET, so reading any page costs O(page) no matter how deep it is.
+    """
+
+    TABLE = KEY = SELECT = None
+
+    def __init__(self, pool):
+        self.pool = pool
+        key = self.KEY
+        self._sql_all = f"{self.SELECT} ORDER BY {key}"
+        self._sql_after = f"{self.SELECT} WHERE {key} > ? ORDER BY {key} LIMIT ?"
+        self._sql_before = f"{self.SELECT} WHERE {key} < ? ORDER BY {key} DESC LIMIT ?"
+        self._sql_count = f"SELECT count(*) FROM {self.TABLE}"
+        self._sql_keys = f"{self.SELECT} WHERE {key} IN ({{}}) ORDER BY {key}"
+
+    def all(self):
+        with self.pool.read() as conn:
+            return conn.execute(self._sql_all).fetchall()
+
+    def count(self):
+        with self.pool.read() as conn:
+            return conn.execute(self._sql_count).fetchone()[0]
+
+    def page_after(self, key=None, limit=100):
+        """Up to `limit` rows with a key greater than `key`, ascending."""
+        if key is None:
+            key = MIN_KEY
+        with self.pool.read() as conn:
+            return conn.execute(self._sql_after, (key, limit)).fetchall()
+
+    def page_before(self, key, limit=100):
+        """Up to `limit` rows with a key less than `key`, ascending."""
+        with self.pool.read() as conn:
+            rows = conn.execute(self._sql_before, (key, limit)).fetchall()
+        rows.reverse()
+        return rows
+
+    def rows_for(self, keys):
+        """Display rows for just the given keys, ascending; missing keys are skipped."""
+        keys = sorted(set(keys))
+        rows = []
+        with self.pool.read() as conn:
+            for i in range(0, len(keys), MAX_PARAMS):
+                chunk = keys[i:i + MAX_PARAMS]
+                sql = self._sql_keys.format(",".join("?" * len(chunk)))
+                rows.extend(conn.execute(sql, chunk))
+        return rows
+
+
+class StudentRepository(Repository):
+    TABLE, KEY, SELECT = "Students", "StudentID", SELECT_STUDENTS
+
+    def __init__(self, pool, fts=True):
+        super().__init__(pool)
+        self.fts = fts
+
+    def search(self, term, limit=SEARCH_LIMIT):
+        """Students whose Name/Email words start with `term`'s words, or whose ID is `term`."""
+        term = term.strip()
+        if not term:
+            return []
+        with self.pool.read() as conn:
+            if self.fts:
+                return conn.execute(SEARCH_STUDENTS_FTS,
+                                    (fts_prefix_query(term), int_or_none(term), limit)).fetchall()
+            pattern = like_prefix(term)
+            return conn.execute(SEARCH_STUDENTS_LIKE,
+                                (pattern, pattern, int_or_none(term), limit)).fetchall()
+
+    def add(self, student_id, name, age, gender, email):
+        with self.pool.write() as conn:
+            conn.execute(INSERT_STUDENT, (student_id, name, age, gender, email))
+
+    def get(self, student_id):
+        with self.pool.read() as conn:
+            return conn.execute(SELECT_STUDENT, (student_id,)).fetchone()
+
+
+class CourseRepository(Repository):
+    TABLE, KEY, SELECT = "Courses", "CourseID", SELECT_COURSES
+
+    def search(self, term, limit=SEARCH_LIMIT):
+        """Courses whose name starts with `term` (any case), or whose ID is `term`."""
+        term = term.strip()
+        if not term:
+            return []
+        with self.pool.read() as conn:
+            return conn.execute(SEARCH_COURSES, (like_prefix(term), int_or_none(term), limit)).fetchall()
+
+    def add(self, course_id, course_name, duration):
+        with self.pool.write() as conn:
+            conn.execute(INSERT_COURSE, (course_id, course_name, duration))
+
+    def get(self, course_id):
+        with self.pool.read() as conn:
+            return conn.execute(SELECT_COURSE, (course_id,)).fetchone()
+
+
+class EnrollmentRepository(Repository):
+    # Rows are (EnrollmentID, student name, course name, grade), as shown in the GUI.
+    TABLE, KEY, SELECT = "Enrollments", "e.EnrollmentID", SELECT_ENROLLMENTS
+
+    def __init__(self, pool, fts=True):
+        super().__init__(pool)
+        self.fts = fts
+        self._sql_search = SEARCH_ENROLLMENTS.format(
+            students=MATCHING_STUDENTS_FTS if fts else MATCHING_STUDENTS_LIKE)
+
+    def search(self, term, limit=SEARCH_LIMIT):
+        """Enrollments with grade `term`, or whose course or student matches it as a prefix."""
+        term = term.strip()
+        if not term:
+            return []
+        pattern = like_prefix(term)
+        students = (fts_prefix_query(term),) if self.fts else (pattern, pattern)
+        with self.pool.read() as conn:
+            return conn.execute(self._sql_search, (term, pattern) + students + (limit,)).fetchall()
+
+    def add(self, enrollment_id, student_id, course_id, grade):
+        with self.pool.write() as conn:
+            conn.execute(INSERT_ENROLLMENT, (enrollment_id, student_id, course_id, grade))
+
+    def get(self, enrollment_id):
+        with self.pool.read() as conn:
+            return conn.execute(SELECT_ENROLLMENT, (enrollment_id,)).fetchone()
+
+
+class StatsRepository:
+    """Reads the trigger-maintained statistics tables."""
+
+    COURSE_REPORT = """
+        SELECT c.CourseID, c.CourseName, coalesce(s.Enrollments, 0),
+               (SELECT group_concat(g.Grade || ': ' || g.Count, '  ')
+                FROM (SELECT Grade, Count FROM CourseGradeStats
+                      WHERE CourseID = c.CourseID ORDER BY Grade) g)
+        FROM Courses c
+        LEFT JOIN CourseStats s ON s.CourseID = c.CourseID
+        ORDER BY c.CourseID
+    """
+    LOAD_SUMMARY = "SELECT count(*), coalesce(avg(Courses), 0), coalesce(max(Courses), 0) FROM StudentLoad"
+    GRADES = "SELECT Grade, Count FROM CourseGradeStats WHERE CourseID = ? ORDER BY Grade"
+    LOAD = "SELECT Courses FROM StudentLoad WHERE StudentID = ?"
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def course_report(self):
+        """(CourseID, CourseName, enrollments, "A: n  B: m ...") for every course."""
+        with self.pool.read() as conn:
+            return conn.execute(self.COURSE_REPORT).fetchall()
+
+    def grade_distribution(self, course_id):
+        with self.pool.read() as conn:
+            return dict(conn.execute(self.GRADES, (course_id,)))
+
+    def course_load(self, student_id):
+        with self.pool.read() as conn:
+            row = conn.execute(self.LOAD, (student_id,)).fetchone()
+            return row[0] if row else 0
+
+    def load_summary(self):
+        """(students with enrollments, average course load, largest course load)"""
+        with self.pool.read() as conn:
+            return conn.execute(self.LOAD_SUMMARY).fetchone()
+
+    def rebuild(self):
+        with self.pool.write() as conn:
+            for statement in REBUILD_STATS:
+                conn.execute(statement)
+
+    def verify(self):
+        """Compare the stats tables with a fresh GROUP BY; returns mismatch messages."""
+        problems = []
+        with self.pool.read() as conn:
+            for table, select in STATS_FROM_ENROLLMENTS.items():
+                stored = f"SELECT * FROM {table}"
+                for label, query in (("missing from", f"{select} EXCEPT {stored}"),
+                                     ("stale in", f"{stored} EXCEPT {select}")):
+                    for row in conn.execute(query + " LIMIT 10"):
+                        problems.append(f"{label} {table}: {row}")
+        return problems
+
+
+class StudentDB:
+    """Entry point: creates the schema and exposes one repository per table."""
+
+    def __init__(self, path=DB_PATH, pool_size=POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+        self.init_schema()
+        self.prune_changes()
+        self.fts = self.has_table("StudentSearch")
+        self.students = StudentRepository(self.pool, self.fts)
+        self.courses = CourseRepository(self.pool)
+        self.enrollments = EnrollmentRepository(self.pool, self.fts)
+        self.stats = StatsRepository(self.pool)
+
+    def init_schema(self):
+        with self.pool.write() as conn:
+            for ddl in SCHEMA:
+                conn.execute(ddl)
+        self.migrate()
+
+    def migrate(self):
+        """Apply MIGRATIONS past PRAGMA user_version, each in its own transaction."""
+        with self.pool.write() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, steps in enumerate(MIGRATIONS[version:], version + 1):
+            with self.pool.write() as conn:
+                if number != FTS_MIGRATION or fts5_available(conn):
+                    for ddl in steps:
+                        conn.execute(ddl)
+                conn.execute(f"PRAGMA user_version = {number}")
+
+    def has_table(self, name):
+        with self.pool.read() as conn:
+            return conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone() is not None
+
+    def explain(self, sql, params=()):
+        """The detail column of EXPLAIN QUERY PLAN for `sql`."""
+        with self.pool.read() as conn:
+            return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+    # --- change tracking ---
+    def data_version(self):
+        """PRAGMA data_version of the writer connection.
+
+        The value only moves when *another* connection commits, so a change
+        means some external process wrote to the database.
+        """
+        with self.pool.writer() as conn:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def last_change(self):
+        with self.pool.read() as conn:
+            return conn.execute(SELECT_LAST_CHANGE).fetchone()[0]
+
+    def changes_since(self, seq, table=None):
+        """ChangeLog entries after `seq`, oldest first.
+
+        Returns (Seq, TableName, RowKey, Op) rows, or (Seq, RowKey, Op) rows
+        when `table` is given. Returns None if entries after `seq` have
+        already been pruned, in which case the caller has to reload.
+        """
+        with self.pool.read() as conn:
+            first = conn.execute(SELECT_FIRST_CHANGE).fetchone()[0]
+            if first > seq + 1:
+                return None
+            if table is None:
+                return conn.execute(SELECT_CHANGES, (seq,)).fetchall()
+            return conn.execute(SELECT_TABLE_CHANGES, (table, seq)).fetchall()
+
+    def prune_changes(self, keep=CHANGELOG_KEEP):
+        with self.pool.write() as conn:
+            last = conn.execute(SELECT_LAST_CHANGE).fetchone()[0]
+            conn.execute(PRUNE_CHANGES, (last - keep,))
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -------------------------------
+# QUERY PLAN CHECKS
+# -------------------------------
+# (description, sql, params, text that must appear in EXPLAIN QUERY PLAN)
+PLAN_CHECKS = [
+    ("enrollments by student", "SELECT * FROM Enrollments WHERE StudentID = ?", (1,),
+     "USING INDEX idx_enrollments_student"),
+    ("enrollments by course", "SELECT * FROM Enrollments WHERE CourseID = ?", (1,),
+     "USING INDEX idx_enrollments_course"),
+    ("enrollments by grade", "SELECT * FROM Enrollments WHERE Grade = ?", ("A",),
+     "USING INDEX idx_enrollments_grade"),
+    ("course name prefix", SEARCH_COURSES, ("ab%", None, SEARCH_LIMIT),
+     "USING INDEX idx_courses_name"),
+    ("student join from a course", SELECT_ENROLLMENTS + " WHERE c.CourseID = ?", (1,),
+     "USING INDEX idx_enrollments_course"),
+]
+FTS_PLAN_CHECKS = [
+    ("student name/email search", SEARCH_STUDENTS_FTS, ('"ab"*', None, SEARCH_LIMIT),
+     "VIRTUAL TABLE INDEX"),
+]
+
+
+def check_query_plans(db):
+    """Run PLAN_CHECKS against `db`; returns a list of failure messages."""
+    checks = PLAN_CHECKS + (FTS_PLAN_CHECKS if db.fts else [])
+    failures = []
+    for description, sql, params, expected in checks:
+        plan = db.explain(sql, params)
+        if not any(expected in line for line in plan):
+            failures.append(f"{description}: expected {expected!r} in {plan}")
+    return failures
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Maintenance commands for students.db")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("command", choices=("check-plans", "verify-stats", "rebuild-stats"),
+                        help="check-plans: hot queries must use their indexes; "
+                             "verify-stats / rebuild-stats: compare / recompute the statistics tables")
+    args = parser.parse_args(argv)
+
+    with StudentDB(args.db) as db:
+        if args.command == "rebuild-stats":
+            db.stats.rebuild()
+            print("statistics rebuilt")
+            return 0
+        if args.command == "verify-stats":
+            problems = db.stats.verify()
+        else:
+            problems = check_query_plans(db)
+    for problem in problems:
+        print("FAIL", problem)
+    print(f"{args.command}: OK" if not problems else f"{args.command}: {len(problems)} problem(s)")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+import bulk_io
+from student_db import StudentDB
+
+
+class CsvRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = StudentDB(self.path("src.db"))
+        self.dst = StudentDB(self.path("dst.db"))
+        self.addCleanup(self.src.close)
+        self.addCleanup(self.dst.close)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_nulls_survive_export_and_import(self):
+        self.src.students.add(1, "Asha", None, "F", None)
+        self.src.students.add(2, "Ben", 20, "M", "ben@example.com")
+        self.src.courses.add(1, "Math", None)
+        self.src.enrollments.add(1, 1, 1, None)
+        self.src.enrollments.add(2, 2, 1, "A")
+        for name in ("students", "courses", "enrollments"):
+            bulk_io.export_file(self.src, name, self.path(name + ".csv"))
+            report = bulk_io.import_file(self.dst, name, self.path(name + ".csv"))
+            self.assertEqual(report.rejected, 0, report.samples)
+        self.assertEqual(self.dst.students.all(), self.src.students.all())
+        self.assertEqual(self.dst.courses.all(), self.src.courses.all())
+        self.assertEqual(self.dst.enrollments.all(), self.src.enrollments.all())
+        self.assertEqual(self.dst.stats.verify(), [])
+
+    def test_empty_key_is_rejected(self):
+        with open(self.path("students.csv"), "w", newline="") as f:
+            f.write("StudentID,Name,Age,Gender,Email\n,Asha,20,F,\n3,Cy,x,M,\n")
+        report = bulk_io.import_file(self.dst, "students", self.path("students.csv"))
+        self.assertEqual((report.inserted, report.rejected), (0, 2))
+        self.assertEqual(report.samples[0][1], "StudentID is required")
+
+
+if __name__ == "__main__":
+    unittest.main()
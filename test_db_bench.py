@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+
+import db_bench
+
+SMALL = ["--students", "30", "--courses", "4", "--enrollments", "60"]
+STATS = {"calls": int, "seconds": float, "rows": int}
+
+
+class DBBenchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def bench(self, *args):
+        out = os.path.join(self.tmp.name, "run.json")
+        status = db_bench.main(SMALL + ["--dir", self.tmp.name, "--out", out] + list(args))
+        self.assertEqual(status, 0)
+        with open(out) as f:
+            return json.load(f)
+
+    def test_report(self):
+        report = self.bench("--inserts", "3", "--repeat", "2")
+        self.assertEqual(report["sizes"], {"students": 30, "courses": 4, "enrollments": 60})
+        self.assertEqual({name: stats["rows"] for name, stats in report["populate"].items()},
+                         {"students": 30, "courses": 4, "enrollments": 60})
+        self.assertIn("fetch_enrollments_join_full", report["operations"])
+        self.assertEqual(report["operations"]["add_student"]["calls"], 3)
+        for name, stats in report["operations"].items():
+            with self.subTest(operation=name):
+                for key, kind in STATS.items():
+                    self.assertIsInstance(stats[key], kind)
+                self.assertIsInstance(stats["p50_ms"], float)
+                self.assertIsInstance(stats["p99_ms"], float)
+                self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+        # the scratch directory is removed unless --keep is given
+        self.assertEqual(os.listdir(self.tmp.name), ["run.json"])
+
+    def test_zero_counts(self):
+        report = self.bench("--inserts", "0", "--repeat", "0", "--skip-full")
+        self.assertNotIn("fetch_students_full", report["operations"])
+        for name, stats in report["operations"].items():
+            with self.subTest(operation=name):
+                self.assertEqual(stats["calls"], 0)
+                self.assertIsNone(stats["p50_ms"])
+                self.assertIsNone(stats["p99_ms"])
+                self.assertIsNone(stats["ops_per_sec"])
+
+    def test_compare_skips_unmeasured_operations(self):
+        report = self.bench("--inserts", "0", "--repeat", "1", "--skip-full")
+        baseline = {"operations": {name: {"p50_ms": 1e-9} for name in report["operations"]}}
+        regressions = db_bench.compare(report, baseline, threshold=1.5)
+        self.assertNotIn("add_student", regressions)
+        self.assertIn("get_student", regressions)
+
+    def test_rejects_negative_and_empty_sizes(self):
+        for args in (["--inserts", "-1"], ["--repeat", "-1"], ["--students", "0"]):
+            with self.subTest(args=args), self.assertRaises(SystemExit):
+                db_bench.main(SMALL + args)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import random
+import unittest
+
+from ht_maze import ALGORITHMS, generate
+from ht_paths import DistanceField
+
+
+class GenerateTest(unittest.TestCase):
+    def test_every_maze_is_solvable(self):
+        rng = random.Random(0)
+        for trial in range(100):
+            rows, cols = rng.randint(1, 40), rng.randint(2, 40)
+            density = rng.choice([0.0, 0.3, 0.5, 0.7, 1.0])
+            for name in ALGORITHMS:
+                with self.subTest(algorithm=name, seed=trial, size=(rows, cols), density=density):
+                    maze, treasure = generate(rows, cols, name, seed=trial, density=density)
+                    self.assertEqual(maze[0][0], 0)
+                    self.assertEqual(maze[treasure[0]][treasure[1]], 0)
+                    self.assertNotEqual(treasure, (0, 0))
+                    self.assertTrue(DistanceField(maze, treasure).reachable((0, 0)))
+
+    def test_same_seed_same_board(self):
+        for name in ALGORITHMS:
+            with self.subTest(algorithm=name):
+                self.assertEqual(generate(21, 30, name, seed=7), generate(21, 30, name, seed=7))
+
+    def test_rejects_bad_input(self):
+        with self.assertRaises(ValueError):
+            generate(1, 1)
+        with self.assertRaises(ValueError):
+            generate(10, 10, "prim")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+import ht_paths
+from ht_paths import ENGINES, DistanceField, available_engines, bfs_path, frontier_bfs_path
+
+
+def random_mazes(trials, seed=0):
+    """(maze, start, goal) on random grids of up to 40 x 40, start always open."""
+    rng = random.Random(seed)
+    for _ in range(trials):
+        rows, cols = rng.randint(1, 40), rng.randint(1, 40)
+        density = rng.choice([0.0, 0.2, 0.35, 0.5])
+        maze = [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+        start = (rng.randrange(rows), rng.randrange(cols))
+        goal = (rng.randrange(rows), rng.randrange(cols))
+        maze[start[0]][start[1]] = 0
+        yield maze, start, goal
+
+
+def is_path(maze, path, start, goal):
+    """True if path walks open cells one step at a time from start to goal."""
+    if path[0] != start or path[-1] != goal:
+        return False
+    for (r, c), (nr, nc) in zip(path, path[1:]):
+        if abs(nr - r) + abs(nc - c) != 1 or maze[nr][nc] != 0:
+            return False
+    return True
+
+
+@unittest.skipIf(ht_paths.np is None, "frontier BFS needs NumPy")
+class FrontierBFSTest(unittest.TestCase):
+    def test_same_path_as_bfs(self):
+        for maze, start, goal in random_mazes(200):
+            with self.subTest(size=(len(maze), len(maze[0])), start=start, goal=goal):
+                self.assertEqual(frontier_bfs_path(maze, start, goal), bfs_path(maze, start, goal))
+
+    def test_takes_a_numpy_grid(self):
+        maze = [[0, 1, 0], [0, 1, 0], [0, 0, 0]]
+        grid = ht_paths.to_grid(maze)
+        self.assertEqual(frontier_bfs_path(grid, (0, 0), (0, 2)), bfs_path(maze, (0, 0), (0, 2)))
+
+    def test_walled_off_goal(self):
+        maze = [[0, 1, 0], [1, 1, 0]]
+        self.assertEqual(frontier_bfs_path(maze, (0, 0), (1, 2)), [])
+
+
+class ShortestPathTest(unittest.TestCase):
+    """The other engines and DistanceField may pick a different shortest
+    path, but it has to be valid and as short as bfs_path's."""
+
+    def assertShortest(self, maze, start, goal, got, expected):
+        self.assertEqual(len(got), len(expected))
+        if expected:
+            self.assertTrue(is_path(maze, got, start, goal), got)
+
+    def test_engines(self):
+        for maze, start, goal in random_mazes(200):
+            expected = bfs_path(maze, start, goal)
+            for name in available_engines():
+                with self.subTest(engine=name, size=(len(maze), len(maze[0])), start=start, goal=goal):
+                    self.assertShortest(maze, start, goal, ENGINES[name](maze, start, goal), expected)
+
+    def test_distance_field(self):
+        for maze, start, goal in random_mazes(200):
+            with self.subTest(size=(len(maze), len(maze[0])), start=start, goal=goal):
+                got = DistanceField(maze, goal).path(start)
+                self.assertShortest(maze, start, goal, got, bfs_path(maze, start, goal))
+
+    def test_search_fills_in_stats(self):
+        maze = [[0] * 5 for _ in range(5)]
+        path, stats = ht_paths.search(maze, (0, 0), (4, 4), "astar")
+        self.assertEqual((stats.engine, stats.path_length), ("astar", 9))
+        self.assertEqual(len(path), 9)
+        self.assertGreater(stats.expanded, 0)
+        with self.assertRaises(ValueError):
+            ht_paths.search(maze, (0, 0), (4, 4), "dijkstra")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from ht_sim import Race, run_race
+
+
+class RaceTest(unittest.TestCase):
+    def test_ai_walks_to_the_treasure(self):
+        for engine in ("bfs", "astar", "field"):
+            with self.subTest(engine=engine):
+                race = Race.generate(15, 15, "kruskal", seed=3)
+                stats = race.plan(engine)
+                self.assertEqual(stats.path_length, len(race.ai_path))
+                steps = 0
+                while race.step_ai():
+                    steps += 1
+                self.assertTrue(race.ai_won)
+                self.assertEqual(steps, len(race.ai_path) - 1)
+
+    def test_field_is_built_once(self):
+        race = Race.generate(15, 15, seed=3)
+        self.assertIs(race.distance_field(), race.distance_field())
+        race.plan("field")
+        self.assertIs(race.field, race.distance_field())
+
+    def test_run_race(self):
+        result = run_race(20, 20, "dfs", 0.35, "jps", seed=1)
+        self.assertTrue(result["reachable"])
+        self.assertEqual(result["engine"], "jps")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import queens
+
+# solutions for N = 0, 1, 2, ... (OEIS A000170)
+KNOWN_COUNTS = (1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680, 14200, 73712, 365596, 2279184)
+
+
+def replay(n, events):
+    """The solutions a trace passes through, checking that every event is
+    legal for the board it is applied to."""
+    board = []  # columns of the queens on the board, row by row
+    found = []
+    for event in events:
+        row, col = divmod(event if event >= 0 else ~event, n)
+        if event >= 0:
+            if row != len(board) or queens.place(n, board + [col]) is None:
+                raise AssertionError(f"bad trace: can't place a queen on ({row}, {col})")
+            board.append(col)
+            if row == n - 1:
+                found.append(tuple(board))
+        else:
+            if row != len(board) - 1 or board[-1] != col:
+                raise AssertionError(f"bad trace: ({row}, {col}) isn't the last queen placed")
+            board.pop()
+    return found
+
+
+class QueensTest(unittest.TestCase):
+    def test_known_counts(self):
+        for n in range(1, 12):
+            with self.subTest(n=n):
+                found = list(queens.solutions(n))
+                self.assertEqual(len(found), KNOWN_COUNTS[n])
+                self.assertEqual(queens.count(n), KNOWN_COUNTS[n])
+                self.assertEqual(queens._count_loop(n, 0, 0, 0, 0), KNOWN_COUNTS[n])
+                self.assertTrue(all(map(queens.is_solution, found)))
+                self.assertEqual(found, sorted(set(found)))
+
+    def test_trace_replays_to_the_solutions(self):
+        for n in range(1, 9):
+            with self.subTest(n=n):
+                self.assertEqual(replay(n, queens.trace(n)), list(queens.solutions(n)))
+
+    def test_trace_limits(self):
+        events = queens.trace(8, max_solutions=3)
+        self.assertEqual(replay(8, events), list(queens.solutions(8))[:3])
+        self.assertEqual(events[-1] // 8, 7)  # stops on the third solution's board
+        self.assertLessEqual(len(queens.trace(12, max_events=1000)), 1000)
+
+    def test_count_with_prefix(self):
+        total = sum(queens.count(10, (col,)) for col in range(10))
+        self.assertEqual(total, KNOWN_COUNTS[10])
+        self.assertEqual(queens.count(8, (0, 1)), 0)  # the first two queens attack
+        self.assertEqual(queens.count(8, (0, 4, 7, 5, 2, 6, 1, 3)), 1)
+
+    def test_place_rejects_columns_off_the_board(self):
+        self.assertEqual(queens.place(4, (1,)), (0b0010, 0b0100, 0b0001))
+        for prefix in ((-1,), (4,), (1, 3, -2), (1, 3, 0, 5)):
+            with self.subTest(prefix=prefix):
+                self.assertIsNone(queens.place(4, prefix))
+        self.assertEqual(queens.count(8, (-1,)), 0)
+        self.assertEqual(queens.count(8, (8,)), 0)
+
+    def test_first_and_bad_sizes(self):
+        self.assertEqual(queens.first(8), (0, 4, 7, 5, 2, 6, 1, 3))
+        self.assertIsNone(queens.first(3))
+        with self.assertRaises(ValueError):
+            queens.count(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+import queens
+import queens_local
+from queens_local import Board, solve, verify
+
+
+def attacking_pairs(cols):
+    return sum(1 for a in range(len(cols)) for b in range(a)
+               if abs(cols[a] - cols[b]) == a - b)
+
+
+class LocalSearchTest(unittest.TestCase):
+    def test_small_boards(self):
+        rng = random.Random(0)
+        for trial in range(200):
+            n = rng.randint(1, 60)
+            with self.subTest(n=n, seed=trial):
+                cols = solve(n, seed=trial)
+                if n in (2, 3):
+                    self.assertIsNone(cols)
+                else:
+                    self.assertTrue(verify(cols))
+                    self.assertTrue(queens.is_solution(list(cols)))
+
+    def test_verify_agrees_with_the_engine(self):
+        rng = random.Random(1)
+        for trial in range(100):
+            n = rng.randint(1, 40)
+            cols = [rng.randrange(n) for _ in range(n)]
+            if trial % 2:
+                cols = rng.sample(range(n), n)
+            with self.subTest(cols=cols):
+                self.assertEqual(verify(cols), queens.is_solution(cols))
+        self.assertFalse(verify([0, 5]))
+
+    def test_swap_keeps_the_pair_count(self):
+        board = Board(30, seed=2)
+        board.place_greedy()
+        self.assertEqual(board.pairs, attacking_pairs(board.queens))
+        rng = random.Random(3)
+        for _ in range(100):
+            board.swap(rng.randrange(30), rng.randrange(30))
+            self.assertEqual(board.pairs, attacking_pairs(board.queens))
+
+    def test_big_board(self):
+        cols = solve(100_000, seed=1)
+        self.assertEqual(len(cols), 100_000)
+        self.assertTrue(verify(cols))
+
+    @unittest.skipIf(queens_local.np is None, "only differs from the fallback with NumPy")
+    def test_verify_without_numpy(self):
+        cols = solve(500, seed=4)
+        np, queens_local.np = queens_local.np, None
+        try:
+            self.assertTrue(verify(cols))
+            broken = list(cols)
+            broken[0], broken[-1] = broken[-1], broken[0]
+            self.assertEqual(verify(broken), queens.is_solution(broken))
+            self.assertFalse(verify(broken[:-1] + [broken[0]]))  # two queens in one column
+        finally:
+            queens_local.np = np
+
+
+if __name__ == "__main__":
+    unittest.main()
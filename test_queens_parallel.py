@@ -0,0 +1,23 @@
+import unittest
+
+import queens
+from queens_parallel import parallel_count, work_units
+
+
+class WorkUnitsTest(unittest.TestCase):
+    def test_weighted_units_add_up_to_the_count(self):
+        for n in range(1, 12):
+            for split_rows in (1, 2):
+                with self.subTest(n=n, split_rows=split_rows):
+                    units = work_units(n, split_rows)
+                    self.assertEqual(sum(w * queens.count(n, prefix) for prefix, w in units), queens.count(n))
+                    self.assertTrue(all(queens.place(n, prefix) is not None for prefix, _ in units))
+
+    def test_parallel_count(self):
+        total, report = parallel_count(10, workers=2)
+        self.assertEqual(total, 724)
+        self.assertEqual(sum(w["units"] for w in report["per_worker"]), report["units"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import queens
+import queens_store
+from queens_store import SolutionStore
+
+
+class SolutionStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "queens_8.bin")
+        self.assertEqual(queens_store.build(8, self.path), 92)
+        self.store = SolutionStore(self.path)
+        self.addCleanup(self.store.close)
+
+    def test_verify(self):
+        self.assertEqual(queens_store.verify(8, self.path), [])
+
+    def test_random_access(self):
+        solutions = list(queens.solutions(8))
+        self.assertEqual(len(self.store), 92)
+        self.assertEqual((self.store[0], self.store[-1], self.store[40]),
+                         (solutions[0], solutions[-1], solutions[40]))
+        self.assertEqual(list(self.store.iter_from(90)), solutions[90:])
+        with self.assertRaises(IndexError):
+            self.store[92]
+
+    def test_find(self):
+        found = self.store.find((0, 4))
+        self.assertEqual(len(found), queens.count(8, (0, 4)))
+        self.assertTrue(all(cols[:2] == (0, 4) for cols in self.store.matching((0, 4))))
+        self.assertEqual(len(self.store.find((0, 1))), 0)
+        self.assertEqual(len(self.store.find((9,))), 0)
+
+    def test_not_a_store(self):
+        with open(self.path + ".txt", "wb") as f:
+            f.write(b"hello")
+        with self.assertRaises(ValueError):
+            SolutionStore(self.path + ".txt")
+
+    def test_get_out_of_range(self):
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err), contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(queens_store.main(["get", "8", "500", "--path", self.path]), 1)
+        self.assertIn("no solution 500", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+
+from student_db import INSERT_ENROLLMENT, StudentDB, add_stats, check_query_plans, untracked
+
+
+class StudentDBTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = StudentDB(os.path.join(tmp.name, "students.db"))
+        self.addCleanup(self.db.close)
+        for i in range(1, 6):
+            self.db.students.add(i, f"Student {i}", 20 + i, "F", f"s{i}@example.com")
+        for i in range(1, 4):
+            self.db.courses.add(i, f"Course {i}", 6)
+
+    def write(self, sql, params=()):
+        with self.db.pool.write() as conn:
+            conn.execute(sql, params)
+
+    def test_query_plans_use_indexes(self):
+        self.assertEqual(check_query_plans(self.db), [])
+
+    def test_stats_follow_insert_update_delete(self):
+        self.db.enrollments.add(1, 1, 1, "A")
+        self.db.enrollments.add(2, 2, 1, None)
+        self.db.enrollments.add(3, 2, 2, "B")
+        self.assertEqual(self.db.stats.verify(), [])
+        self.assertEqual(self.db.stats.grade_distribution(1), {"A": 1, "": 1})
+
+        self.write("UPDATE Enrollments SET Grade = 'C', CourseID = 3 WHERE EnrollmentID = 2")
+        self.write("UPDATE Enrollments SET StudentID = 4 WHERE EnrollmentID = 3")
+        self.assertEqual(self.db.stats.verify(), [])
+        self.assertEqual((self.db.stats.course_load(2), self.db.stats.course_load(4)), (1, 1))
+
+        self.write("DELETE FROM Enrollments WHERE EnrollmentID = 1")
+        self.assertEqual(self.db.stats.verify(), [])
+        self.assertEqual(self.db.stats.grade_distribution(1), {})
+
+    def test_stats_after_bulk_import(self):
+        rows = [(i, i % 5 + 1, i % 3 + 1, "ABC"[i % 3] if i % 4 else None) for i in range(1, 101)]
+        seq = self.db.last_change()
+        with self.db.pool.write(foreign_keys=False) as conn:
+            with untracked(conn, "Enrollments"):
+                conn.executemany(INSERT_ENROLLMENT, rows)
+                add_stats(conn, (row[1:] for row in rows))
+        self.assertEqual(self.db.stats.verify(), [])
+        # one 'R' entry for the whole load, not one per row
+        self.assertEqual([op for _, _, op in self.db.changes_since(seq, "Enrollments")], ["R"])
+
+    def test_data_version_moves_on_outside_commits(self):
+        before = self.db.data_version()
+        self.db.courses.add(9, "Own write", 1)
+        self.assertEqual(self.db.data_version(), before)  # our own commits don't count
+        other = StudentDB(self.db.pool.path)
+        self.addCleanup(other.close)
+        other.courses.add(10, "Other writer", 1)
+        self.assertNotEqual(self.db.data_version(), before)
+
+    def add_enrollments(self, keys):
+        # the same student, course and grade on every row: only the key tells them apart
+        for key in keys:
+            self.db.enrollments.add(key, 1, 1, "A")
+
+    def test_pages_walk_forward_and_back(self):
+        keys = [k * 3 for k in range(1, 21)]  # 20 rows with gaps between the keys
+        self.add_enrollments(keys)
+        repo = self.db.enrollments
+        forward, pages, last = [], 0, None
+        while True:
+            page = repo.page_after(last, limit=5)
+            if not page:
+                break  # 20 rows in pages of 5: the fifth page is the empty one
+            pages += 1
+            forward += [row[0] for row in page]
+            last = page[-1][0]
+        self.assertEqual((forward, pages), (keys, 4))
+
+        backward, first = [], keys[-1] + 1
+        while True:
+            page = repo.page_before(first, limit=6)
+            if not page:
+                break
+            self.assertEqual([row[0] for row in page], sorted(row[0] for row in page))
+            backward = [row[0] for row in page] + backward
+            first = page[0][0]
+        self.assertEqual(backward, keys)
+
+    def test_page_boundaries(self):
+        self.add_enrollments([10, 20, 30])
+        repo = self.db.enrollments
+        self.assertEqual([r[0] for r in repo.page_after(10, limit=2)], [20, 30])
+        self.assertEqual([r[0] for r in repo.page_after(15, limit=2)], [20, 30])  # a deleted key
+        self.assertEqual(repo.page_after(30), [])
+        self.assertEqual([r[0] for r in repo.page_before(30, limit=1)], [20])
+        self.assertEqual(repo.page_before(10), [])
+        self.assertEqual(repo.page_after(limit=0), [])
+
+    def test_rows_for(self):
+        self.add_enrollments(range(1, 1201))  # more keys than one IN (...) chunk holds
+        keys = [5, 3, 5, 9999, 1200] + list(range(100, 1100))
+        rows = self.db.enrollments.rows_for(keys)
+        self.assertEqual([row[0] for row in rows], [3, 5] + list(range(100, 1100)) + [1200])
+        self.assertEqual(self.db.enrollments.rows_for([]), [])
+
+    def ops_since(self, seq, table=None):
+        return [row[1:] for row in self.db.changes_since(seq, table)]
+
+    def test_changelog_logs_insert_update_delete(self):
+        writes = {
+            "Students": ("INSERT INTO Students (StudentID, Name) VALUES (50, 'New')",
+                         "UPDATE Students SET Name = 'Renamed' WHERE StudentID = 50",
+                         "DELETE FROM Students WHERE StudentID = 50"),
+            "Courses": ("INSERT INTO Courses (CourseID, CourseName) VALUES (50, 'New')",
+                        "UPDATE Courses SET Duration = 3 WHERE CourseID = 50",
+                        "DELETE FROM Courses WHERE CourseID = 50"),
+            "Enrollments": ("INSERT INTO Enrollments VALUES (50, 1, 1, 'B')",
+                            "UPDATE Enrollments SET Grade = 'A' WHERE EnrollmentID = 50",
+                            "DELETE FROM Enrollments WHERE EnrollmentID = 50"),
+        }
+        for table, statements in writes.items():
+            with self.subTest(table=table):
+                seq = self.db.last_change()
+                for sql in statements:
+                    self.write(sql)
+                self.assertEqual(self.ops_since(seq), [(table, 50, "I"), (table, 50, "U"), (table, 50, "D")])
+                changes = self.db.changes_since(seq, table)
+                self.assertEqual([row[0] for row in changes], list(range(seq + 1, seq + 4)))
+
+    def test_changelog_logs_a_rekey_as_delete_and_insert(self):
+        seq = self.db.last_change()
+        self.write("UPDATE Courses SET CourseID = 60 WHERE CourseID = 3")
+        self.assertEqual(self.ops_since(seq, "Courses"), [(3, "D"), (60, "I")])
+        self.assertEqual(self.ops_since(seq, "Students"), [])
+
+    def test_changelog_skips_paused_writes(self):
+        seq = self.db.last_change()
+        with self.db.pool.write() as conn:
+            conn.execute("INSERT INTO ChangeLogPause VALUES (1)")
+            conn.execute("INSERT INTO Students (StudentID, Name) VALUES (70, 'Quiet')")
+            conn.execute("UPDATE Courses SET Duration = 1 WHERE CourseID = 1")
+            conn.execute("DELETE FROM ChangeLogPause")
+            conn.execute("DELETE FROM Students WHERE StudentID = 70")
+        self.assertEqual(self.ops_since(seq), [("Students", 70, "D")])
+
+    def test_pruned_changes_force_a_reload(self):
+        seq = self.db.last_change()
+        self.db.courses.add(80, "Late", 1)
+        self.db.prune_changes(keep=0)  # empties the log
+        self.assertIsNone(self.db.changes_since(seq))
+        self.assertEqual(self.db.last_change(), seq + 1)
+        self.assertEqual(self.db.changes_since(seq + 1), [])
+
+    def test_verify_reports_drift(self):
+        self.db.enrollments.add(1, 1, 1, "A")
+        self.write("UPDATE CourseStats SET Enrollments = 5")
+        self.assertTrue(self.db.stats.verify())
+        self.db.stats.rebuild()
+        self.assertEqual(self.db.stats.verify(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import tic_engine as engine
+from tic_engine import EMPTY, O, X
+
+
+def board(rows):
+    """Board from three strings of X, O and . cells."""
+    return engine.from_cells([{".": ""}.get(cell, cell) for cell in "".join(rows)])
+
+
+class EngineTest(unittest.TestCase):
+    def test_perfect_self_play_is_a_draw(self):
+        position = EMPTY
+        move = engine.best_move(position)
+        while move is not None:
+            position = engine.play(position, move)
+            move = engine.best_move(position)
+        self.assertIsNone(engine.winner(position))
+        self.assertTrue(engine.is_full(position))
+
+    def test_takes_a_win(self):
+        self.assertEqual(engine.best_move(board(["XX.", "OO.", "..."])), 2)
+
+    def test_blocks_a_win(self):
+        self.assertEqual(engine.best_move(board(["X..", "XO.", "..."])), 6)
+
+    def test_finished_board_has_no_move(self):
+        self.assertIsNone(engine.best_move(board(["XXX", "OO.", "..."])))
+
+    def test_play(self):
+        position = engine.play(EMPTY, 4)
+        self.assertEqual(engine.to_move(position), O)
+        self.assertEqual(engine.to_cells(engine.play(position, 0))[:5], [O, "", "", "", X])
+        with self.assertRaises(ValueError):
+            engine.play(position, 4)
+
+    def test_canonical_merges_symmetries(self):
+        corners = {engine.canonical(engine.play(EMPTY, cell)) for cell in (0, 2, 6, 8)}
+        self.assertEqual(len(corners), 1)
+        self.assertNotEqual(engine.canonical(engine.play(EMPTY, 4)), corners.pop())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+import tic_nk
+from tic_nk import Game
+
+
+class GameTest(unittest.TestCase):
+    def test_undo_restores_everything(self):
+        rng = random.Random(0)
+        game = Game(7, 4)
+        for _ in range(20):
+            before = (list(game.bits), [list(c) for c in game.counts], game.score, game.hash, game.winner)
+            cell = rng.choice(game.legal_moves())
+            game.play(cell)
+            game.undo()
+            self.assertEqual((list(game.bits), [list(c) for c in game.counts],
+                              game.score, game.hash, game.winner), before)
+            game.play(cell)
+            if game.over():
+                break
+
+    def test_score_matches_a_rescan(self):
+        rng = random.Random(1)
+        game = Game(6, 4)
+        while not game.over():
+            game.play(rng.choice(game.legal_moves()))
+            self.assertEqual(game.score, sum(game.line_value(i) for i in range(len(game.lines))))
+
+    def test_win_is_found(self):
+        game = Game(5, 4)
+        for cell in (0, 5, 1, 6, 2, 7, 3):
+            game.play(cell)
+        self.assertEqual((game.winner, game.win_line), (0, (0, 1, 2, 3)))
+        with self.assertRaises(ValueError):
+            game.play(0)
+        with self.assertRaises(ValueError):
+            Game(3, 4)
+
+
+class SearchTest(unittest.TestCase):
+    def play(self, n, k, cells):
+        game = Game(n, k)
+        for cell in cells:
+            game.play(cell)
+        return game
+
+    def test_takes_a_win(self):
+        game = self.play(6, 4, (0, 6, 1, 7, 2, 20))  # X holds 0 1 2
+        self.assertEqual(tic_nk.search(game, budget=5), 3)
+        self.assertGreaterEqual(tic_nk.stats["score"], tic_nk.WIN)
+
+    def test_blocks_a_win(self):
+        game = self.play(6, 4, (0, 6, 1, 7, 20, 8))  # O holds 6 7 8
+        self.assertEqual(tic_nk.search(game, budget=5, max_depth=2), 9)
+
+    def test_perfect_play_on_3x3_is_a_draw(self):
+        game = Game(3, 3)
+        while not game.over():
+            game.play(tic_nk.search(game, budget=30))
+        self.assertIsNone(game.winner)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import tic_engine as engine
+import tic_table
+from tic_engine import EMPTY
+
+
+def reachable():
+    """Every position from the empty board where the game isn't over yet."""
+    seen = set()
+    stack = [EMPTY]
+    while stack:
+        board = stack.pop()
+        if board in seen or engine.winner(board) or engine.is_full(board):
+            continue
+        seen.add(board)
+        stack.extend(engine.play(board, cell) for cell in engine.legal_moves(board))
+    return seen
+
+
+def value_after(board, move):
+    """Value for the side to move in board once it plays move."""
+    x, o = engine.play(board, move)
+    theirs, mine = (o, x) if engine.to_move(board) == engine.X else (x, o)
+    return -engine.negamax(theirs, mine, -2, 2)
+
+
+class TableTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "table.bin")
+        # lookup() and best_move() read the shared table from TABLE_PATH
+        patch = mock.patch.object(tic_table, "TABLE_PATH", self.path)
+        patch.start()
+        self.addCleanup(patch.stop)
+        tic_table.close()
+        self.addCleanup(tic_table.close)
+
+    def test_build_and_verify(self):
+        self.assertEqual(tic_table.build(self.path), len(tic_table.positions()))
+        self.assertEqual(os.path.getsize(self.path), len(tic_table.MAGIC) + tic_table.SIZE)
+        self.assertEqual(tic_table.verify(self.path), [])
+
+    def test_verify_leaves_the_shared_table_alone(self):
+        tic_table.build(self.path)
+        table = tic_table.load()
+        other = os.path.join(self.tmp.name, "other.bin")
+        tic_table.build(other)
+        self.assertIs(tic_table.load(), table)
+        self.assertEqual(tic_table.verify(other), [])
+        self.assertIs(tic_table.load(), table)
+        self.assertEqual(tic_table._table[0], self.path)
+
+    def test_verify_reports_a_bad_entry(self):
+        tic_table.build(self.path)
+        with open(self.path, "r+b") as f:
+            f.seek(len(tic_table.MAGIC) + tic_table.index(EMPTY))
+            f.write(bytes([tic_table.EMPTY]))
+        self.assertEqual(tic_table.verify(self.path), [(EMPTY, "missing")])
+        self.assertEqual(tic_table.verify(os.path.join(self.tmp.name, "nope.bin")),
+                         [f"no usable table at {os.path.join(self.tmp.name, 'nope.bin')}"])
+
+    def test_lookup_agrees_with_search(self):
+        tic_table.build(self.path)
+        for board in reachable():
+            with self.subTest(board=engine.to_cells(board)):
+                move, value = tic_table.lookup(board)
+                self.assertIn(move, engine.legal_moves(board))
+                self.assertEqual(value, tic_table.solve(board)[1])
+                self.assertEqual(value_after(board, move), value_after(board, engine.best_move(board)))
+
+    def test_finished_games_have_no_entry(self):
+        tic_table.build(self.path)
+        won = engine.from_cells(["X", "X", "X", "O", "O", "", "", "", ""])
+        self.assertIsNone(tic_table.lookup(won))
+        self.assertIsNone(tic_table.best_move(won))
+
+    def test_missing_file_falls_back_to_search(self):
+        board = engine.play(EMPTY, 4)
+        self.assertIsNone(tic_table.load())
+        self.assertIsNone(tic_table.lookup(board))
+        self.assertEqual(tic_table.best_move(board), engine.best_move(board))
+        self.assertEqual(tic_table.stats["source"], "search")
+        # a table built afterwards is picked up without a restart
+        tic_table.build(self.path)
+        self.assertIsNotNone(tic_table.best_move(board))
+        self.assertEqual(tic_table.stats["source"], "table")
+
+    def test_ignores_a_file_that_is_not_a_table(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a table")
+        self.assertIsNone(tic_table.load())
+        self.assertEqual(tic_table.best_move(EMPTY), engine.best_move(EMPTY))
+        self.assertEqual(tic_table.stats["source"], "search")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import threading
+import unittest
+
+from tk_worker import BackgroundWorker
+
+
+class BackgroundWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.worker = BackgroundWorker(threads=1)
+        self.addCleanup(self.worker.shutdown)
+
+    def drain(self, *futures):
+        for future in futures:
+            try:
+                future.exception(timeout=5)
+            except Exception:  # cancelled
+                pass
+        self.worker.pump()
+
+    def test_result_comes_back_through_pump(self):
+        results = []
+        future = self.worker.submit(sum, [1, 2, 3], on_done=results.append)
+        self.assertEqual(results, [])  # nothing is delivered until pump()
+        self.drain(future)
+        self.assertEqual(results, [6])
+
+    def test_newer_work_under_a_key_wins(self):
+        gate = threading.Event()
+        results = []
+        running = self.worker.submit(lambda: gate.wait(5) and "first", key="k", on_done=results.append)
+        queued = self.worker.submit(lambda: "second", key="k", on_done=results.append)
+        latest = self.worker.submit(lambda: "third", key="k", on_done=results.append)
+        gate.set()
+        self.drain(running, queued, latest)
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(results, ["third"])
+        self.assertFalse(self.worker.is_pending("k"))
+
+    def test_errors_go_to_on_error(self):
+        errors = []
+        future = self.worker.submit(int, "x", on_error=errors.append)
+        self.drain(future)
+        self.assertIsInstance(errors[0], ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,147 +1,157 @@
 import tkinter as tk
 from tkinter import messagebox
 
-# --- Initialize Window ---
-root = tk.Tk()
-root.title("AI Tic Tac Toe 🧠")
-root.resizable(False, False)
-root.configure(bg="#222831")
+import tic_engine as engine
+import tic_nk as nk
+import tic_table
+from tk_worker import BackgroundWorker
+from tic_parallel import ParallelSearch
 
 player = "X"
 ai = "O"
 
-buttons = [[None for _ in range(3)] for _ in range(3)]
+# Board size and how many in a row win. 3 x 3 moves come from the solved
+# table (python tic_table.py build), or tic_engine's exact search without
+# one; anything bigger is searched by tic_nk within TIME_BUDGET, split
+# across AI_WORKERS processes off the Tk thread.
+SIZE, K = 3, 3
+TIME_BUDGET = 1.0  # seconds per AI move on boards tic_engine can't take
+AI_WORKERS = None  # processes for the big-board search; None means one per core
+
+buttons = [[None for _ in range(SIZE)] for _ in range(SIZE)]
 lines = []  # to store line coordinates for highlight
 
+# The game itself lives in a tic_nk.Game; the buttons only show it.
+game = nk.Game(SIZE, K)
+
 # --- Utility Functions ---
 def is_full():
-    return all(buttons[i][j]["text"] != "" for i in range(3) for j in range(3))
-
-def check_winner(board):
-    # Rows
-    for i in range(3):
-        if board[i][0] == board[i][1] == board[i][2] != "":
-            return board[i][0], ("row", i)
-    # Columns
-    for j in range(3):
-        if board[0][j] == board[1][j] == board[2][j] != "":
-            return board[0][j], ("col", j)
-    # Diagonals
-    if board[0][0] == board[1][1] == board[2][2] != "":
-        return board[0][0], ("diag", 0)
-    if board[0][2] == board[1][1] == board[2][0] != "":
-        return board[0][2], ("diag", 1)
-    return None, None
-
-# --- Minimax AI Algorithm ---
-def minimax(board, depth, is_maximizing):
-    winner, _ = check_winner(board)
-    if winner == ai:
-        return 1
-    elif winner == player:
-        return -1
-    elif is_full():
-        return 0
-
-    if is_maximizing:
-        best_score = -float("inf")
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == "":
-                    board[i][j] = ai
-                    score = minimax(board, depth + 1, False)
-                    board[i][j] = ""
-                    best_score = max(score, best_score)
-        return best_score
-    else:
-        best_score = float("inf")
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == "":
-                    board[i][j] = player
-                    score = minimax(board, depth + 1, True)
-                    board[i][j] = ""
-                    best_score = min(score, best_score)
-        return best_score
+    return game.is_full()
+
+def mark(cell, who):
+    game.play(cell)
+    i, j = divmod(cell, SIZE)
+    color = "#00BFFF" if who == player else "#00FF00"  # blue X, green O
+    buttons[i][j].config(text=who, fg=color, state="disabled")
 
+# --- AI ---
 def ai_move():
-    best_score = -float("inf")
-    move = None
-    board = [[buttons[i][j]["text"] for j in range(3)] for i in range(3)]
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == "":
-                board[i][j] = ai
-                score = minimax(board, 0, False)
-                board[i][j] = ""
-                if score > best_score:
-                    best_score = score
-                    move = (i, j)
-    if move:
-        buttons[move[0]][move[1]].config(text=ai, fg="#00FF00", state="disabled")  # green O
+    if game.over() or "XO"[game.to_move] != ai:
+        return  # the board was reset while this move was scheduled
+    if (SIZE, K) == (3, 3):
+        # tic_engine's bitboards use the same bit per cell as tic_nk's
+        move = tic_table.best_move(tuple(game.bits))
+        if tic_table.stats["source"] == "table":
+            search_label.config(text="solved-table lookup")
+        else:
+            stats = engine.stats
+            search_label.config(text=f"searched {stats['nodes']:,} nodes, {stats['cache_hits']:,} cache hits")
+    else:
+        # the answer comes back through ai_moved on the Tk thread; the ticket
+        # drops it if reset_board cancels while it is still queued
+        search_label.config(text="thinking...")
+        worker.submit(ai_search.search, SIZE, K, list(game.moves), TIME_BUDGET, None,
+                      ai_search.ticket(), key="ai", on_done=ai_moved)
+        return
+    if move is not None:
+        mark(move, ai)
         check_game_over()
 
+def ai_moved(move):
+    if move is None or game.over() or "XO"[game.to_move] != ai:
+        return  # cancelled, or the board changed while searching
+    stats = ai_search.stats
+    search_label.config(text=f"depth {stats['depth']}, {stats['nodes']:,} nodes "
+                             f"in {stats['seconds']:.2f}s on {stats['workers']} processes")
+    mark(move, ai)
+    check_game_over()
+
 def on_click(i, j):
-    if buttons[i][j]["text"] == "":
-        buttons[i][j].config(text=player, fg="#00BFFF", state="disabled")  # blue X
-        check_game_over()
-        ai_move()
+    if "XO"[game.to_move] == player and buttons[i][j]["text"] == "":
+        mark(i * SIZE + j, player)
+        if not check_game_over():
+            # let the player's mark show before the search starts
+            root.after(10, ai_move)
 
-def highlight_winner(win_type, index):
+def highlight_winner(cells):
     # draw a red line through the winning combination
-    canvas = tk.Canvas(root, width=300, height=300, bg="#222831", highlightthickness=0)
-    canvas.place(x=50, y=70)
-
-    if win_type == "row":
-        y = 50 + index * 100 + 50
-        canvas.create_line(20, y, 280, y, fill="red", width=5)
-    elif win_type == "col":
-        x = 50 + index * 100 + 50
-        canvas.create_line(x, 20, x, 280, fill="red", width=5)
-    elif win_type == "diag" and index == 0:
-        canvas.create_line(20, 20, 280, 280, fill="red", width=5)
-    elif win_type == "diag" and index == 1:
-        canvas.create_line(280, 20, 20, 280, fill="red", width=5)
+    frame.update_idletasks()
+    canvas = tk.Canvas(root, width=frame.winfo_width(), height=frame.winfo_height(),
+                       bg="#222831", highlightthickness=0)
+    canvas.place(x=frame.winfo_x(), y=frame.winfo_y())
+
+    def center(cell):
+        btn = buttons[cell // SIZE][cell % SIZE]
+        return btn.winfo_x() + btn.winfo_width() / 2, btn.winfo_y() + btn.winfo_height() / 2
 
+    canvas.create_line(*center(cells[0]), *center(cells[-1]), fill="red", width=5)
     lines.append(canvas)
 
 def check_game_over():
-    board = [[buttons[i][j]["text"] for j in range(3)] for i in range(3)]
-    winner, win_pos = check_winner(board)
-    if winner:
-        highlight_winner(win_pos[0], win_pos[1])
-        messagebox.showinfo("Game Over", f"{winner} wins!")
+    if game.winner is not None:
+        highlight_winner(game.win_line)
+        messagebox.showinfo("Game Over", f"{'XO'[game.winner]} wins!")
         reset_board()
+        return True
     elif is_full():
         messagebox.showinfo("Game Over", "It's a Draw!")
         reset_board()
+        return True
+    return False
 
 def reset_board():
+    ai_search.cancel()
+    worker.cancel("ai")
+    game.reset()
     for line in lines:
         line.destroy()
     lines.clear()
-    for i in range(3):
-        for j in range(3):
+    for i in range(SIZE):
+        for j in range(SIZE):
             buttons[i][j].config(text="", state="normal")
 
-# --- Create UI Board ---
-frame = tk.Frame(root, bg="#222831")
-frame.pack(pady=20, padx=50)
-
-for i in range(3):
-    for j in range(3):
-        btn = tk.Button(
-            frame, text="", font=("Arial", 24, "bold"), width=5, height=2,
-            bg="#393E46", fg="white", activebackground="#00ADB5",
-            command=lambda i=i, j=j: on_click(i, j)
-        )
-        btn.grid(row=i, column=j, padx=5, pady=5)
-        buttons[i][j] = btn
-
-tk.Button(
-    root, text="Reset Game", font=("Arial", 12, "bold"), bg="#00ADB5",
-    fg="white", command=reset_board
-).pack(pady=10)
-
-root.geometry("400x450")
-root.mainloop()
+def quit_game():
+    ai_search.shutdown()
+    worker.shutdown()
+    root.destroy()
+
+# The search processes import this file again on platforms that spawn them,
+# so the window is only built when it runs as a script.
+if __name__ == "__main__":
+    # --- Initialize Window ---
+    root = tk.Tk()
+    root.title("AI Tic Tac Toe 🧠")
+    root.resizable(False, False)
+    root.configure(bg="#222831")
+
+    ai_search = ParallelSearch(AI_WORKERS)
+    worker = BackgroundWorker(threads=1)
+    worker.attach(root)
+
+    # --- Create UI Board ---
+    frame = tk.Frame(root, bg="#222831")
+    frame.pack(pady=20, padx=50)
+
+    big = SIZE > 3
+    for i in range(SIZE):
+        for j in range(SIZE):
+            btn = tk.Button(
+                frame, text="", font=("Arial", max(9, 72 // SIZE) if big else 24, "bold"),
+                width=2 if big else 5, height=1 if big else 2,
+                bg="#393E46", fg="white", activebackground="#00ADB5",
+                command=lambda i=i, j=j: on_click(i, j)
+            )
+            btn.grid(row=i, column=j, padx=1 if big else 5, pady=1 if big else 5)
+            buttons[i][j] = btn
+
+    tk.Button(
+        root, text="Reset Game", font=("Arial", 12, "bold"), bg="#00ADB5",
+        fg="white", command=reset_board
+    ).pack(pady=10)
+    search_label = tk.Label(root, text="", bg="#222831", fg="white")
+    search_label.pack()
+
+    if not big:
+        root.geometry("400x480")
+    root.protocol("WM_DELETE_WINDOW", quit_game)
+    root.mainloop()
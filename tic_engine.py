@@ -0,0 +1,144 @@
+"""
+Tic-tac-toe engine on bitboards: a board is a pair of 9-bit ints (x, o), with
+bit r * 3 + c set when that player holds cell (r, c). best_move() is a negamax
+alpha-beta search over a transposition table keyed by the canonical symmetry.
+"""
+
+X, O = "X", "O"
+EMPTY = (0, 0)
+FULL = 0b111111111
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+
+# SYMMETRY_TABLES[s][bits] is bits after symmetry s, for all 512 bit sets
+_TRANSFORMS = (lambda r, c: (r, c), lambda r, c: (c, 2 - r), lambda r, c: (2 - r, 2 - c),
+               lambda r, c: (2 - c, r), lambda r, c: (r, 2 - c), lambda r, c: (2 - r, c),
+               lambda r, c: (c, r), lambda r, c: (2 - c, 2 - r))
+
+def _symmetry_table(transform):
+    moved = [a * 3 + b for a, b in (transform(*divmod(i, 3)) for i in range(9))]
+    return [sum(1 << moved[i] for i in range(9) if bits >> i & 1) for bits in range(512)]
+
+SYMMETRY_TABLES = [_symmetry_table(t) for t in _TRANSFORMS]
+
+EXACT, LOWER, UPPER = 0, 1, 2  # what a stored score is: the value, or a bound on it
+
+transpositions = {}  # canonical key -> (score for the side to move, EXACT/LOWER/UPPER)
+stats = {"nodes": 0, "cache_hits": 0}  # for the last best_move
+
+
+# --- Board ---
+def to_move(board):
+    x, o = board
+    return X if bin(x).count("1") == bin(o).count("1") else O
+
+def legal_moves(board):
+    free = ~(board[0] | board[1]) & FULL
+    moves = []
+    while free:
+        low = free & -free
+        moves.append(low.bit_length() - 1)
+        free ^= low
+    return moves
+
+def play(board, cell):
+    x, o = board
+    bit = 1 << cell
+    if (x | o) & bit:
+        raise ValueError(f"cell {cell} is taken")
+    return (x | bit, o) if to_move(board) == X else (x, o | bit)
+
+def winning_line(board):
+    """(player, mask of the three cells) for a finished row, or (None, 0)."""
+    for player, bits in zip((X, O), board):
+        for mask in WIN_MASKS:
+            if bits & mask == mask:
+                return player, mask
+    return None, 0
+
+def winner(board):
+    return winning_line(board)[0]
+
+def is_full(board):
+    return board[0] | board[1] == FULL
+
+def from_cells(cells):
+    """Board from 9 row-major cells holding "X", "O" or ""."""
+    x = sum(1 << i for i, cell in enumerate(cells) if cell == X)
+    o = sum(1 << i for i, cell in enumerate(cells) if cell == O)
+    return x, o
+
+def to_cells(board):
+    x, o = board
+    return [X if x >> i & 1 else O if o >> i & 1 else "" for i in range(9)]
+
+def canonical(board):
+    x, o = board
+    return min(t[x] << 9 | t[o] for t in SYMMETRY_TABLES)
+
+
+# --- Search ---
+def _won(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+def negamax(mine, theirs, alpha, beta):
+    """Score for the side holding `mine` to move: 1 win, 0 draw, -1 loss."""
+    stats["nodes"] += 1
+    if _won(theirs):
+        return -1
+    taken = mine | theirs
+    if taken == FULL:
+        return 0
+
+    # the side to move is implied by the counts, so the key needs no flag
+    key = min(t[mine] << 9 | t[theirs] for t in SYMMETRY_TABLES)
+    entry = transpositions.get(key)
+    if entry:
+        score, kind = entry
+        if kind == EXACT or (kind == LOWER and score >= beta) or (kind == UPPER and score <= alpha):
+            stats["cache_hits"] += 1
+            return score
+
+    alpha_in = alpha
+    best = -2
+    free = ~taken & FULL
+    while free:
+        low = free & -free
+        free ^= low
+        score = -negamax(theirs, mine | low, -beta, -alpha)
+        if score > best:
+            best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    if best <= alpha_in:
+        transpositions[key] = (best, UPPER)
+    elif best >= beta:
+        transpositions[key] = (best, LOWER)
+    else:
+        transpositions[key] = (best, EXACT)
+    return best
+
+def best_move(board):
+    """The first cell with the best score for the side to move, or None."""
+    stats["nodes"] = stats["cache_hits"] = 0
+    if winner(board) or is_full(board):
+        return None
+    x, o = board
+    mine, theirs = (x, o) if to_move(board) == X else (o, x)
+    best, move = -2, None
+    for cell in legal_moves(board):
+        # a move only matters if it beats best, so that is the window's floor
+        score = -negamax(theirs, mine | 1 << cell, -2, -best)
+        if score > best:
+            best, move = score, cell
+    return move
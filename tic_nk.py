@@ -0,0 +1,269 @@
+"""
+N x N, k-in-a-row engine (4x4, 5x5 with 4, 15x15 gomoku, ...). Game.play()
+and undo() update per-line stone counts, the heuristic score and a Zobrist
+hash incrementally; search() is a time-budgeted iterative-deepening negamax.
+
+    python tic_nk.py 15 5 --budget 2     a few self-play moves of gomoku
+"""
+
+import random
+import time
+
+WIN = 1_000_000
+MAX_TABLE = 2_000_000  # transposition entries kept before the table is cleared
+
+
+class Timeout(Exception):
+    pass
+
+
+class Game:
+    def __init__(self, n=3, k=3):
+        if not 1 <= k <= n:
+            raise ValueError(f"need 1 <= k <= n, got n={n}, k={k}")
+        self.n, self.k = n, k
+        self.lines = []
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for r in range(n):
+                for c in range(n):
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= end_r < n and 0 <= end_c < n:
+                        self.lines.append(tuple((r + dr * i) * n + c + dc * i for i in range(k)))
+        self.cell_lines = [[] for _ in range(n * n)]
+        for line_id, cells in enumerate(self.lines):
+            for cell in cells:
+                self.cell_lines[cell].append(line_id)
+        # an open line with c stones of one player is worth weights[c]
+        self.weights = [0] + [4 ** c for c in range(1, k)] + [WIN]
+        rng = random.Random(n * 1000 + k)
+        self.zobrist = [[rng.getrandbits(64) for _ in range(n * n)] for _ in range(2)]
+        # bit masks for shifting a bitboard sideways without wrapping rows
+        full = (1 << n * n) - 1
+        first_col = sum(1 << r * n for r in range(n))
+        self.full = full
+        self.not_first_col = full & ~first_col
+        self.not_last_col = full & ~(first_col << (n - 1))
+        self.reach = 0 if n <= 5 else 1  # 0: every empty cell is a candidate move
+        self.reset()
+
+    def reset(self):
+        self.bits = [0, 0]
+        self.counts = [[0] * len(self.lines) for _ in range(2)]
+        self.moves = []
+        self.score = 0   # heuristic from X's point of view
+        self.hash = 0
+        self.winner = None    # 0 (X) or 1 (O)
+        self.win_line = None  # cells of the winning line
+        self._undo = []
+
+    # --- Rules ---
+    @property
+    def to_move(self):
+        return len(self.moves) % 2
+
+    def is_full(self):
+        return len(self.moves) == self.n * self.n
+
+    def over(self):
+        return self.winner is not None or self.is_full()
+
+    def line_value(self, line_id):
+        x, o = self.counts[0][line_id], self.counts[1][line_id]
+        if x and o:
+            return 0
+        return self.weights[x] - self.weights[o]
+
+    def play(self, cell):
+        bit = 1 << cell
+        if (self.bits[0] | self.bits[1]) & bit:
+            raise ValueError(f"cell {cell} is taken")
+        p = self.to_move
+        self._undo.append((self.score, self.winner, self.win_line))
+        self.bits[p] |= bit
+        self.hash ^= self.zobrist[p][cell]
+        counts = self.counts[p]
+        for line_id in self.cell_lines[cell]:
+            before = self.line_value(line_id)
+            counts[line_id] += 1
+            self.score += self.line_value(line_id) - before
+            if counts[line_id] == self.k and self.winner is None:
+                self.winner, self.win_line = p, self.lines[line_id]
+        self.moves.append(cell)
+
+    def undo(self):
+        cell = self.moves.pop()
+        p = self.to_move
+        self.bits[p] &= ~(1 << cell)
+        self.hash ^= self.zobrist[p][cell]
+        counts = self.counts[p]
+        for line_id in self.cell_lines[cell]:
+            counts[line_id] -= 1
+        self.score, self.winner, self.win_line = self._undo.pop()
+
+    def legal_moves(self):
+        return bit_cells(~(self.bits[0] | self.bits[1]) & self.full)
+
+    # --- Move generation for the search ---
+    def candidates(self):
+        """Empty cells worth searching: all of them on small boards, else
+        those within `reach` of a stone (the center on an empty board)."""
+        taken = self.bits[0] | self.bits[1]
+        if not taken:
+            return [(self.n // 2) * self.n + self.n // 2]
+        if not self.reach:
+            return self.legal_moves()
+        near = taken
+        for _ in range(self.reach):
+            near |= ((near << 1) & self.not_first_col) | ((near >> 1) & self.not_last_col)
+            near |= (near << self.n) | (near >> self.n)
+        return bit_cells(near & ~taken & self.full)
+
+    def move_value(self, cell):
+        """How much cell adds to open lines, for the side to move and against the other."""
+        p = self.to_move
+        mine, theirs = self.counts[p], self.counts[1 - p]
+        w = self.weights
+        value = 0
+        for line_id in self.cell_lines[cell]:
+            if not theirs[line_id]:
+                value += w[mine[line_id] + 1]
+            if not mine[line_id]:
+                value += w[theirs[line_id] + 1]
+        return value
+
+
+def bit_cells(bits):
+    cells = []
+    while bits:
+        low = bits & -bits
+        cells.append(low.bit_length() - 1)
+        bits ^= low
+    return cells
+
+
+# --- Search ---
+EXACT, LOWER, UPPER = 0, 1, 2
+
+transpositions = {}  # (n, k, hash) -> (depth, score, EXACT/LOWER/UPPER, best cell)
+stats = {"nodes": 0, "depth": 0, "score": 0, "seconds": 0.0}  # for the last search
+cancel = None  # optional shared flag (anything with .value); the search stops once it is set
+
+
+def search(game, budget=1.0, max_depth=None):
+    """Best cell for the side to move within `budget` seconds, or None if the
+    game is over. stats holds the depth reached, nodes and the score."""
+    if game.over():
+        return None
+    if len(transpositions) > MAX_TABLE:
+        transpositions.clear()
+    started = time.perf_counter()
+    deadline = started + budget
+    stats.update(nodes=0, depth=0, score=0)
+    empty = game.n * game.n - len(game.moves)
+    max_depth = min(max_depth or empty, empty)
+
+    # best-first: by what a cell adds to open lines, and from the second
+    # iteration on, the previous iteration's best move ahead of the rest
+    moves = sorted(game.candidates(), key=game.move_value, reverse=True)
+    best = moves[0]
+    try:
+        for depth in range(1, max_depth + 1):
+            score, move = _root(game, moves, depth, deadline)
+            best = move
+            stats.update(depth=depth, score=score)
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN:  # forced win or loss, deeper won't change it
+                break
+    except Timeout:
+        pass  # every play() on the way down was undone by the finally blocks
+    stats["seconds"] = time.perf_counter() - started
+    return best
+
+
+def _root(game, moves, depth, deadline):
+    alpha, beta = -WIN * 2, WIN * 2
+    best_score, best_move = -WIN * 2, moves[0]
+    for cell in moves:
+        game.play(cell)
+        try:
+            score = -_negamax(game, depth - 1, -beta, -alpha, deadline)
+        finally:
+            game.undo()
+        if score > best_score:
+            best_score, best_move = score, cell
+            alpha = max(alpha, score)
+    return best_score, best_move
+
+
+def _negamax(game, depth, alpha, beta, deadline):
+    stats["nodes"] += 1
+    if not stats["nodes"] & 1023 and (time.perf_counter() > deadline
+                                      or (cancel is not None and cancel.value)):
+        raise Timeout
+    if game.winner is not None:
+        return -(WIN + depth)  # the side that just moved won; sooner is worse
+    if game.is_full():
+        return 0
+    if depth == 0:
+        return game.score if game.to_move == 0 else -game.score
+
+    key = (game.n, game.k, game.hash)
+    entry = transpositions.get(key)
+    table_move = None
+    if entry:
+        entry_depth, score, kind, table_move = entry
+        if entry_depth >= depth and (kind == EXACT or (kind == LOWER and score >= beta)
+                                     or (kind == UPPER and score <= alpha)):
+            return score
+
+    moves = sorted(game.candidates(), key=game.move_value, reverse=True)
+    if table_move in moves:
+        moves.remove(table_move)
+        moves.insert(0, table_move)
+
+    alpha_in = alpha
+    best_score, best_move = -WIN * 2, moves[0]
+    for cell in moves:
+        game.play(cell)
+        try:
+            score = -_negamax(game, depth - 1, -beta, -alpha, deadline)
+        finally:
+            game.undo()
+        if score > best_score:
+            best_score, best_move = score, cell
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    kind = UPPER if best_score <= alpha_in else LOWER if best_score >= beta else EXACT
+    transpositions[key] = (depth, best_score, kind, best_move)
+    return best_score
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time one move of the N x N, k-in-a-row search.")
+    parser.add_argument("n", type=int, nargs="?", default=15)
+    parser.add_argument("k", type=int, nargs="?", default=5)
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds per move")
+    parser.add_argument("--moves", type=int, default=4, help="self-play moves to make")
+    args = parser.parse_args(argv)
+
+    game = Game(args.n, args.k)
+    for _ in range(args.moves):
+        cell = search(game, args.budget)
+        if cell is None:
+            break
+        game.play(cell)
+        print(f"{'XO'[len(game.moves) % 2 ^ 1]} plays {divmod(cell, args.n)}: depth {stats['depth']}, "
+              f"{stats['nodes']:,} nodes, score {stats['score']}, {stats['seconds']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Parallel root-split search for tic_nk. Each deepening iteration searches the
+previous best move first, then the other root moves on a process pool whose
+workers share the best root score as alpha. cancel() stops them within about
+a thousand nodes, and drops any search queued with an earlier ticket().
+
+    python tic_parallel.py 15 5 --depth 4 --workers 1,2,4,8    measure scaling
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import tic_nk as nk
+
+NO_BOUND = -2 * nk.WIN
+
+_alpha = None  # shared best root score, set in each worker by _init_worker
+_games = {}    # (n, k) -> Game, reused by every task in a worker
+
+
+def _init_worker(alpha, cancel):
+    global _alpha
+    _alpha = alpha
+    nk.cancel = cancel
+
+
+def _search_root_move(n, k, moves, cell, depth, deadline):
+    """(cell, score or None if stopped, nodes) for one root move.
+
+    deadline is wall-clock time.time(), the one clock all processes share;
+    a task that waited in the queue gets only what is left of the budget.
+    """
+    game = _games.get((n, k))
+    if game is None:
+        game = _games[n, k] = nk.Game(n, k)
+    game.reset()
+    for m in moves:
+        game.play(m)
+    game.play(cell)
+    nk.stats["nodes"] = 0
+    alpha = _alpha.value
+    try:
+        score = -nk._negamax(game, depth - 1, -2 * nk.WIN, -alpha,
+                             time.perf_counter() + (deadline - time.time()))
+    except nk.Timeout:
+        return cell, None, nk.stats["nodes"]
+    if score > alpha:
+        with _alpha.get_lock():
+            if score > _alpha.value:
+                _alpha.value = score
+    return cell, score, nk.stats["nodes"]
+
+
+class ParallelSearch:
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count()
+        self._alpha = multiprocessing.Value("q", NO_BOUND)
+        self._cancel = multiprocessing.Value("b", 0)
+        self._cancels = 0  # bumped by cancel(); see ticket()
+        self._pool = None  # started on first use
+        self._lock = threading.Lock()  # one search at a time
+        self.stats = {}  # for the last search
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                             initargs=(self._alpha, self._cancel))
+        return self._pool
+
+    def ticket(self):
+        """Token for a search about to be queued: search() given it returns
+        None at once if cancel() was called in between."""
+        return self._cancels
+
+    def search(self, n, k, moves, budget=1.0, max_depth=None, ticket=None):
+        """Best cell for the side to move after `moves`, or None if the game
+        is over or the search was cancelled before finishing depth 1."""
+        with self._lock:
+            if ticket is not None and ticket != self._cancels:
+                return None
+            self._cancel.value = 0
+            return self._search(n, k, list(moves), budget, max_depth)
+
+    def _search(self, n, k, moves, budget, max_depth):
+        game = nk.Game(n, k)
+        for m in moves:
+            game.play(m)
+        if game.over():
+            return None
+        started = time.perf_counter()
+        deadline = time.time() + budget
+        empty = n * n - len(moves)
+        max_depth = min(max_depth or empty, empty)
+        order = sorted(game.candidates(), key=game.move_value, reverse=True)
+        pool = self._executor()
+        best = None
+        self.stats = {"depth": 0, "score": 0, "nodes": 0, "workers": self.workers}
+
+        for depth in range(1, max_depth + 1):
+            self._alpha.value = NO_BOUND
+            results = {}
+            # the expected best move first, alone, to set a bound for the rest
+            batches = [order[:1], order[1:]]
+            for batch in batches:
+                futures = [pool.submit(_search_root_move, n, k, moves, cell, depth, deadline)
+                           for cell in batch]
+                while futures:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        cell, score, nodes = future.result()
+                        results[cell] = score
+                        self.stats["nodes"] += nodes
+            if self._cancel.value:
+                return None
+            if any(score is None for score in results.values()):
+                break  # out of time; keep the last finished depth
+            best_score = max(results.values())
+            best = next(cell for cell in order if results[cell] == best_score)
+            self.stats.update(depth=depth, score=best_score)
+            order.remove(best)
+            order.insert(0, best)
+            if abs(best_score) >= nk.WIN or time.time() > deadline:
+                break
+        self.stats["seconds"] = time.perf_counter() - started
+        return best if best is not None else order[0]
+
+    def cancel(self):
+        """Stop the running search and any queued with an earlier ticket();
+        search() then returns None."""
+        self._cancels += 1
+        self._cancel.value = 1
+
+    def shutdown(self):
+        self.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+def opening(n, count):
+    """A fixed, non-trivial position to measure on: `count` moves around the center."""
+    c = n // 2
+    cells = [(c, c), (c - 1, c), (c, c - 1), (c + 1, c + 1), (c - 1, c - 1), (c + 1, c - 1)]
+    return [r * n + col for r, col in cells[:count]]
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Measure how root-split search scales with workers")
+    parser.add_argument("n", type=int, nargs="?", default=15)
+    parser.add_argument("k", type=int, nargs="?", default=5)
+    parser.add_argument("--depth", type=int, default=4, help="fixed search depth")
+    parser.add_argument("--moves", type=int, default=4, help="opening moves played before searching")
+    parser.add_argument("--workers", default=",".join(str(w) for w in (1, 2, 4, os.cpu_count())))
+    args = parser.parse_args(argv)
+
+    moves = opening(args.n, args.moves)
+    game = nk.Game(args.n, args.k)
+    for m in moves:
+        game.play(m)
+    started = time.perf_counter()
+    nk.search(game, budget=float("inf"), max_depth=args.depth)
+    serial = time.perf_counter() - started
+    nk.transpositions.clear()
+    report = {"board": f"{args.n}x{args.n}, {args.k} in a row", "depth": args.depth,
+              "serial": {"seconds": round(serial, 3), "nodes": nk.stats["nodes"]}, "parallel": []}
+
+    for workers in sorted({int(w) for w in args.workers.split(",") if w}):
+        searcher = ParallelSearch(workers)
+        try:
+            searcher._executor().submit(int).result()  # start the processes before timing
+            started = time.perf_counter()
+            move = searcher.search(args.n, args.k, moves, budget=float("inf"), max_depth=args.depth)
+            seconds = time.perf_counter() - started
+        finally:
+            searcher.shutdown()
+        report["parallel"].append({"workers": workers, "seconds": round(seconds, 3),
+                                   "speedup": round(serial / seconds, 2), "nodes": searcher.stats["nodes"],
+                                   "move": divmod(move, args.n)})
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Solved 3 x 3 tic-tac-toe as a lookup table: best_move() reads one byte from
+the memory-mapped tic_table.bin instead of searching, and falls back to
+tic_engine.best_move if the file is missing or not a table.
+
+    python tic_table.py build      write the table
+    python tic_table.py verify     check every entry against the search
+"""
+
+import mmap
+import os
+import sys
+
+import tic_engine as engine
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tic_table.bin")
+MAGIC = b"TTT\x00v1\r\n"
+SIZE = 3 ** 9
+EMPTY = 0xFF
+
+# After the 8-byte magic, one byte per board in base-3 order. Only each
+# position's canonical orientation (the one tic_engine keys its table by) is
+# filled in, with (value + 1) << 4 | best cell, value -1 / 0 / 1 for the side
+# to move; every other byte is EMPTY.
+
+# POW3[bits] is the sum of 3 ** i over the set bits, so a board's index is
+# POW3[x] + 2 * POW3[o]
+POW3 = [sum(3 ** i for i in range(9) if bits >> i & 1) for bits in range(512)]
+
+# where each symmetry sends every cell, and back
+_MOVED = [[a * 3 + b for a, b in (t(*divmod(i, 3)) for i in range(9))] for t in engine._TRANSFORMS]
+_BACK = [[moved.index(i) for i in range(9)] for moved in _MOVED]
+
+_table = None  # (path, mmap) once a table has loaded; a missing file is retried
+stats = {"source": None}  # who answered the last best_move: "table" or "search"
+
+
+def index(board):
+    x, o = board
+    return POW3[x] + 2 * POW3[o]
+
+def orient(board):
+    """(symmetry number, canonical board): the orientation tic_engine keys by."""
+    x, o = board
+    best = None
+    for s, t in enumerate(engine.SYMMETRY_TABLES):
+        key = t[x] << 9 | t[o]
+        if best is None or key < best[0]:
+            best = (key, s, (t[x], t[o]))
+    return best[1], best[2]
+
+def positions():
+    """Every canonical position reachable from the empty board where the
+    game isn't over yet."""
+    seen = set()
+    stack = [engine.EMPTY]
+    while stack:
+        board = stack.pop()
+        canonical = orient(board)[1]
+        if canonical in seen or engine.winner(board) or engine.is_full(board):
+            continue
+        seen.add(canonical)
+        for cell in engine.legal_moves(board):
+            stack.append(engine.play(board, cell))
+    return sorted(seen)
+
+def solve(board):
+    """(best cell, value for the side to move) by live search."""
+    x, o = board
+    mine, theirs = (x, o) if engine.to_move(board) == engine.X else (o, x)
+    move = engine.best_move(board)
+    return move, -engine.negamax(theirs, mine | 1 << move, -2, 2)
+
+
+# --- Build ---
+def build(path=TABLE_PATH):
+    """Solve and write the table; returns how many positions it holds."""
+    data = bytearray([EMPTY]) * SIZE
+    solved = positions()
+    for board in solved:
+        move, value = solve(board)
+        data[index(board)] = (value + 1) << 4 | move
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(data)
+    os.replace(tmp, path)
+    if _table is not None and _table[0] == path:
+        close()  # drop the mapping of the file just replaced
+    return len(solved)
+
+
+# --- Lookup ---
+def _open_table(path):
+    """A new read-only mmap of the table at path, or None if there is no
+    usable file there."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) == len(MAGIC) + SIZE and mapped[:len(MAGIC)] == MAGIC:
+        return mapped
+    mapped.close()
+    return None
+
+def load(path=None):
+    """The shared memory-mapped table (at TABLE_PATH unless given), or None
+    if there is no usable file. Only a table that loaded is kept, so one
+    built later is picked up."""
+    global _table
+    path = path or TABLE_PATH
+    if _table is None or _table[0] != path:
+        mapped = _open_table(path)
+        if mapped is None:
+            return None
+        close()
+        _table = (path, mapped)
+    return _table[1]
+
+def close():
+    global _table
+    if _table is not None:
+        _table[1].close()
+    _table = None
+
+def lookup(board, table=None):
+    """(best cell, value for the side to move) from the table (the shared
+    one unless given), or None if there is no table or no entry (finished
+    games have none)."""
+    if table is None:
+        table = load()
+        if table is None:
+            return None
+    s, canonical = orient(board)
+    entry = table[len(MAGIC) + index(canonical)]
+    if entry == EMPTY:
+        return None
+    return _BACK[s][entry & 0x0F], (entry >> 4) - 1
+
+def best_move(board):
+    """A best cell for the side to move: from the table when there is one,
+    else by live search. None when the game is over."""
+    if engine.winner(board) or engine.is_full(board):
+        return None
+    found = lookup(board)
+    if found is not None:
+        stats["source"] = "table"
+        return found[0]
+    stats["source"] = "search"
+    return engine.best_move(board)
+
+
+# --- Verify ---
+def verify(path=TABLE_PATH):
+    """Check every reachable position's entry against live search; returns
+    a list of problems (empty when the table is right). The shared table
+    load() keeps is left alone."""
+    table = _open_table(path)
+    if table is None:
+        return [f"no usable table at {path}"]
+    try:
+        return _check(table)
+    finally:
+        table.close()
+
+def _check(table):
+    problems = []
+    seen = set()
+    stack = [engine.EMPTY]
+    while stack:
+        board = stack.pop()
+        if board in seen or engine.winner(board) or engine.is_full(board):
+            continue
+        seen.add(board)
+        found = lookup(board, table)
+        if found is None:
+            problems.append((board, "missing"))
+        else:
+            move, value = found
+            _, expected = solve(board)
+            # the stored move must be legal and achieve the position's value
+            if value != expected or move not in engine.legal_moves(board):
+                problems.append((board, found, expected))
+            else:
+                after = engine.play(board, move)
+                x, o = after
+                mover = engine.to_move(board)
+                theirs, mine = (o, x) if mover == engine.X else (x, o)
+                if -engine.negamax(theirs, mine, -2, 2) != expected:
+                    problems.append((board, found, expected))
+        for cell in engine.legal_moves(board):
+            stack.append(engine.play(board, cell))
+    return problems
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build or verify the solved tic-tac-toe table")
+    parser.add_argument("command", choices=("build", "verify"))
+    parser.add_argument("--path", default=TABLE_PATH)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.command == "build":
+        count = build(args.path)
+        print(f"solved {count} positions into {args.path} "
+              f"({len(MAGIC) + SIZE} bytes) in {time.perf_counter() - started:.2f}s")
+        return 0
+    problems = verify(args.path)
+    for problem in problems[:20]:
+        print(problem)
+    print(f"{'table OK' if not problems else f'{len(problems)} bad entries'} "
+          f"in {time.perf_counter() - started:.2f}s")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Background worker for the Tk GUIs: slow calls run on a small thread pool and
+their results come back on the Tk thread through root.after polling. Work
+submitted under a `key` supersedes earlier work with the same key.
+
+    worker = BackgroundWorker()
+    worker.attach(root)
+    worker.submit(db.students.search, "asha", key="students", on_done=show_rows)
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+WORKER_THREADS = 2
+POLL_MS = 30
+
+
+class BackgroundWorker:
+    def __init__(self, threads=WORKER_THREADS):
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="worker")
+        self._finished = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._generation = {}  # key -> generation of the latest submission
+        self._pending = {}     # key -> future of the latest submission
+        self._closed = False
+
+    def submit(self, fn, *args, key=None, on_done=None, on_error=None):
+        """Run fn(*args) on a worker thread.
+
+        on_done(result) or on_error(exception) is called later on the GUI
+        thread by pump(). Returns the Future.
+        """
+        with self._lock:
+            generation = None
+            if key is not None:
+                self._cancel_locked(key)
+                generation = self._generation.get(key, 0)
+            future = self._executor.submit(fn, *args)
+            if key is not None:
+                self._pending[key] = future
+
+        def finished(f):
+            self._finished.put((key, generation, f, on_done, on_error))
+
+        future.add_done_callback(finished)
+        return future
+
+    def cancel(self, key):
+        """Drop any queued or running work submitted under `key`."""
+        with self._lock:
+            self._cancel_locked(key)
+
+    def _cancel_locked(self, key):
+        self._generation[key] = self._generation.get(key, 0) + 1
+        future = self._pending.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def is_pending(self, key):
+        with self._lock:
+            future = self._pending.get(key)
+            return future is not None and not future.done()
+
+    def pump(self):
+        """Deliver finished results; call this on the GUI thread."""
+        while True:
+            try:
+                key, generation, future, on_done, on_error = self._finished.get_nowait()
+            except queue.Empty:
+                return
+            if future.cancelled():
+                continue
+            if key is not None:
+                with self._lock:
+                    if self._generation.get(key) != generation:
+                        continue  # superseded while it was running
+                    if self._pending.get(key) is future:
+                        del self._pending[key]
+            error = future.exception()
+            if error is not None:
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    raise error
+            elif on_done is not None:
+                on_done(future.result())
+
+    def attach(self, root, interval_ms=POLL_MS):
+        """Pump results from root's event loop every `interval_ms`."""
+
+        def tick():
+            if self._closed:
+                return
+            try:
+                self.pump()
+            finally:
+                root.after(interval_ms, tick)
+
+        root.after(interval_ms, tick)
+
+    def shutdown(self):
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)